@@ -0,0 +1,63 @@
+from eth_account import Account
+from web3 import Web3
+from src.pipeline.merkle import leaf_packed, process_proof
+
+
+def bench_keys(count: int) -> list[str]:
+    """Deterministic private keys, so runs are comparable."""
+    return [f"0x{i + 1:064x}" for i in range(count)]
+
+
+class Airdrop:
+    """Merkle tree over (address, amount) with OpenZeppelin sorted-pair hashing."""
+
+    def __init__(self, private_keys: list[str], amount: int = 10**18):
+        self.amounts = {
+            Account.from_key(private_key).address: amount + i
+            for i, private_key in enumerate(private_keys)
+        }
+        self.leaves = {
+            address: leaf_packed(address, amount)
+            for address, amount in self.amounts.items()
+        }
+        self.layers = [sorted(self.leaves.values())]
+        positions = {leaf: i for i, leaf in enumerate(self.layers[0])}
+        self.positions = {
+            address: positions[leaf] for address, leaf in self.leaves.items()
+        }
+
+        while len(self.layers[-1]) > 1:
+            layer = self.layers[-1]
+            self.layers.append(
+                [
+                    (
+                        self.hash_pair(layer[i], layer[i + 1])
+                        if i + 1 < len(layer)
+                        else layer[i]
+                    )
+                    for i in range(0, len(layer), 2)
+                ]
+            )
+
+        self.root = self.layers[-1][0]
+
+    @staticmethod
+    def hash_pair(a: bytes, b: bytes) -> bytes:
+        return Web3.keccak(a + b if a < b else b + a)
+
+    def proof(self, address: str) -> list[str]:
+        index = self.positions[Web3.to_checksum_address(address)]
+        proof = []
+
+        for layer in self.layers[:-1]:
+            sibling = index ^ 1
+
+            if sibling < len(layer):
+                proof.append(Web3.to_hex(layer[sibling]))
+
+            index //= 2
+
+        return proof
+
+    def is_whitelisted(self, address: str, amount: int, proof: list[str]) -> bool:
+        return process_proof(leaf_packed(address, amount), proof) == self.root
@@ -0,0 +1,436 @@
+import json
+import time
+import random
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import rlp
+from eth_abi import decode, encode
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from web3 import Web3
+from eth_abi.packed import encode_packed
+from eth_utils import keccak
+from .airdrop import Airdrop
+
+ZERO_HASH = "0x" + "00" * 32
+XCLAIM_TOPIC = Web3.to_hex(Web3.keccak(text="XClaim(address,uint256)"))
+XDELEGATE_CLAIM_TOPIC = Web3.to_hex(
+    Web3.keccak(text="XDelegateClaim(address,address,uint256)")
+)
+
+
+def selector(signature: str) -> bytes:
+    return Web3.keccak(text=signature)[:4]
+
+
+class RpcError(Exception):
+    def __init__(self, message: str, code: int = -32000):
+        super().__init__(message)
+        self.code = code
+
+    @classmethod
+    def revert(cls, reason: str) -> "RpcError":
+        error = cls(f"execution reverted: {reason}", 3)
+        error.data = Web3.to_hex(
+            selector("Error(string)") + encode(["string"], [reason])
+        )
+        return error
+
+
+class FakeChain:
+    """
+    In-memory BSC stand-in serving the JSON-RPC methods the claimer uses:
+    XterioWhitelist (claim, claimed, merkleRoot, isWhitelisted...) and
+    Multicall3 at their real addresses, a mempool mined every block_time,
+    receipts with XClaim logs, and eth_getLogs over them.
+    """
+
+    def __init__(
+        self,
+        airdrop: Airdrop,
+        whitelist_address: str,
+        multicall_address: str,
+        block_time: float = 1.0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        balance: int = 10**18,
+    ):
+        self.airdrop = airdrop
+        self.whitelist = whitelist_address.lower()
+        self.multicall = multicall_address.lower()
+        self.block_time = block_time
+        self.latency = latency
+        self.error_rate = error_rate
+        self.balance = balance
+        self.block = 1000
+        self.blocks: dict[int, list[str]] = {}
+        self.mempool: list[tuple[str, dict]] = []
+        self.receipts: dict[str, dict] = {}
+        self.logs: list[dict] = []
+        self.nonces: Counter = Counter()
+        self.pending_nonces: Counter = Counter()
+        self.queued: dict[str, dict[int, tuple]] = {}
+        self.claimed: set[str] = set()
+        self.calls: Counter = Counter()
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        self.views = {
+            selector("merkleRoot()"): lambda args: encode(
+                ["bytes32"], [self.airdrop.root]
+            ),
+            selector("claimed(address)"): lambda args: encode(
+                ["bool"], [decode(["address"], args)[0].lower() in self.claimed]
+            ),
+            selector("invalidated(address)"): lambda args: encode(["bool"], [False]),
+            selector("isWhitelisted(address,uint256,bytes32[])"): self.is_whitelisted,
+            selector("isTimeValid()"): lambda args: encode(["bool"], [True]),
+            selector("startTime()"): lambda args: encode(["uint256"], [0]),
+            selector("deadline()"): lambda args: encode(["uint256"], [2**40]),
+        }
+
+    # Contract logic
+
+    def is_whitelisted(self, args: bytes) -> bytes:
+        address, amount, proof = decode(["address", "uint256", "bytes32[]"], args)
+        return encode(
+            ["bool"],
+            [
+                self.airdrop.is_whitelisted(
+                    address, amount, [Web3.to_hex(node) for node in proof]
+                )
+            ],
+        )
+
+    def check_claim(self, sender: str, data: bytes):
+        """(beneficiary, amount, delegator) of a valid claim/delegateClaim, None for other calls."""
+        if data[:4] == selector("claim(uint256,bytes32[])"):
+            amount, proof = decode(["uint256", "bytes32[]"], data[4:])
+            beneficiary, delegator = sender, None
+        elif data[:4] == selector(
+            "delegateClaim(address,uint256,bytes32[],uint256,bytes)"
+        ):
+            beneficiary, amount, proof, deadline, sig = decode(
+                ["address", "uint256", "bytes32[]", "uint256", "bytes"], data[4:]
+            )
+            # The stand-in contract's own digest, written out independently of
+            # the client's delegate_claim_hash so a wrong layout fails here
+            message_hash = keccak(
+                encode_packed(
+                    ["uint256", "address", "address", "uint256", "uint256"],
+                    [
+                        56,
+                        Web3.to_checksum_address(self.whitelist),
+                        beneficiary,
+                        amount,
+                        deadline,
+                    ],
+                )
+            )
+            if deadline < time.time():
+                raise RpcError.revert("signature expired")
+            if Account.recover_message(
+                encode_defunct(primitive=message_hash), signature=sig
+            ) != Web3.to_checksum_address(beneficiary):
+                raise RpcError.revert("invalid signature")
+            delegator = sender
+        else:
+            return
+
+        if beneficiary.lower() in self.claimed:
+            raise RpcError.revert("already claimed")
+        if not self.airdrop.is_whitelisted(
+            Web3.to_checksum_address(beneficiary),
+            amount,
+            [Web3.to_hex(node) for node in proof],
+        ):
+            raise RpcError.revert("invalid proof")
+
+        return beneficiary, amount, delegator
+
+    def call(self, to: str, data: bytes) -> bytes:
+        to = to.lower()
+
+        if to == self.multicall:
+            if data[:4] == selector("getEthBalance(address)"):
+                return encode(["uint256"], [self.balance])
+
+            (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+            results = []
+            for target, _, call_data in calls:
+                try:
+                    results.append((True, self.call(target, call_data)))
+                except RpcError:
+                    results.append((False, b""))
+            return encode(["(bool,bytes)[]"], [results])
+
+        if to == self.whitelist and data[:4] in self.views:
+            return self.views[data[:4]](data[4:])
+
+        raise RpcError("execution reverted")
+
+    # Transactions and blocks
+
+    @staticmethod
+    def decode_raw(raw: bytes) -> dict:
+        sender = Account.recover_transaction(raw)
+        if raw[0] <= 0x7F:
+            fields = rlp.decode(raw[1:])
+            nonce, to, data = fields[1], fields[5], fields[7]
+        else:
+            fields = rlp.decode(raw)
+            nonce, to, data = fields[0], fields[3], fields[5]
+
+        return {
+            "from": sender,
+            "nonce": int.from_bytes(nonce, "big"),
+            "to": Web3.to_hex(to),
+            "data": data,
+        }
+
+    def send_raw(self, raw_hex: str) -> str:
+        raw = Web3.to_bytes(hexstr=raw_hex)
+        tx = self.decode_raw(raw)
+        tx_hash = Web3.to_hex(Web3.keccak(raw))
+
+        with self._lock:
+            expected = self.pending_nonces[tx["from"]]
+            if tx["nonce"] < expected:
+                raise RpcError("nonce too low")
+
+            # Like a real txpool, nonces ahead of the pending one wait in a queue
+            queued = self.queued.setdefault(tx["from"], {})
+            queued[tx["nonce"]] = (tx_hash, tx)
+
+            while expected in queued:
+                self.mempool.append(queued.pop(expected))
+                expected += 1
+            self.pending_nonces[tx["from"]] = expected
+
+        return tx_hash
+
+    def mine(self):
+        with self._lock:
+            self.block += 1
+            mempool, self.mempool = self.mempool, []
+            self.blocks[self.block] = [tx_hash for tx_hash, _ in mempool]
+
+            for index, (tx_hash, tx) in enumerate(mempool):
+                self.nonces[tx["from"]] = tx["nonce"] + 1
+                logs, status = [], 1
+
+                if tx["to"].lower() == self.whitelist:
+                    try:
+                        claim = self.check_claim(tx["from"], tx["data"])
+                    except RpcError:
+                        status = 0
+                    else:
+                        if claim is not None:
+                            self.claimed.add(claim[0].lower())
+                            logs.append(self.claim_log(tx_hash, claim, index))
+
+                self.receipts[tx_hash] = {
+                    "transactionHash": tx_hash,
+                    "status": hex(status),
+                    "blockNumber": hex(self.block),
+                    "blockHash": self.block_hash(self.block),
+                    "transactionIndex": hex(index),
+                    "from": tx["from"],
+                    "to": tx["to"],
+                    "cumulativeGasUsed": hex(55000 * (index + 1)),
+                    "gasUsed": hex(55000),
+                    "logs": logs,
+                    "logsBloom": "0x" + "00" * 256,
+                    "contractAddress": None,
+                    "effectiveGasPrice": hex(10**9),
+                    "type": "0x0",
+                }
+
+    @staticmethod
+    def address_topic(address: str) -> str:
+        return "0x" + "00" * 12 + address[2:].lower()
+
+    def claim_log(self, tx_hash: str, claim: tuple, index: int) -> dict:
+        beneficiary, amount, delegator = claim
+        topics = (
+            [XCLAIM_TOPIC, self.address_topic(beneficiary)]
+            if delegator is None
+            else [
+                XDELEGATE_CLAIM_TOPIC,
+                self.address_topic(delegator),
+                self.address_topic(beneficiary),
+            ]
+        )
+        log = {
+            "address": Web3.to_checksum_address(self.whitelist),
+            "topics": topics,
+            "data": Web3.to_hex(encode(["uint256"], [amount])),
+            "blockNumber": hex(self.block),
+            "blockHash": self.block_hash(self.block),
+            "transactionHash": tx_hash,
+            "transactionIndex": hex(index),
+            "logIndex": hex(len(self.logs)),
+            "removed": False,
+        }
+        self.logs.append(log)
+        return log
+
+    @staticmethod
+    def block_hash(number: int) -> str:
+        return Web3.to_hex(Web3.keccak(number.to_bytes(8, "big")))
+
+    def get_block(self, number: int) -> dict:
+        return {
+            "number": hex(number),
+            "hash": self.block_hash(number),
+            "parentHash": self.block_hash(number - 1),
+            "transactions": self.blocks.get(number, []),
+            "timestamp": hex(int(time.time())),
+            "gasLimit": hex(140_000_000),
+            "gasUsed": hex(55000 * len(self.blocks.get(number, []))),
+            "miner": "0x" + "00" * 20,
+            "baseFeePerGas": "0x0",
+            "difficulty": "0x2",
+            "extraData": "0x",
+            "logsBloom": "0x" + "00" * 256,
+            "nonce": "0x" + "00" * 8,
+            "receiptsRoot": ZERO_HASH,
+            "sha3Uncles": ZERO_HASH,
+            "size": "0x1",
+            "stateRoot": ZERO_HASH,
+            "transactionsRoot": ZERO_HASH,
+            "totalDifficulty": "0x0",
+            "mixHash": ZERO_HASH,
+            "uncles": [],
+        }
+
+    def block_number(self, tag) -> int:
+        if tag in ("latest", "pending", "safe", "finalized", None):
+            return self.block
+        if tag == "earliest":
+            return 0
+        return int(tag, 16)
+
+    # JSON-RPC
+
+    def handle(self, request: dict) -> dict:
+        method, params = request["method"], request.get("params") or []
+        with self._lock:
+            self.calls[method] += 1
+
+        try:
+            result = self.dispatch(method, params)
+        except RpcError as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {
+                    "code": e.code,
+                    "message": str(e),
+                    **({"data": e.data} if hasattr(e, "data") else {}),
+                },
+            }
+
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def dispatch(self, method: str, params: list):
+        if method == "eth_chainId":
+            return hex(56)
+        if method == "eth_blockNumber":
+            return hex(self.block)
+        if method == "eth_gasPrice":
+            return hex(10**9)
+        if method == "eth_getBalance":
+            return hex(self.balance)
+        if method == "eth_getCode":
+            return (
+                "0x6080"
+                if params[0].lower() in (self.whitelist, self.multicall)
+                else "0x"
+            )
+        if method == "eth_getTransactionCount":
+            counts = self.pending_nonces if params[1] == "pending" else self.nonces
+            return hex(counts[Web3.to_checksum_address(params[0])])
+        if method == "eth_getBlockByNumber":
+            return self.get_block(self.block_number(params[0]))
+        if method == "eth_getTransactionReceipt":
+            return self.receipts.get(params[0])
+        if method == "eth_sendRawTransaction":
+            return self.send_raw(params[0])
+        if method == "eth_call":
+            tx = params[0]
+            data = Web3.to_bytes(hexstr=tx.get("data") or tx.get("input"))
+            if tx.get("from") and tx["to"].lower() == self.whitelist:
+                if self.check_claim(tx["from"], data) is not None:
+                    return "0x"
+            return Web3.to_hex(self.call(tx["to"], data))
+        if method == "eth_estimateGas":
+            tx = params[0]
+            data = Web3.to_bytes(hexstr=tx.get("data") or tx.get("input") or "0x")
+            if tx.get("to", "").lower() == self.whitelist:
+                self.check_claim(tx["from"], data)
+            return hex(60000 + 600 * (len(data) // 32))
+        if method == "eth_feeHistory":
+            count = int(params[0], 16) if isinstance(params[0], str) else params[0]
+            return {
+                "oldestBlock": hex(self.block - count + 1),
+                "baseFeePerGas": ["0x0"] * (count + 1),
+                "gasUsedRatio": [0.5] * count,
+                "reward": [[hex(10**9)] * len(params[2])] * count,
+            }
+        if method == "eth_getLogs":
+            query = params[0]
+            start = self.block_number(query.get("fromBlock"))
+            end = self.block_number(query.get("toBlock"))
+            return [
+                log for log in self.logs if start <= int(log["blockNumber"], 16) <= end
+            ]
+
+        raise RpcError(f"method {method} not supported", -32601)
+
+    def start(self) -> str:
+        chain = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with chain._lock:
+                    chain.requests += 1
+
+                if chain.latency:
+                    time.sleep(chain.latency)
+
+                if random.random() < chain.error_rate:
+                    self.send_response(503)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                if isinstance(body, list):
+                    response = [chain.handle(request) for request in body]
+                else:
+                    response = chain.handle(body)
+
+                data = json.dumps(response).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        threading.Thread(target=self._mine_forever, daemon=True).start()
+
+        return f"http://127.0.0.1:{server.server_port}"
+
+    def _mine_forever(self):
+        while True:
+            time.sleep(self.block_time)
+            self.mine()
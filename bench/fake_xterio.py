@@ -0,0 +1,134 @@
+import re
+import json
+import time
+import random
+import secrets
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from web3 import Web3
+from .airdrop import Airdrop
+
+
+class FakeXterio:
+    """
+    Stand-in for api.xter.io: the login message, the signed wallet login and
+    the claim query, with configurable latency and a share of 429/5xx answers.
+    Logins are checked against the signature like the real API does.
+    """
+
+    def __init__(
+        self,
+        airdrop: Airdrop,
+        airdrop_id: str,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+    ):
+        self.airdrop = airdrop
+        self.airdrop_id = airdrop_id
+        self.latency = latency
+        self.error_rate = error_rate
+        self.messages: dict[str, str] = {}
+        self.tokens: dict[str, str] = {}
+        self.calls: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def route(self, method: str, path: str, headers, body: dict | None):
+        """Returns (status, payload) for a request."""
+        path = path.split("?")[0]
+
+        if method == "GET" and path.startswith("/account/v1/login/wallet/"):
+            address = path.rsplit("/", 1)[1].lower()
+            message = f"Welcome to Xterio!\n\nNonce: {secrets.token_hex(8)}"
+            with self._lock:
+                self.messages[address] = message
+            return 200, {"err_code": 0, "data": {"message": message}}
+
+        if method == "POST" and path == "/account/v1/login/wallet":
+            address = body["address"].lower()
+            message = self.messages.get(address)
+            if message is None:
+                return 400, {"err_code": 1, "err_msg": "no login message"}
+
+            signer = Account.recover_message(
+                encode_defunct(text=message), signature=body["sign"]
+            )
+            if signer.lower() != address:
+                return 401, {"err_code": 1, "err_msg": "bad signature"}
+
+            token = secrets.token_hex(16)
+            with self._lock:
+                self.tokens[token] = address
+            return 200, {"err_code": 0, "data": {"id_token": token}}
+
+        if (
+            method == "GET"
+            and path == f"/airdrop/v1/user/query/claim/{self.airdrop_id}"
+        ):
+            token = headers.get("Authorization", "").removeprefix("Bearer ")
+            address = self.tokens.get(token)
+            if address is None:
+                return 401, {"err_code": 1, "err_msg": "unauthorized"}
+
+            address = Web3.to_checksum_address(address)
+            if address not in self.airdrop.amounts:
+                return 200, {"err_code": 0, "data": []}
+
+            return 200, {
+                "err_code": 0,
+                "data": [
+                    {
+                        "amount": str(self.airdrop.amounts[address]),
+                        "address_build": {"merkle_proofs": self.airdrop.proof(address)},
+                    }
+                ],
+            }
+
+        return 404, {"err_code": 1, "err_msg": "not found"}
+
+    def start(self) -> str:
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def handle_request(self, method: str):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                route = re.sub(r"0x[0-9a-fA-F]{40}", "{address}", self.path)
+                route = route.split("?")[0].replace(api.airdrop_id, "{airdrop_id}")
+
+                with api._lock:
+                    api.calls[f"{method} {route}"] += 1
+
+                if api.latency:
+                    time.sleep(api.latency)
+
+                if random.random() < api.error_rate:
+                    status, payload = random.choice([429, 502, 503]), {"err_code": 1}
+                else:
+                    status, payload = api.route(method, self.path, self.headers, body)
+
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self.handle_request("GET")
+
+            def do_POST(self):
+                self.handle_request("POST")
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        # "localhost" keeps the API on its own rate-limit bucket, apart from the RPC stub
+        return f"http://localhost:{server.server_port}"
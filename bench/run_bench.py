@@ -0,0 +1,223 @@
+"""
+Throughput benchmark of the claim flow against local stand-ins for
+api.xter.io and a BSC node, no real BNB or production endpoint involved.
+
+    python bench/run_bench.py --wallets 200 --concurrency 32
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import functools
+import threading
+import statistics
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from loguru import logger
+
+import main
+from runner import Runner
+from src.pipeline.relayer import Relayer
+from src.api.xterio_api import XterioAPI
+from src.models.network import Network
+from src.clients.multicall import MULTICALL_DATA
+from src.utils.wallet_source import WalletSource
+from src.common.constants import AIRDROP_ID, HOST_RATE_LIMITS
+from bench.airdrop import Airdrop, bench_keys
+from bench.fake_chain import FakeChain
+from bench.fake_xterio import FakeXterio
+
+
+class StageTimer:
+    """Wall-clock latency of Runner methods, one sample per call."""
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def wrap(self, cls, name: str, stage: str):
+        original = getattr(cls, name)
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.samples[stage].append(time.perf_counter() - start)
+
+        setattr(cls, name, timed)
+
+    def summary(self) -> dict[str, dict]:
+        return {
+            stage: {
+                "calls": len(samples),
+                "p50": round(statistics.median(samples), 4),
+                "p95": round(percentile(samples, 0.95), 4),
+                "max": round(max(samples), 4),
+            }
+            for stage, samples in self.samples.items()
+            if samples
+        }
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def per_wallet(counter, wallets: int) -> dict[str, float]:
+    return {key: round(count / wallets, 2) for key, count in sorted(counter.items())}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Claim flow benchmark")
+    parser.add_argument("--wallets", type=int, default=100)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Async workers like main.py --concurrency, 0 runs the sequential main()",
+    )
+    parser.add_argument("--no-preflight", action="store_true")
+    parser.add_argument("--no-simulation", action="store_true")
+    parser.add_argument(
+        "--relayer",
+        action="store_true",
+        help="Claim through delegateClaim from one hot wallet like main.py --relayer",
+    )
+    parser.add_argument("--api-latency", type=float, default=0.05)
+    parser.add_argument("--api-error-rate", type=float, default=0.0)
+    parser.add_argument("--rpc-latency", type=float, default=0.01)
+    parser.add_argument("--rpc-error-rate", type=float, default=0.0)
+    parser.add_argument("--block-time", type=float, default=1.0)
+    parser.add_argument(
+        "--api-rate",
+        type=float,
+        default=HOST_RATE_LIMITS.get("api.xter.io"),
+        help="Requests per second allowed to the fake API, production value by default",
+    )
+    parser.add_argument("--json", help="Also write the report to this file")
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args()
+
+
+def run(args) -> dict:
+    private_keys = bench_keys(args.wallets)
+    airdrop = Airdrop(private_keys)
+
+    chain = FakeChain(
+        airdrop,
+        main.CONTRACT_DATA["address"],
+        MULTICALL_DATA["address"],
+        block_time=args.block_time,
+        latency=args.rpc_latency,
+        error_rate=args.rpc_error_rate,
+    )
+    api = FakeXterio(
+        airdrop, AIRDROP_ID, latency=args.api_latency, error_rate=args.api_error_rate
+    )
+
+    network = Network("Bench", 56, [chain.start()], "http://bench", True, "BNB")
+    XterioAPI.base_url = api.start()
+    HOST_RATE_LIMITS["localhost"] = args.api_rate
+
+    keys_path = os.path.join(tempfile.mkdtemp(prefix="xterio-bench-"), "keys.txt")
+    with open(keys_path, "w") as f:
+        f.write("\n".join(private_keys))
+
+    # The relayer key sits right after the wallets' keys, outside the airdrop
+    main.RELAYER_KEY_PATH = os.path.join(os.path.dirname(keys_path), "relayer.txt")
+    with open(main.RELAYER_KEY_PATH, "w") as f:
+        f.write(bench_keys(args.wallets + 1)[-1])
+
+    main.WALLETS = WalletSource(keys_path)
+    main.PROXIES = []
+    main.Binance = network
+
+    timer = StageTimer()
+    timer.wrap(Runner, "get_claim_data", "claim_data")
+    timer.wrap(Runner, "claim", "claim")
+    timer.wrap(Relayer, "relay", "relay")
+    timer.wrap(main, "preflight", "preflight")
+    timer.wrap(main, "create_runner", "create_runner")
+
+    # Reports land in the scratch dir instead of the repo
+    os.chdir(os.path.dirname(keys_path))
+
+    main.setup_claim_checks(use_cache=False)
+
+    start = time.perf_counter()
+    if args.relayer:
+        main.relay_claims(
+            args.concurrency, not args.no_preflight, not args.no_simulation
+        )
+    elif args.concurrency > 0:
+        asyncio.run(
+            main.main_async(
+                args.concurrency, not args.no_preflight, not args.no_simulation
+            )
+        )
+    else:
+        main.main(not args.no_preflight, not args.no_simulation)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "wallets": args.wallets,
+        "concurrency": args.concurrency,
+        "claimed": len(chain.claimed),
+        "elapsed": round(elapsed, 2),
+        "wallets_per_min": round(len(chain.claimed) / elapsed * 60, 1),
+        "stages": timer.summary(),
+        "rpc_requests_per_wallet": round(chain.requests / args.wallets, 2),
+        "rpc_calls_per_wallet": per_wallet(chain.calls, args.wallets),
+        "http_calls_per_wallet": per_wallet(api.calls, args.wallets),
+    }
+
+
+def print_report(report: dict):
+    print(
+        f"\n{report['claimed']}/{report['wallets']} claimed in {report['elapsed']}s "
+        f"(concurrency {report['concurrency']}): {report['wallets_per_min']} wallets/min\n"
+    )
+
+    print(f"{'stage':<16}{'calls':>8}{'p50 s':>10}{'p95 s':>10}{'max s':>10}")
+    for stage, stats in report["stages"].items():
+        print(
+            f"{stage:<16}{stats['calls']:>8}{stats['p50']:>10}{stats['p95']:>10}{stats['max']:>10}"
+        )
+
+    print(
+        f"\nRPC HTTP requests per wallet: {report['rpc_requests_per_wallet']} "
+        f"(JSON-RPC calls, batches unrolled):"
+    )
+    for method, count in report["rpc_calls_per_wallet"].items():
+        print(f"  {method:<32}{count:>8}")
+
+    print("\nXterio API calls per wallet:")
+    for route, count in report["http_calls_per_wallet"].items():
+        print(f"  {route:<48}{count:>8}")
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if not args.verbose:
+        logger.remove()
+        logger.add(sys.stderr, level="WARNING")
+
+    report = run(args)
+    print_report(report)
+
+    if args.json:
+        with open(os.path.join(ROOT, args.json), "w") as f:
+            json.dump(report, f, indent=2)
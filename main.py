@@ -1,64 +1,1009 @@
 import time
-import random
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 from fake_useragent import UserAgent
-from itertools import cycle
+from web3 import Web3
 from runner import Runner
 from src.utils.helpers import read_json, read_txt
+from src.utils.concurrency import KeyedSemaphore
+from src.utils.retry import ErrorClass, classify, retry_budget
+from src.utils.rate_limiter import rate_limiter
+from src.utils.metrics import metrics
+from src.utils.wallet_source import WalletSource, SignerWalletSource, parse_shard
+from src.pipeline.preflight import run_preflight
+from src.pipeline.simulation import run_simulation
+from src.pipeline.relayer import Relayer
+from src.pipeline.bundle import (
+    bundle_gas_price,
+    save_bundle,
+    load_bundle,
+    wait_for_window,
+    broadcast_bundle,
+)
+from src.clients.evm_client import EvmClient, get_shared_w3
+from src.clients.registry import ClientRegistry
+from src.clients.receipt_tracker import ReceiptTracker
+from src.clients.broadcaster import RaceBroadcaster
+from src.clients.signer import SigningService
+from src.clients.proxy_pool import ProxyPool
+from src.pipeline.merkle import MerkleVerifier
+from src.pipeline.claim_indexer import ClaimIndexer
+from src.pipeline.shard_report import (
+    FailedWallets,
+    save_shard_report,
+    merge_shard_reports,
+)
+from src.storage.claim_cache import ClaimCache
+from src.storage.claim_index import ClaimIndex
+from src.storage.run_journal import RunJournal, Stage
 from src.models.network import Binance
+from src.common.constants import (
+    PROXY_MAX_IN_FLIGHT,
+    RPC_MAX_IN_FLIGHT,
+    BUNDLE_PATH,
+    AIRDROP_ID,
+    CLAIM_CACHE_PATH,
+    CLAIM_INDEX_PATH,
+    RUN_JOURNAL_PATH,
+    SIGNER_BATCH_SIZE,
+    WALLET_CHUNK_SIZE,
+    SIMULATION_MAX_ROUNDS,
+    SIMULATION_RETRY_DELAY,
+    RELAYER_KEY_PATH,
+    TX_RECEIPT_TIMEOUT,
+)
 
-PRIVATE_KEYS = read_txt("data/private_keys.txt")
+WALLETS = WalletSource("data/private_keys.txt")
 PROXIES = read_txt("data/proxies.txt")
 CONTRACT_DATA = read_json("contracts/XterioWhitelist.json")
-PROXY_CYCLE = cycle(PROXIES)
 
 
-def main():
-    wallets_amt = len(PRIVATE_KEYS)
-    proxies_amt = len(PROXIES)
+def create_runner(account_name, private_key, proxy):
+    runner = Runner(
+        account_name,
+        private_key,
+        Binance,
+        UserAgent().chrome,
+        proxy,
+    )
+
+    contract = runner.get_contract(
+        contract_addr=CONTRACT_DATA["address"], abi=CONTRACT_DATA["abi"]
+    )
 
-    logger.debug(f"Loaded wallets: {wallets_amt}, proxies: {proxies_amt}")
+    return runner, contract
+
+
+def proxy_for(private_key):
+    if ProxyPool.active is None:
+        return None
+    return ProxyPool.active.bind(ClientRegistry.address(private_key))
+
+
+def release_proxies(wallets):
+    """Drops the sticky proxy bindings of a chunk that is done."""
+    if ProxyPool.active is not None:
+        ProxyPool.active.release(
+            ClientRegistry.address(private_key) for _, private_key in wallets
+        )
+
+
+def load_proxy_pool(check: bool = True):
+    if not PROXIES:
+        return
+
+    ProxyPool.active = ProxyPool(PROXIES)
+
+    if check:
+        ProxyPool.active.check_all()
+
+
+def get_reader():
+    w3 = get_shared_w3(Binance, ProxyPool.active.select() if ProxyPool.active else None)
+    contract = w3.eth.contract(
+        address=Web3.to_checksum_address(CONTRACT_DATA["address"]),
+        abi=CONTRACT_DATA["abi"],
+    )
+    return w3, contract
+
+
+def setup_claim_checks(use_cache: bool = True):
+    _, contract = get_reader()
+
+    try:
+        merkle_root = Web3.to_hex(contract.functions.merkleRoot().call())
+    except Exception as e:
+        logger.warning(
+            f"Couldn't read merkleRoot, proof checks and cache disabled: {str(e)}"
+        )
+        return
+
+    Runner.merkle_verifier = MerkleVerifier(contract, merkle_root)
+
+    if not use_cache:
+        return
+
+    try:
+        Runner.claim_cache = ClaimCache(CLAIM_CACHE_PATH, AIRDROP_ID, merkle_root)
+    except Exception as e:
+        logger.warning(f"Claim cache disabled: {str(e)}")
+        return
+
+    logger.debug(f"Claim cache loaded with {len(Runner.claim_cache)} entries")
+
+
+def open_journal(resume: bool = False):
+    try:
+        Runner.journal = RunJournal(RUN_JOURNAL_PATH, resume)
+    except Exception as e:
+        logger.warning(f"Run journal disabled: {str(e)}")
+
+
+def record_failure(private_key, error: str | None = None):
+    metrics.inc("wallets_failed")
+
+    if Runner.journal is not None:
+        Runner.journal.record(
+            ClientRegistry.address(private_key), Stage.FAILED, error=error
+        )
+
+
+def check_receipt(private_key, receipt, failed_wallets) -> bool:
+    """Fails the wallet when its claim never landed or reverted, like sync mode does."""
+    if receipt is not None and receipt["status"] == 1:
+        return True
+
+    failed_wallets.append(private_key)
+    record_failure(private_key, "reverted" if receipt is not None else "no receipt")
+    return False
 
-    failed_wallets = []
 
-    for account_name, private_key in enumerate(PRIVATE_KEYS, start=1):
+def settle_journaled(
+    w3, in_flight: dict[str, tuple[str, str | None]]
+) -> tuple[dict[str, dict | None], set[str]]:
+    """
+    Receipts of the claims a previous run signed, by address. The ones not
+    mined yet are re-broadcast from the journaled raw transaction, never
+    signed again with a new nonce, and waited on. Also returns the addresses
+    whose transaction is still pending after that: claiming for them again
+    could land twice.
+    """
+
+    def receipt_of(tx_hash):
+        try:
+            return w3.eth.get_transaction_receipt(tx_hash)
+        except Exception:
+            return None
+
+    with ThreadPoolExecutor(max_workers=RPC_MAX_IN_FLIGHT) as executor:
+        receipts = dict(
+            zip(
+                in_flight,
+                executor.map(
+                    receipt_of, [tx_hash for tx_hash, _ in in_flight.values()]
+                ),
+            )
+        )
+
+    tracker = ReceiptTracker.for_network(Binance, lambda: w3)
+    waiting = {}
+
+    for address, (tx_hash, raw_tx) in in_flight.items():
+        if receipts[address] is not None or raw_tx is None:
+            continue
+
         try:
-            runner = Runner(
-                account_name,
-                private_key,
-                Binance,
-                UserAgent().chrome,
-                next(PROXY_CYCLE),
+            w3.eth.send_raw_transaction(raw_tx)
+        except Exception as e:
+            if classify(e) != ErrorClass.ALREADY_KNOWN:
+                # Nonce too low: it just got mined, or another transaction took the nonce
+                logger.debug(
+                    f"{address} | Journaled claim {tx_hash} not re-sent: {str(e)}"
+                )
+                receipts[address] = receipt_of(tx_hash)
+                continue
+
+        waiting[address] = tracker.track(
+            tx_hash, timeout=TX_RECEIPT_TIMEOUT, lookup=True
+        )
+
+    if waiting:
+        logger.info(f"Run journal - waiting on {len(waiting)} re-broadcast claims...")
+
+    for address, future in waiting.items():
+        receipts[address] = future.result()
+
+    pending = {address for address in waiting if receipts[address] is None}
+    return receipts, pending
+
+
+def journal_wallets(wallets):
+    """
+    Adds the run's wallets to the journal and drops the ones already confirmed
+    or whose journaled claim is still pending.
+    """
+    journal = Runner.journal
+    if journal is None:
+        return wallets
+
+    by_address = {
+        ClientRegistry.address(private_key).lower(): (account_name, private_key)
+        for account_name, private_key in wallets
+    }
+    journal.start(
+        [(account_name, address) for address, (account_name, _) in by_address.items()]
+    )
+    states = journal.states(list(by_address))
+
+    in_flight = {
+        address: (tx_hash, raw_tx)
+        for address, (stage, tx_hash, raw_tx) in states.items()
+        if stage in (Stage.SIGNED, Stage.BROADCAST) and tx_hash
+    }
+    pending = set()
+
+    if in_flight:
+        w3, _ = get_reader()
+        receipts, pending = settle_journaled(w3, in_flight)
+
+        for address, receipt in receipts.items():
+            if receipt is None:
+                continue
+
+            stage = Stage.CONFIRMED if receipt["status"] == 1 else Stage.FAILED
+            journal.record(
+                address, stage, error=None if receipt["status"] else "reverted"
+            )
+            states[address] = (stage, *states[address][1:])
+
+    remaining = [
+        wallet
+        for address, wallet in by_address.items()
+        if states[address][0] != Stage.CONFIRMED and address not in pending
+    ]
+
+    if pending:
+        logger.warning(
+            f"Run journal - {len(pending)} journaled claims still pending, left for the next resume"
+        )
+
+    if len(remaining) < len(wallets):
+        logger.info(
+            f"Run journal - {len(wallets) - len(remaining) - len(pending)} wallets already confirmed, {len(remaining)} left"
+        )
+
+    return remaining
+
+
+def preflight(wallets, failed_wallets, need_balance: bool = True):
+    w3, contract = get_reader()
+
+    try:
+        to_claim, unfunded, _ = run_preflight(w3, contract, wallets, need_balance)
+    except Exception as e:
+        logger.warning(f"Preflight failed, processing every wallet: {str(e)}")
+        return wallets
+
+    for _, private_key in unfunded:
+        failed_wallets.append(private_key)
+        record_failure(private_key, "unfunded")
+
+    return to_claim
+
+
+def verify_proofs(claims, failed_wallets):
+    """
+    Checks the proofs of a chunk's (runner, contract, amount, proofs) claims
+    against the on-chain merkleRoot in one go, before anything is simulated
+    or signed. Mismatches fail, claims that couldn't be checked go on.
+    Only verified claim data is cached, mismatching entries are evicted.
+    """
+    if Runner.merkle_verifier is None or not claims:
+        return claims
+
+    try:
+        valid = Runner.merkle_verifier.verify_many(
+            [(runner.address, amount, proofs) for runner, _, amount, proofs in claims]
+        )
+    except Exception as e:
+        logger.warning(f"Proof check failed, keeping every claim: {str(e)}")
+        return claims
+
+    verified = []
+
+    for claim, is_valid in zip(claims, valid):
+        runner, _, amount, proofs = claim
+
+        if Runner.claim_cache is not None:
+            if is_valid:
+                Runner.claim_cache.put(runner.address, amount, proofs)
+            elif is_valid is False:
+                Runner.claim_cache.evict(runner.address)
+
+        if is_valid is False:
+            logger.warning(
+                f"{runner.account_name} | {runner.address} | Proof doesn't match the on-chain merkle root, skipping..."
             )
+            failed_wallets.append(runner.private_key)
+            record_failure(runner.private_key, "proof doesn't match merkle root")
+            continue
 
-            contract = runner.get_contract(
-                contract_addr=CONTRACT_DATA["address"], abi=CONTRACT_DATA["abi"]
+        if is_valid is None:
+            logger.warning(
+                f"{runner.account_name} | {runner.address} | Couldn't check the proof on-chain, keeping the claim"
             )
 
-            amount, merkle_proofs = runner.get_claim_data()
-            res = runner.claim(contract, amount, merkle_proofs)
+        verified.append(claim)
+
+    return verified
 
-            if not res:
-                failed_wallets.append(runner.private_key)
 
+def simulate(claims, failed_wallets, calls_for=None, fallback: bool = True):
+    """
+    Keeps the (runner, contract, amount, proofs) claims whose eth_call goes
+    through. Reverting ones fail with their reason, retry-later ones are
+    simulated again, up to SIMULATION_MAX_ROUNDS rounds. calls_for(claims)
+    gives the (from, calldata) to simulate instead of each wallet's claim().
+    Without fallback, a simulation that can't run fails the claims instead of
+    letting them all through.
+    """
+    w3, contract = get_reader()
+    to_send = []
+
+    for attempt in range(SIMULATION_MAX_ROUNDS):
+        if attempt:
+            time.sleep(SIMULATION_RETRY_DELAY)
+
+        try:
+            sendable, skipped, retry_later = run_simulation(
+                w3, contract, claims, calls_for(claims) if calls_for else None
+            )
         except Exception as e:
-            logger.warning(f"{account_name} | Error: {str(e)}")
-        finally:
-            time.sleep(random.randint(5, 10))
+            if fallback:
+                logger.warning(f"Simulation failed, sending every claim: {str(e)}")
+                return to_send + claims
+
+            logger.warning(f"Simulation failed, retrying: {str(e)}")
+            retry_later = [(claim, str(e)) for claim in claims]
+            continue
+
+        to_send.extend(sendable)
+
+        for (runner, *_), reason in skipped:
+            failed_wallets.append(runner.private_key)
+            record_failure(runner.private_key, reason)
 
+        claims = [claim for claim, _ in retry_later]
+        if not claims:
+            return to_send
+
+    for (runner, *_), reason in retry_later:
+        logger.warning(
+            f"{runner.account_name} | {runner.address} | Simulation still failing after {SIMULATION_MAX_ROUNDS} rounds: {reason}"
+        )
+        failed_wallets.append(runner.private_key)
+        record_failure(runner.private_key, reason)
+
+    return to_send
+
+
+def open_failed_wallets() -> FailedWallets:
+    return FailedWallets(f"failed_wallets{WALLETS.suffix}.txt")
+
+
+def write_report(failed_wallets: FailedWallets, wallets_amt):
+    failed_wallets.close()
     failed_wallets_amt = len(failed_wallets)
 
-    if failed_wallets_amt > 0:
-        with open("failed_wallets.txt", "w") as f:
-            for wallet in failed_wallets:
-                f.write(wallet + "\n")
+    if EvmClient.signer is not None and failed_wallets_amt:
+        EvmClient.signer.export_keys(failed_wallets.path)
+
+    if WALLETS.shard is not None:
+        save_shard_report(
+            f"run_report{WALLETS.suffix}.json",
+            WALLETS.shard,
+            wallets_amt,
+            failed_wallets,
+        )
+
+    if EvmClient.broadcast_race:
+        RaceBroadcaster.log_summary()
+
+    logger.debug(f"Retry stats: {retry_budget.snapshot()}")
+    logger.debug(f"Tuned rate limits: {rate_limiter.snapshot()}")
+
+    metrics.log_summary()
+    metrics.write(f"metrics{WALLETS.suffix}.prom")
 
     logger.success(
         f"Run complete! Success: {wallets_amt - failed_wallets_amt}/{wallets_amt}, Failed: {failed_wallets_amt}/{wallets_amt}"
     )
 
+
+def log_start(**extra):
+    shard = f" shard {WALLETS.shard[0]}/{WALLETS.shard[1]}" if WALLETS.shard else ""
+    details = "".join(f", {key}: {value}" for key, value in extra.items())
+
+    logger.debug(
+        f"Streaming wallets from {WALLETS.path}{shard}, proxies: {len(PROXIES)}{details}"
+    )
+
+
+def main(use_preflight: bool = True, use_simulation: bool = True):
+    log_start()
+
+    failed_wallets = open_failed_wallets()
+
+    for chunk in WALLETS.chunks(WALLET_CHUNK_SIZE):
+        wallets = journal_wallets(chunk)
+
+        if use_preflight:
+            wallets = preflight(wallets, failed_wallets)
+
+        claims = []
+        for account_name, private_key in wallets:
+            try:
+                claims.append(
+                    fetch_claim_data(account_name, private_key, proxy_for(private_key))
+                )
+            except Exception as e:
+                logger.warning(f"{account_name} | Error: {str(e)}")
+                record_failure(private_key, str(e))
+
+        claims = verify_proofs(claims, failed_wallets)
+
+        if use_simulation:
+            claims = simulate(claims, failed_wallets)
+
+        for runner, contract, amount, merkle_proofs in claims:
+            try:
+                res = runner.claim(contract, amount, merkle_proofs)
+
+                if not res:
+                    failed_wallets.append(runner.private_key)
+                    record_failure(runner.private_key)
+
+            except Exception as e:
+                logger.warning(f"{runner.account_name} | Error: {str(e)}")
+                record_failure(runner.private_key, str(e))
+
+        release_proxies(chunk)
+
+    write_report(failed_wallets, WALLETS.yielded)
+
     return
 
 
+async def fetch_wallet(account_name, private_key, proxy, executor, proxy_limits):
+    loop = asyncio.get_running_loop()
+
+    async with proxy_limits(proxy):
+        return await loop.run_in_executor(
+            executor, fetch_claim_data, account_name, private_key, proxy
+        )
+
+
+async def claim_wallet(claim, executor, proxy_limits, rpc_limits):
+    loop = asyncio.get_running_loop()
+    runner, contract, amount, merkle_proofs = claim
+
+    async with proxy_limits(runner.proxy), rpc_limits(runner.rpc):
+        return await loop.run_in_executor(
+            executor, runner.claim, contract, amount, merkle_proofs, False
+        )
+
+
+async def main_async(
+    concurrency: int, use_preflight: bool = True, use_simulation: bool = True
+):
+    log_start(concurrency=concurrency)
+
+    failed_wallets = open_failed_wallets()
+    pending_receipts = []
+
+    pool = asyncio.Semaphore(concurrency)
+    proxy_limits = KeyedSemaphore(PROXY_MAX_IN_FLIGHT)
+    rpc_limits = KeyedSemaphore(RPC_MAX_IN_FLIGHT)
+
+    async def fetcher(account_name, private_key):
+        async with pool:
+            try:
+                return await fetch_wallet(
+                    account_name,
+                    private_key,
+                    proxy_for(private_key),
+                    executor,
+                    proxy_limits,
+                )
+            except Exception as e:
+                logger.warning(f"{account_name} | Error: {str(e)}")
+                record_failure(private_key, str(e))
+
+    async def worker(claim):
+        runner = claim[0]
+
+        async with pool:
+            try:
+                res = await claim_wallet(claim, executor, proxy_limits, rpc_limits)
+
+                if not res:
+                    failed_wallets.append(runner.private_key)
+                    record_failure(runner.private_key)
+                else:
+                    res[1].add_done_callback(
+                        lambda f: check_receipt(
+                            runner.private_key, f.result(), failed_wallets
+                        )
+                    )
+                    pending_receipts.append(asyncio.wrap_future(res[1]))
+
+            except Exception as e:
+                logger.warning(f"{runner.account_name} | Error: {str(e)}")
+                record_failure(runner.private_key, str(e))
+
+    chunks = WALLETS.chunks(WALLET_CHUNK_SIZE)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # Reading and sharding keys derives addresses, keep it off the event loop
+        while chunk := await asyncio.to_thread(next, chunks, None):
+            wallets = await asyncio.to_thread(journal_wallets, chunk)
+
+            if use_preflight:
+                wallets = await asyncio.to_thread(preflight, wallets, failed_wallets)
+
+            claims = await asyncio.gather(
+                *(
+                    fetcher(account_name, private_key)
+                    for account_name, private_key in wallets
+                )
+            )
+            claims = [claim for claim in claims if claim is not None]
+            claims = await asyncio.to_thread(verify_proofs, claims, failed_wallets)
+
+            # One batched eth_call for the whole chunk before any signing
+            if use_simulation:
+                claims = await asyncio.to_thread(simulate, claims, failed_wallets)
+
+            await asyncio.gather(*(worker(claim) for claim in claims))
+            release_proxies(chunk)
+
+            pending_receipts = [
+                receipt for receipt in pending_receipts if not receipt.done()
+            ]
+
+    logger.debug(f"Waiting on {len(pending_receipts)} receipts...")
+    await asyncio.gather(*pending_receipts)
+
+    write_report(failed_wallets, WALLETS.yielded)
+
+    return
+
+
+def fetch_claim_data(account_name, private_key, proxy):
+    runner, contract = create_runner(account_name, private_key, proxy)
+    amount, merkle_proofs = runner.get_claim_data()
+    return runner, contract, amount, merkle_proofs
+
+
+def prepare_bundle(
+    concurrency: int, use_preflight: bool = True, use_simulation: bool = True
+):
+    wallets = list(WALLETS)
+    logger.debug(f"Pre-signing claims for {len(wallets)} wallets")
+
+    failed_wallets = []
+
+    if use_preflight:
+        wallets = preflight(wallets, failed_wallets)
+
+    w3, reader = get_reader()
+    gas_price = bundle_gas_price(w3)
+
+    claims = []
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        futures = {
+            executor.submit(
+                fetch_claim_data, account_name, private_key, proxy_for(private_key)
+            ): account_name
+            for account_name, private_key in wallets
+        }
+
+        for future, account_name in futures.items():
+            try:
+                claims.append(future.result())
+            except Exception as e:
+                logger.warning(f"{account_name} | Error: {str(e)}")
+
+    claims = verify_proofs(claims, failed_wallets)
+
+    if use_simulation:
+        # The window is usually still closed here, keep the retry-later claims
+        try:
+            to_send, _, retry_later = run_simulation(w3, reader, claims)
+            claims = to_send + [claim for claim, _ in retry_later]
+        except Exception as e:
+            logger.warning(f"Simulation failed, pre-signing every claim: {str(e)}")
+
+    entries = []
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        futures = {
+            executor.submit(
+                runner.presign_claim, contract, amount, merkle_proofs, gas_price
+            ): runner.account_name
+            for runner, contract, amount, merkle_proofs in claims
+        }
+
+        for future, account_name in futures.items():
+            try:
+                entries.append(future.result())
+            except Exception as e:
+                logger.warning(f"{account_name} | Error: {str(e)}")
+
+    save_bundle(BUNDLE_PATH, entries)
+    logger.debug(
+        f"Pre-signed: {len(entries)}/{len(wallets)}, failed: {len(failed_wallets)}"
+    )
+
+
+def broadcast(bundle_path: str = BUNDLE_PATH):
+    entries = load_bundle(bundle_path)
+    keys_by_address = {
+        ClientRegistry.address(private_key): private_key for _, private_key in WALLETS
+    }
+
+    _, contract = get_reader()
+
+    if wait_for_window(contract):
+        results = broadcast_bundle(entries, Binance)
+    else:
+        results = {entry["address"]: None for entry in entries}
+
+    failed_wallets = open_failed_wallets()
+    failed_wallets.extend(
+        keys_by_address[address]
+        for address, receipt in results.items()
+        if receipt is None and address in keys_by_address
+    )
+
+    write_report(failed_wallets, len(entries))
+
+
+def open_relayer() -> Relayer:
+    keys = read_txt(RELAYER_KEY_PATH)
+
+    if not keys:
+        raise SystemExit(
+            f"Relayer mode needs the hot wallet's private key in {RELAYER_KEY_PATH}"
+        )
+
+    client = EvmClient(
+        "relayer",
+        keys[0],
+        Binance,
+        UserAgent().chrome,
+        ProxyPool.active.select() if ProxyPool.active else None,
+    )
+    # The SigningService only holds the beneficiaries' keys
+    client.signer = None
+
+    contract = client.get_contract(
+        contract_addr=CONTRACT_DATA["address"], abi=CONTRACT_DATA["abi"]
+    )
+
+    relayer = Relayer(client, contract)
+    relayer.check_balance()
+
+    return relayer
+
+
+def settle_relayed(pending, failed_wallets, timed_out, wait: bool = False):
+    """
+    Fails the wallets whose delegateClaim reverted and moves the ones without a
+    receipt to timed_out, to be rechecked once the relayer's nonces are
+    unblocked. Returns the entries still waiting on a receipt.
+    """
+    unsettled = []
+
+    for runner, tx_hash, future in pending:
+        if not wait and not future.done():
+            unsettled.append((runner, tx_hash, future))
+            continue
+
+        receipt = future.result()
+        if receipt is None:
+            timed_out.append((runner, tx_hash))
+        else:
+            check_receipt(runner.private_key, receipt, failed_wallets)
+
+    return unsettled
+
+
+def relay_claims(
+    concurrency: int, use_preflight: bool = True, use_simulation: bool = True
+):
+    relayer = open_relayer()
+    log_start(relayer=relayer.address, concurrency=concurrency)
+
+    if not use_simulation:
+        logger.warning(
+            "Relayer mode always simulates delegateClaim, it's what verifies the signed digest"
+        )
+
+    failed_wallets = open_failed_wallets()
+    authorizations = {}
+    pending, timed_out = [], []
+
+    def authorize(claim):
+        runner, _, amount, merkle_proofs = claim
+
+        try:
+            authorizations[runner.address] = relayer.authorize(
+                runner, amount, merkle_proofs
+            )
+            return claim
+        except Exception as e:
+            logger.warning(f"{runner.account_name} | Error: {str(e)}")
+            record_failure(runner.private_key, str(e))
+
+    def delegate_calls(claims):
+        return [
+            relayer.delegate_call(authorizations[claim[0].address]) for claim in claims
+        ]
+
+    def submit(claim):
+        runner = claim[0]
+
+        try:
+            tx_hash, future = relayer.relay(runner, authorizations.pop(runner.address))
+            return runner, tx_hash, future
+        except Exception as e:
+            logger.warning(f"{runner.account_name} | Error: {str(e)}")
+            failed_wallets.append(runner.private_key)
+            record_failure(runner.private_key, str(e))
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        for chunk in WALLETS.chunks(WALLET_CHUNK_SIZE):
+            wallets = journal_wallets(chunk)
+
+            # Beneficiaries don't pay gas, only claimed/invalidated matter
+            if use_preflight:
+                wallets = preflight(wallets, failed_wallets, need_balance=False)
+
+            futures = {
+                executor.submit(
+                    fetch_claim_data, account_name, private_key, proxy_for(private_key)
+                ): (account_name, private_key)
+                for account_name, private_key in wallets
+            }
+
+            claims = []
+            for future, (account_name, private_key) in futures.items():
+                try:
+                    claims.append(future.result())
+                except Exception as e:
+                    logger.warning(f"{account_name} | Error: {str(e)}")
+                    record_failure(private_key, str(e))
+
+            claims = verify_proofs(claims, failed_wallets)
+            claims = [claim for claim in executor.map(authorize, claims) if claim]
+
+            # The relayer's own delegateClaim with the signed authorization, so a
+            # digest the contract doesn't accept reverts here instead of on-chain
+            to_send = simulate(
+                claims, failed_wallets, calls_for=delegate_calls, fallback=False
+            )
+            sending = {claim[0].address for claim in to_send}
+            for runner, *_ in claims:
+                if runner.address not in sending:
+                    authorizations.pop(runner.address, None)
+
+            pending.extend(
+                submitted
+                for submitted in executor.map(submit, to_send)
+                if submitted is not None
+            )
+            pending = settle_relayed(pending, failed_wallets, timed_out)
+            release_proxies(chunk)
+
+    logger.debug(f"Waiting on {len(pending)} receipts...")
+    settle_relayed(pending, failed_wallets, timed_out, wait=True)
+
+    # Timed-out transactions usually sit behind a nonce gap, mine them before judging
+    relayer.fill_nonce_gaps()
+
+    if timed_out:
+        logger.debug(f"Rechecking {len(timed_out)} receipts after unblocking nonces...")
+        receipts = relayer.recheck([tx_hash for _, tx_hash in timed_out])
+
+        for runner, tx_hash in timed_out:
+            receipt = receipts[tx_hash]
+            runner.record_receipt(receipt)
+            check_receipt(runner.private_key, receipt, failed_wallets)
+
+    write_report(failed_wallets, WALLETS.yielded)
+
+
+def reconcile():
+    """Syncs the local XClaim/XDelegateClaim index and reports which wallets have claimed."""
+    index = ClaimIndex(CLAIM_INDEX_PATH, CONTRACT_DATA["address"])
+    proxy = ProxyPool.active.select() if ProxyPool.active else None
+
+    ClaimIndexer(
+        lambda: get_shared_w3(Binance, proxy), CONTRACT_DATA["address"], index
+    ).sync()
+
+    failed_wallets = open_failed_wallets()
+
+    for chunk in WALLETS.chunks(WALLET_CHUNK_SIZE):
+        keys_by_address = {
+            ClientRegistry.address(private_key): private_key for _, private_key in chunk
+        }
+        claimed = index.claimed(list(keys_by_address))
+
+        for address, (amount, tx_hash, block) in claimed.items():
+            logger.debug(
+                f"{address} | Claimed {Web3.from_wei(amount, 'ether')} in block {block}: {Binance.scanner}/tx/{tx_hash}"
+            )
+
+        failed_wallets.extend(
+            private_key
+            for address, private_key in keys_by_address.items()
+            if address not in claimed
+        )
+
+    write_report(failed_wallets, WALLETS.yielded)
+
+
+def merge():
+    """Combines the run_report.shard-*.json of every shard into one report."""
+    wallets_amt, failed_wallets_amt = merge_shard_reports(
+        "run_report.shard-*.json", "failed_wallets.txt"
+    )
+
+    logger.success(
+        f"Merged shards! Success: {wallets_amt - failed_wallets_amt}/{wallets_amt}, Failed: {failed_wallets_amt}/{wallets_amt}"
+    )
+
+
+def start_signer(workers: int, batch_size: int) -> SignerWalletSource:
+    """
+    The signer's workers read the key file themselves; from here on wallets
+    are (account_name, address) pairs and runners sign through the signer.
+    """
+    signer = SigningService(WALLETS.path, WALLETS.shard, workers, batch_size)
+    EvmClient.signer = signer
+    return SignerWalletSource(signer, WALLETS.path, WALLETS.shard)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Xterio airdrop claimer")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=0,
+        help="Process wallets on an async pool of N workers instead of one by one",
+    )
+    parser.add_argument(
+        "--no-preflight",
+        action="store_true",
+        help="Skip the bulk claimed/invalidated/balance check before logging in",
+    )
+    parser.add_argument(
+        "--no-simulation",
+        action="store_true",
+        help="Don't eth_call every claim in one batch before signing",
+    )
+    parser.add_argument(
+        "--prepare-bundle",
+        action="store_true",
+        help=f"Fetch claim data and pre-sign every claim into {BUNDLE_PATH}",
+    )
+    parser.add_argument(
+        "--broadcast-bundle",
+        action="store_true",
+        help="Wait for the claim window and broadcast the pre-signed bundle",
+    )
+    parser.add_argument(
+        "--relayer",
+        action="store_true",
+        help=f"Claim for every wallet with delegateClaim from the hot wallet in {RELAYER_KEY_PATH}",
+    )
+    parser.add_argument(
+        "--broadcast-race",
+        action="store_true",
+        help="Send every transaction to all RPCs and private relays, keep the first to accept",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch claim data from the Xterio API",
+    )
+    parser.add_argument(
+        "--signer-workers",
+        type=int,
+        default=0,
+        help="Derive addresses and sign on a pool of N processes",
+    )
+    parser.add_argument(
+        "--signer-batch-size",
+        type=int,
+        default=SIGNER_BATCH_SIZE,
+        help="Signatures per batch sent to a signer process",
+    )
+    parser.add_argument(
+        "--reconcile",
+        action="store_true",
+        help=f"Index claim events into {CLAIM_INDEX_PATH} and report which wallets claimed",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Continue the run journaled in {RUN_JOURNAL_PATH}, skipping confirmed wallets",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        help="Only process wallets whose address hashes to shard i of N (0-based i/N)",
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Combine the per-shard reports in this directory into one",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=0,
+        help="Serve Prometheus metrics on this port while running",
+    )
+    parser.add_argument(
+        "--no-proxy-check",
+        action="store_true",
+        help="Skip the pre-flight reachability check of data/proxies.txt",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+
+    if args.merge:
+        merge()
+        raise SystemExit
+
+    if args.shard is not None:
+        WALLETS = WalletSource(WALLETS.path, args.shard)
+
+    if args.metrics_port:
+        metrics.serve(args.metrics_port)
+
+    if args.broadcast_race:
+        EvmClient.broadcast_race = True
+
+    if args.signer_workers > 0:
+        WALLETS = start_signer(args.signer_workers, args.signer_batch_size)
+
+    load_proxy_pool(not args.no_proxy_check)
+
+    if not args.broadcast_bundle and not args.reconcile:
+        setup_claim_checks(not args.no_cache)
+
+    if args.reconcile:
+        reconcile()
+    elif args.prepare_bundle:
+        prepare_bundle(args.concurrency, not args.no_preflight, not args.no_simulation)
+    elif args.broadcast_bundle:
+        broadcast()
+    elif args.relayer:
+        open_journal(args.resume)
+        relay_claims(args.concurrency, not args.no_preflight, not args.no_simulation)
+    elif args.concurrency > 0:
+        open_journal(args.resume)
+        asyncio.run(
+            main_async(args.concurrency, not args.no_preflight, not args.no_simulation)
+        )
+    else:
+        open_journal(args.resume)
+        main(not args.no_preflight, not args.no_simulation)
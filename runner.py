@@ -1,13 +1,20 @@
 from src.utils.retry import retry
 from loguru import logger
-from eth_account.messages import encode_defunct
 from src.api.xterio_api import XterioAPI
 from src.clients.evm_client import EvmClient
+from src.clients.gas_model import gas_model
 from src.models.network import Binance
+from src.storage.run_journal import Stage
+from src.utils.metrics import metrics, endpoint_label
+from src.common.constants import MIN_CLAIM_BALANCE, CLAIM_GAS_LIMIT
 
 
 class Runner(EvmClient):
 
+    claim_cache = None
+    merkle_verifier = None
+    journal = None
+
     def __init__(
         self,
         account_name=None,
@@ -17,36 +24,80 @@ class Runner(EvmClient):
         proxy=None,
     ):
         super().__init__(account_name, private_key, network, user_agent, proxy)
-        self.api = XterioAPI(self.proxy, self.user_agent, self.address)
+        self.api = XterioAPI(self.proxy, self.user_agent, self.address, self)
+
+    def rotate_proxy(self):
+        super().rotate_proxy()
+        self.api.set_proxy(self.proxy)
+        return self
+
+    def record(self, stage: str, tx_hash: str | None = None, error: str | None = None):
+        if self.journal is not None:
+            self.journal.record(self.address, stage, tx_hash, error)
+
+    def record_signed(self, signed, nonce: int):
+        if self.journal is not None:
+            self.journal.record_signed(
+                self.address,
+                self.w3.to_hex(signed.hash),
+                nonce,
+                self.w3.to_hex(signed.raw_transaction),
+            )
 
+    def record_claim_data(self, amount: int, proofs: list[str]):
+        if self.journal is not None:
+            self.journal.record_claim_data(self.address, amount, proofs)
+
+    @metrics.timed("claim_data", lambda self: {"proxy": endpoint_label(self.proxy)})
     def get_claim_data(self):
+        if self.journal is not None:
+            journaled = self.journal.claim_data(self.address)
+
+            if journaled is not None:
+                logger.info(
+                    f"{self.account_name} | {self.address} - using journaled claim data"
+                )
+                return journaled
+
+        if self.claim_cache is not None:
+            cached = self.claim_cache.get(self.address)
+
+            if cached is not None:
+                logger.info(
+                    f"{self.account_name} | {self.address} - using cached claim data"
+                )
+                self.record_claim_data(*cached)
+                return cached
+
         logger.info(f"{self.account_name} | {self.address} - getting claim data")
 
         try:
             text_message = self.api.get_message()
-            encoded_message = encode_defunct(text=text_message)
-            signed_hash = self.account.sign_message(encoded_message)
-            sign = self.w3.to_hex(signed_hash.signature)
+            sign = self.sign_message(text_message)
 
             access_token = self.api.login(sign)
             amount, proofs = self.api.get_claim_data(access_token)
 
+            self.record_claim_data(amount, proofs)
+
             return amount, proofs
 
         except Exception as e:
             logger.error(
                 f"{self.account_name} | {self.address} | Something went wrong on getting claim data: {str(e)}"
             )
+            raise
 
+    @metrics.timed("claim", lambda self, *_: {"rpc": endpoint_label(self.rpc)})
     @retry
-    def claim(self, contract, amount, merkle_proofs):
+    def claim(self, contract, amount, merkle_proofs, wait: bool = True):
         logger.info(
             f"{self.account_name} | {self.address} | Checking balance first to see if we can afford the claim"
         )
 
-        balance = self.get_eth_balance(self.address)
+        balance, _, gas_price = self.get_account_state(self.address)
 
-        if balance < self.w3.to_wei(0.00012, "ether"):
+        if balance < self.w3.to_wei(MIN_CLAIM_BALANCE, "ether"):
             logger.info(
                 f"{self.account_name} | {self.address} | Not enough balance to claim, skipping..."
             )
@@ -54,25 +105,118 @@ class Runner(EvmClient):
 
         logger.info(f"{self.account_name} | {self.address} | Running claim")
 
-        tx_data = contract.functions.claim(amount, merkle_proofs).build_transaction(
-            {
-                "from": self.address,
-                "nonce": self.get_nonce(self.address),
-                "gasPrice": int(self.w3.eth.gas_price * 1.02),
-                "chainId": self.network.chain_id,
-            }
-        )
+        claim_fn = contract.functions.claim(amount, merkle_proofs)
+        gas_key = gas_model.key(contract.address, claim_fn.selector, len(merkle_proofs))
+        gas = gas_model.predict(gas_key)
 
-        tx_data["gas"] = int(self.w3.eth.estimate_gas(tx_data) * 1.02)
+        if gas is None:
+            with metrics.timer("estimate_gas", rpc=endpoint_label(self.rpc)):
+                estimate = claim_fn.estimate_gas({"from": self.address})
+            gas_model.observe(gas_key, estimate)
+            gas = int(estimate * 1.02)
 
-        signed = self.sign_transaction(tx_data)
+        nonce = self.get_nonce(self.address)
+
+        try:
+            tx_data = claim_fn.build_transaction(
+                {
+                    "from": self.address,
+                    "nonce": nonce,
+                    "gasPrice": int(gas_price * 1.02),
+                    "gas": gas,
+                    "chainId": self.network.chain_id,
+                }
+            )
+
+            signed = self.sign_transaction(tx_data)
+        except Exception:
+            self.nonce_manager.release(nonce)
+            raise
 
         if signed:
-            tx_hash = self.send_tx(signed)
+            self.record_signed(signed, nonce)
+            submitted = self.submit_tx(signed, nonce)
 
-            if tx_hash:
-                return True
+            if not submitted:
+                raise Exception("No tx hash")
 
-            raise Exception("No tx hash")
+            _, future = submitted
+            self.record(Stage.BROADCAST)
+            future.add_done_callback(
+                lambda f: gas_model.on_receipt(gas_key, gas, f.result())
+            )
+            future.add_done_callback(lambda f: self.record_receipt(f.result()))
+
+            if not wait:
+                return submitted
+
+            receipt = future.result()
+
+            if receipt is None:
+                # Never sign a second claim with a new nonce while this one may
+                # still land: re-broadcast the same transaction and wait again
+                tx_hash = submitted[0]
+                self.fill_nonce_gaps()
+                receipt = self.wait_for_receipt(tx_hash)
+                self.record_receipt(receipt)
+
+            if receipt is None:
+                logger.warning(
+                    f"{self.account_name} | {self.address} | Claim {tx_hash} still not mined, giving up on this wallet"
+                )
+                return False
+
+            return receipt["status"] == 1
 
         raise Exception("Missing signed transaction")
+
+    def record_receipt(self, receipt):
+        if receipt is None:
+            return
+
+        if receipt["status"] == 1:
+            self.record(Stage.CONFIRMED)
+        else:
+            self.record(Stage.FAILED, error="reverted")
+
+    def presign_claim(
+        self,
+        contract,
+        amount,
+        merkle_proofs,
+        gas_price: int,
+        nonce: int | None = None,
+        gas_limit: int | None = None,
+    ) -> dict:
+        """Signs claim(amount, proof) offline with a fixed gas limit, nothing is sent."""
+        nonce = self.get_nonce(self.address) if nonce is None else nonce
+
+        if gas_limit is None:
+            gas_key = gas_model.key(
+                contract.address,
+                contract.functions.claim(amount, merkle_proofs).selector,
+                len(merkle_proofs),
+            )
+            gas_limit = gas_model.predict(gas_key) or CLAIM_GAS_LIMIT
+
+        tx_data = {
+            "from": self.address,
+            "to": contract.address,
+            "data": contract.encode_abi("claim", args=[amount, merkle_proofs]),
+            "value": 0,
+            "nonce": nonce,
+            "gas": gas_limit,
+            "gasPrice": gas_price,
+            "chainId": self.network.chain_id,
+        }
+
+        signed = self.sign_transaction(tx_data)
+
+        return {
+            "account_name": self.account_name,
+            "address": self.address,
+            "proxy": self.proxy,
+            "nonce": nonce,
+            "tx_hash": self.w3.to_hex(signed.hash),
+            "raw_tx": self.w3.to_hex(signed.raw_transaction),
+        }
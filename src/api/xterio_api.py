@@ -1,12 +1,23 @@
 import json
-from ..utils.retry import retry
+import time
 import requests
+from ..utils.retry import retry
+from ..clients.registry import ClientRegistry
+from ..clients.proxy_pool import ProxyPool
+from ..utils.rate_limiter import rate_limiter
+from ..utils.metrics import metrics, endpoint_label
+from ..common.constants import AIRDROP_ID, XTERIO_API_URL
 from loguru import logger
 
 
 class XterioAPI:
-    def __init__(self, proxy, user_agent, wallet_address):
+
+    base_url = XTERIO_API_URL
+
+    def __init__(self, proxy, user_agent, wallet_address, owner=None):
         self.name = "Xterio API"
+        # The Runner whose proxy this follows, so login and claim stay together
+        self.owner = owner
         self.proxy = proxy
         self.wallet_address = wallet_address
         self.user_agent = user_agent
@@ -24,21 +35,58 @@ class XterioAPI:
             # "sec-fetch-mode": "cors",
             "sec-fetch-site": "same-site",
         }
-        self.session = requests.Session()
+        self.session = ClientRegistry.api_session(self.proxy)
+
+    def set_proxy(self, proxy):
+        self.proxy = proxy
+        self.proxies = {"http": self.proxy, "https": self.proxy}
+        ClientRegistry.mount(self.session, self.proxy)
+
+    def rotate_proxy(self):
+        if self.owner is not None:
+            # Moves the wallet's RPC client too and calls set_proxy back
+            self.owner.rotate_proxy()
+        elif ProxyPool.active is not None:
+            self.set_proxy(ProxyPool.active.rebind(self.wallet_address))
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        rate_limiter.acquire(url, self.proxy)
+
+        start = time.time()
+        try:
+            response = self.session.request(method, url, proxies=self.proxies, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if ProxyPool.active is not None:
+                ProxyPool.active.report(self.proxy, False)
+            metrics.inc(
+                "xterio_requests", proxy=endpoint_label(self.proxy), status="error"
+            )
+            raise
+
+        metrics.inc(
+            "xterio_requests",
+            proxy=endpoint_label(self.proxy),
+            status=response.status_code,
+        )
+
+        if ProxyPool.active is not None:
+            ProxyPool.active.report(self.proxy, True, time.time() - start)
 
-    @retry
+        rate_limiter.report(url, self.proxy, response.status_code == 429)
+        return response
+
+    @metrics.timed(
+        "xterio_get_message", lambda self: {"proxy": endpoint_label(self.proxy)}
+    )
+    @retry(raise_on_failure=True)
     def get_message(self):
         logger.info(
             f"{self.name} - Getting response message for wallet {self.wallet_address}..."
         )
 
-        url = f"https://api.xter.io/account/v1/login/wallet/{self.wallet_address}"
+        url = f"{self.base_url}/account/v1/login/wallet/{self.wallet_address}"
 
-        response = self.session.get(
-            url,
-            headers=self.headers,
-            proxies=self.proxies,
-        )
+        response = self.request("GET", url, headers=self.headers)
 
         if response.status_code == 200:
             for cookie in self.session.cookies:
@@ -46,13 +94,18 @@ class XterioAPI:
 
             return response.json()["data"]["message"]
 
-        raise Exception("Non-200 status code ob login message request")
+        raise requests.HTTPError(
+            "Non-200 status code ob login message request", response=response
+        )
 
-    @retry
+    @metrics.timed(
+        "xterio_login", lambda self, *_: {"proxy": endpoint_label(self.proxy)}
+    )
+    @retry(raise_on_failure=True)
     def login(self, signature: str):
         logger.info(f"{self.name} - Logging in with address {self.wallet_address}")
 
-        url = "https://api.xter.io/account/v1/login/wallet"
+        url = f"{self.base_url}/account/v1/login/wallet"
 
         payload = {
             "address": self.wallet_address,
@@ -62,9 +115,7 @@ class XterioAPI:
             "type": "eth",
         }
 
-        response = self.session.post(
-            url, headers=self.headers, proxies=self.proxies, json=payload
-        )
+        response = self.request("POST", url, headers=self.headers, json=payload)
 
         if response.status_code == 200:
             data = json.loads(response.text)["data"]
@@ -75,23 +126,28 @@ class XterioAPI:
             return data["id_token"]
 
         logger.warning("Non - 200 status code")
-        raise Exception("Non-200 status code on wallet login")
+        raise requests.HTTPError(
+            "Non-200 status code on wallet login", response=response
+        )
 
-    @retry
+    @metrics.timed(
+        "xterio_get_claim_data", lambda self, *_: {"proxy": endpoint_label(self.proxy)}
+    )
+    @retry(raise_on_failure=True)
     def get_claim_data(self, access_token: str):
         logger.info(
             f"{self.name} - Getting merkle proof for wallet {self.wallet_address}"
         )
 
-        url = "https://api.xter.io/airdrop/v1/user/query/claim/1b13f586-53bf-4827-8c17-5deed560653d?"
+        url = f"{self.base_url}/airdrop/v1/user/query/claim/{AIRDROP_ID}?"
 
         headers = self.headers
         headers["Authorization"] = f"Bearer {access_token}"
 
-        response = self.session.get(url, headers=headers, proxies=self.proxies)
+        response = self.request("GET", url, headers=headers)
 
         if response.status_code == 200:
             data = response.json()["data"][0]
             return int(data["amount"]), data["address_build"]["merkle_proofs"]
 
-        raise Exception("Non-200 status code on claim info")
+        raise requests.HTTPError("Non-200 status code on claim info", response=response)
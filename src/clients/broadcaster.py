@@ -0,0 +1,105 @@
+import time
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from loguru import logger
+from web3 import Web3
+from ..utils.retry import ErrorClass, classify
+
+
+def raw_tx_hash(raw_tx) -> bytes:
+    if isinstance(raw_tx, str):
+        return Web3.keccak(hexstr=raw_tx)
+    return Web3.keccak(raw_tx)
+
+
+class RaceBroadcaster:
+    """
+    Sends the same signed transaction to several endpoints at once and returns
+    as soon as the first one accepts it. Keeps per-endpoint acceptance latency
+    and how often each endpoint was the first to accept. An endpoint that
+    answers "already known" has the transaction in its pool, which counts as
+    accepted too: with several relays that is the usual answer for all but one.
+    """
+
+    _executor = ThreadPoolExecutor(max_workers=64)
+    _lock = threading.Lock()
+    latencies: dict[str, list[float]] = defaultdict(list)
+    wins: dict[str, int] = defaultdict(int)
+    errors: dict[str, int] = defaultdict(int)
+
+    def __init__(self, endpoints: list[str], w3_factory):
+        self.endpoints = list(dict.fromkeys(endpoints))
+        self.w3_factory = w3_factory
+        self.module_name = "RaceBroadcaster"
+
+    def _send(self, endpoint: str, raw_tx):
+        start = time.time()
+        try:
+            tx_hash = self.w3_factory(endpoint).eth.send_raw_transaction(raw_tx)
+        except Exception as e:
+            if classify(e) != ErrorClass.ALREADY_KNOWN:
+                with self._lock:
+                    self.errors[endpoint] += 1
+                raise
+
+            tx_hash = raw_tx_hash(raw_tx)
+
+        elapsed = time.time() - start
+        with self._lock:
+            self.latencies[endpoint].append(elapsed)
+
+        return endpoint, tx_hash, elapsed
+
+    def broadcast(self, raw_tx):
+        futures = {
+            self._executor.submit(self._send, endpoint, raw_tx)
+            for endpoint in self.endpoints
+        }
+        last_error = None
+
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                try:
+                    endpoint, tx_hash, elapsed = future.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+
+                with self._lock:
+                    self.wins[endpoint] += 1
+
+                logger.debug(
+                    f"{self.module_name} | {endpoint} accepted first in {elapsed:.3f}s"
+                )
+                return tx_hash
+
+        raise last_error
+
+    @classmethod
+    def summary(cls) -> list[dict]:
+        with cls._lock:
+            endpoints = set(cls.latencies) | set(cls.errors)
+            return [
+                {
+                    "endpoint": endpoint,
+                    "wins": cls.wins[endpoint],
+                    "accepted": len(cls.latencies[endpoint]),
+                    "errors": cls.errors[endpoint],
+                    "avg_latency": round(
+                        sum(cls.latencies[endpoint])
+                        / max(len(cls.latencies[endpoint]), 1),
+                        3,
+                    ),
+                }
+                for endpoint in sorted(endpoints)
+            ]
+
+    @classmethod
+    def log_summary(cls):
+        for row in cls.summary():
+            logger.info(
+                f"Broadcast | {row['endpoint']} - first: {row['wins']}, accepted: {row['accepted']}, errors: {row['errors']}, avg latency: {row['avg_latency']}s"
+            )
@@ -1,24 +1,267 @@
 from web3 import Web3
 import random
 import time
+import threading
+from concurrent.futures import Future
 from decimal import Decimal
 from typing import Self
 from loguru import logger
 from web3.types import Wei
 from eth_account import Account
+from eth_account.messages import encode_defunct
 from ..models.network import Network, Binance
+from .rpc_pool import RpcPool
+from .registry import ClientRegistry
+from .receipt_tracker import ReceiptTracker
+from .broadcaster import RaceBroadcaster
+from .proxy_pool import ProxyPool
+from .gas_oracle import GasOracle, GasSuggestion
+from .funds_watcher import FundsWatcher
+from .nonce_manager import NonceManager
+from ..utils.rate_limiter import rate_limiter
+from ..utils.retry import ErrorClass, classify
+from ..utils.metrics import metrics, endpoint_label
 from ..common.constants import (
-    GAS_LIMIT_MULTIPLIER,
     GAS_PRICE_MULTIPLIER,
     GAS_AMT_MULTIPLIER,
     MAX_DST_WAIT_TIME,
     ACCEPTABLE_L1_GWEI,
-    MAX_RETRIES,
+    RPC_BATCH_WINDOW,
+    DEFAULT_RPC_BATCH_SIZE,
+    RPC_BATCH_LIMITS,
+    TX_RECEIPT_TIMEOUT,
+    BROADCAST_RACE,
+    PRIVATE_RELAYS,
 )
 
 
+class RpcMicroBatcher:
+    """
+    Collects single JSON-RPC calls made by different threads against the same
+    endpoint/proxy pair and sends them as one batch once the window closes or
+    the endpoint's batch size limit is reached.
+    """
+
+    def __init__(self, provider, window: float, max_size: int):
+        self.provider = provider
+        self.window = window
+        self.max_size = max_size
+        self._pending = []
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def submit(self, method, params):
+        future = Future()
+        flush_now = False
+
+        with self._lock:
+            self._pending.append((method, params, future))
+
+            if len(self._pending) >= self.max_size:
+                flush_now = True
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if flush_now:
+            self.flush()
+
+        return future.result()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._timer = None
+
+        if not pending:
+            return
+
+        try:
+            if len(pending) == 1:
+                method, params, _ = pending[0]
+                responses = [self.provider.send_single(method, params)]
+            else:
+                responses = self.provider.make_batch_request(
+                    [(method, params) for method, params, _ in pending]
+                )
+        except Exception as e:
+            for _, _, future in pending:
+                future.set_exception(e)
+            return
+
+        for (_, _, future), response in zip(pending, responses):
+            future.set_result(response)
+
+
+class BatchingHTTPProvider(Web3.HTTPProvider):
+    """
+    HTTPProvider that splits batches by the endpoint's size limit and, when a
+    batch window is set, coalesces concurrent single calls into batches. An
+    endpoint that refuses a batch (HTTP 4xx or a non-batch answer) gets it
+    again in halves, and the smaller limit is kept for the endpoint.
+    """
+
+    _batchers: dict[tuple[str, str | None], RpcMicroBatcher] = {}
+    _batchers_lock = threading.Lock()
+    _limits: dict[str, int] = {}
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        request_kwargs: dict | None = None,
+        batch_window: float = RPC_BATCH_WINDOW,
+        max_batch_size: int | None = None,
+        pool: RpcPool | None = None,
+        **kwargs,
+    ):
+        super().__init__(
+            endpoint_uri=endpoint_uri, request_kwargs=request_kwargs, **kwargs
+        )
+        self.batch_window = batch_window
+        self.pool = pool
+        self._max_batch_size = max_batch_size or RPC_BATCH_LIMITS.get(
+            endpoint_uri, DEFAULT_RPC_BATCH_SIZE
+        )
+        self.batcher = self._get_batcher() if self.batch_window > 0 else None
+
+    @property
+    def max_batch_size(self) -> int:
+        return self._limits.get(str(self.endpoint_uri), self._max_batch_size)
+
+    def shrink(self, size: int):
+        """Halves the endpoint's batch limit after it refused a batch of size."""
+        endpoint = str(self.endpoint_uri)
+        limit = max(1, size // 2)
+
+        with self._batchers_lock:
+            if limit >= self._limits.get(endpoint, self._max_batch_size):
+                return
+            self._limits[endpoint] = limit
+
+        logger.debug(
+            f"BatchingHTTPProvider | {endpoint_label(endpoint)} refused a batch of {size}, limit now {limit}"
+        )
+
+    @staticmethod
+    def is_refused(exc: Exception) -> bool:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+        return status is not None and 400 <= status < 500 and status != 429
+
+    def _get_batcher(self) -> RpcMicroBatcher:
+        proxy = (self._request_kwargs.get("proxies") or {}).get("https")
+        key = (str(self.endpoint_uri), proxy)
+
+        with self._batchers_lock:
+            if key not in self._batchers:
+                self._batchers[key] = RpcMicroBatcher(
+                    self, self.batch_window, self.max_batch_size
+                )
+            return self._batchers[key]
+
+    @staticmethod
+    def is_throttled(response) -> bool:
+        responses = response if isinstance(response, list) else [response]
+
+        for item in responses:
+            error = item.get("error") if isinstance(item, dict) else None
+            if error and (
+                error.get("code") in (-32005, 429)
+                or "rate limit" in str(error.get("message", "")).lower()
+            ):
+                return True
+
+        return False
+
+    def _timed(self, func, *args):
+        endpoint = str(self.endpoint_uri)
+        proxy = (self._request_kwargs.get("proxies") or {}).get("https")
+
+        labels = {"rpc": endpoint_label(endpoint), "proxy": endpoint_label(proxy)}
+
+        rate_limiter.acquire(endpoint, proxy)
+        start = time.time()
+        try:
+            response = func(*args)
+        except Exception as e:
+            if self.pool is not None:
+                self.pool.record(endpoint, time.time() - start, False)
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            rate_limiter.report(endpoint, proxy, status == 429)
+            metrics.inc("rpc_errors", **labels)
+            raise
+
+        metrics.observe("rpc_request", time.time() - start, **labels)
+        if self.pool is not None:
+            self.pool.record(endpoint, time.time() - start, True)
+        rate_limiter.report(endpoint, proxy, self.is_throttled(response))
+        return response
+
+    def send_single(self, method, params):
+        return self._timed(super().make_request, method, params)
+
+    def make_request(self, method, params):
+        if self.batcher is None:
+            return self.send_single(method, params)
+        return self.batcher.submit(method, params)
+
+    def make_batch_request(self, batch_requests):
+        responses = []
+        start = 0
+
+        while start < len(batch_requests):
+            chunk = batch_requests[start : start + self.max_batch_size]
+            start += len(chunk)
+
+            if len(chunk) == 1:
+                responses.append(self.send_single(*chunk[0]))
+                continue
+
+            try:
+                response = self._timed(super().make_batch_request, chunk)
+            except Exception as e:
+                if not self.is_refused(e):
+                    raise
+                response = None
+
+            if isinstance(response, list) and len(response) == len(chunk):
+                responses.extend(response)
+            else:
+                # Endpoint refused the batch, send it again in smaller ones
+                self.shrink(len(chunk))
+                start -= len(chunk)
+
+        return responses
+
+
+def get_shared_w3(
+    network: Network, proxy: str | None = None, rpc: str | None = None
+) -> Web3:
+    """Keyless Web3 on the healthiest endpoint of the network (or on rpc), for reads and raw broadcasts."""
+    pool = RpcPool.for_network(network)
+    rpc = rpc or pool.select()
+
+    return ClientRegistry.web3(
+        rpc,
+        proxy,
+        lambda session: BatchingHTTPProvider(
+            endpoint_uri=rpc,
+            request_kwargs={
+                "headers": {"Content-Type": "application/json"},
+                "proxies": {"http": proxy, "https": proxy},
+                "timeout": 60,
+            },
+            session=session,
+            pool=pool,
+        ),
+    )
+
+
 class EvmClient:
 
+    broadcast_race = BROADCAST_RACE
+    signer = None
+
     def __init__(
         self: Self,
         account_name: str | int = None,
@@ -29,10 +272,12 @@ class EvmClient:
     ) -> Self:
         self.account_name = account_name
         self.private_key = private_key
-        self.account: Account = Account.from_key(self.private_key)
-        self.address = Web3.to_checksum_address(self.account.address)
+        self.address = Web3.to_checksum_address(
+            ClientRegistry.address(self.private_key)
+        )
         self.network = network
-        self.rpc = self.network.rpc_list[0]
+        self.rpc_pool = RpcPool.for_network(self.network)
+        self.rpc = self.rpc_pool.select()
         self.user_agent = user_agent
         self.chain_id = self.network.chain_id
         self.proxy = proxy
@@ -48,13 +293,53 @@ class EvmClient:
             "timeout": 60,
         }
 
-        self.w3 = Web3(
-            Web3.HTTPProvider(endpoint_uri=self.rpc, request_kwargs=self.request_kwargs)
-        )
+        self.w3 = self.make_w3(self.rpc)
 
         self.logger = logger
         self.module_name = "EvmClient"
 
+    def make_w3(self, rpc: str) -> Web3:
+        # Shared per (endpoint, proxy) and keeps the User-Agent of the wallet
+        # that built it: calls of many wallets go out in the same batches
+        return ClientRegistry.web3(
+            rpc,
+            self.proxy,
+            lambda session: BatchingHTTPProvider(
+                endpoint_uri=rpc,
+                request_kwargs=self.request_kwargs,
+                session=session,
+                pool=self.rpc_pool,
+            ),
+        )
+
+    @property
+    def w3(self) -> Web3:
+        if not self.rpc_pool.is_available(self.rpc):
+            self.leave_rpc()
+
+        return self._w3
+
+    @w3.setter
+    def w3(self, w3: Web3):
+        self._w3 = w3
+
+    @property
+    def account(self) -> Account:
+        return ClientRegistry.account(self.private_key)
+
+    def borrow(self, network: Network) -> "EvmClient":
+        """Client for the same wallet on another network, backed by shared connections."""
+        if network is self.network:
+            return self
+
+        return EvmClient(
+            account_name=self.account_name,
+            private_key=self.private_key,
+            network=network,
+            user_agent=self.user_agent,
+            proxy=self.proxy,
+        )
+
     @staticmethod
     def to_bytes(data) -> bytes:
         return Web3.to_bytes(data)
@@ -67,8 +352,35 @@ class EvmClient:
     def from_wei(amount_wei: int | Wei, decimals: int):
         return amount_wei / 10**decimals
 
+    @property
+    def nonce_manager(self) -> NonceManager:
+        return NonceManager.for_wallet(
+            self.network,
+            self.address,
+            lambda: get_shared_w3(self.network, self.proxy),
+        )
+
     def get_nonce(self, address: str) -> int:
-        return self.w3.eth.get_transaction_count(address)
+        """Own nonces come from the local NonceManager and are reserved for the caller."""
+        with metrics.timer("get_nonce", rpc=endpoint_label(self.rpc)):
+            if address == self.address:
+                return self.nonce_manager.reserve()
+
+            return self.w3.eth.get_transaction_count(address)
+
+    def get_account_state(self, address: str | None = None) -> tuple[int, int, int]:
+        """Balance and pending nonce in a single batched request, gas price from the shared oracle."""
+        address = address or self.address
+
+        with self.w3.batch_requests() as batch:
+            batch.add(self.w3.eth.get_balance(address))
+            batch.add(self.w3.eth.get_transaction_count(address, "pending"))
+            balance, nonce = batch.execute()
+
+        if address == self.address:
+            self.nonce_manager.seed(nonce)
+
+        return balance, nonce, self.get_gas_price()
 
     def get_contract(self, contract_addr: str, abi=None):
         contract = self.w3.eth.contract(
@@ -102,32 +414,24 @@ class EvmClient:
             "value": value,
         }
 
-        time.sleep(4)
-
         if data is not None:
             tx_params["data"] = data
 
+        fees = self.get_fees()
+
         if eip_1559:
-            time.sleep(5)
-            base_fee_per_gas = self.w3.eth.get_block("latest")["baseFeePerGas"]
-            max_priority_fee_per_gas = self.w3.eth.max_priority_fee
-            max_fee_per_gas = max_priority_fee_per_gas + int(
-                base_fee_per_gas * GAS_LIMIT_MULTIPLIER
-            )
             tx_params["maxPriorityFeePerGas"] = int(
-                max_priority_fee_per_gas * GAS_PRICE_MULTIPLIER
+                fees.priority_fee * GAS_PRICE_MULTIPLIER
             )
-            tx_params["maxFeePerGas"] = int(max_fee_per_gas * GAS_PRICE_MULTIPLIER)
+            tx_params["maxFeePerGas"] = int(fees.max_fee * GAS_PRICE_MULTIPLIER)
         else:
-            tx_params["gasPrice"] = int(self.w3.eth.gas_price * GAS_PRICE_MULTIPLIER)
-            time.sleep(4)
+            tx_params["gasPrice"] = int(fees.gas_price * GAS_PRICE_MULTIPLIER)
 
         if estimate_gas:
             try:
-                tx_params["gas"] = int(
-                    self.w3.eth.estimate_gas(transaction=tx_params) * GAS_AMT_MULTIPLIER
-                )
-                time.sleep(4)
+                with metrics.timer("estimate_gas", rpc=endpoint_label(self.rpc)):
+                    estimate = self.w3.eth.estimate_gas(transaction=tx_params)
+                tx_params["gas"] = int(estimate * GAS_AMT_MULTIPLIER)
             except Exception:
                 tx_params["gas"] = default_gas
 
@@ -141,38 +445,155 @@ class EvmClient:
         balance = contract.functions.balanceOf(self.address).call()
         return name, symbol, decimals, balance
 
-    def send_tx(self, signed_tx: dict) -> str:
-        timeout = 180
+    def log_receipt(self, tx_hash: str, receipt):
+        if receipt is None:
+            return
+
+        if receipt["status"] == 1:
+            self.logger.success(
+                f"{self.account_name} | {self.address} | {self.module_name} | Transaction: {self.network.scanner}/tx/0x{tx_hash}"
+            )
+        elif receipt["status"] == 0:
+            self.logger.warning(
+                f"{self.account_name} | {self.address} | {self.module_name} | Transaction failed: {self.network.scanner}/tx/0x{tx_hash}"
+            )
+
+    def send_raw_transaction(self, raw_tx):
+        if not self.broadcast_race:
+            with metrics.timer("send_raw_transaction", rpc=endpoint_label(self.rpc)):
+                return self.w3.eth.send_raw_transaction(raw_tx)
+
+        broadcaster = RaceBroadcaster(
+            [self.rpc, *self.network.rpc_list, *PRIVATE_RELAYS], self.make_w3
+        )
+        with metrics.timer("send_raw_transaction", rpc="race"):
+            return broadcaster.broadcast(raw_tx)
+
+    def submit_tx(
+        self, signed_tx: dict, nonce: int | None = None
+    ) -> tuple[str, Future] | None:
+        """
+        Fire-and-forget: broadcasts the transaction and returns its hash with a
+        future resolved by the shared ReceiptTracker (receipt or None on timeout).
+        Pass the nonce it was signed with to keep the NonceManager in sync.
+        """
         try:
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        except ValueError:
+            tx_hash = self.send_raw_transaction(signed_tx.raw_transaction)
+        except Exception as e:
+            self.nonce_manager.failed(nonce, e)
+            if classify(e) == ErrorClass.ALREADY_KNOWN:
+                # Already in the node's pool (e.g. a re-broadcast), track it as sent
+                tx_hash = signed_tx.hash
+            elif isinstance(e, ValueError):
+                return
+            else:
+                raise
+
+        if not tx_hash:
+            if nonce is not None:
+                self.nonce_manager.release(nonce)
             return
 
-        if tx_hash:
+        sent_at = time.time()
+
+        if nonce is not None:
+            self.nonce_manager.sent(nonce, signed_tx.raw_transaction)
 
-            res = self.w3.eth.wait_for_transaction_receipt(
-                tx_hash.hex(), timeout=timeout
+        tx_hash = str(tx_hash.hex())
+        future = ReceiptTracker.for_network(
+            self.network, lambda: get_shared_w3(self.network, self.proxy)
+        ).track(tx_hash, timeout=TX_RECEIPT_TIMEOUT)
+        future.add_done_callback(lambda f: self.log_receipt(tx_hash, f.result()))
+        future.add_done_callback(
+            lambda f: self.record_receipt_metrics(sent_at, f.result())
+        )
+
+        if nonce is not None:
+            future.add_done_callback(
+                lambda f: self.nonce_manager.confirmed(nonce, f.result())
             )
 
-            if res:
-                if res["status"] == 1:
-                    self.logger.success(
-                        f"{self.account_name} | {self.address} | {self.module_name} | Transaction: {self.network.scanner}/tx/0x{tx_hash.hex()}"
-                    )
-                elif res["status"] == 0:
-                    self.logger.warning(
-                        f"{self.account_name} | {self.address} | {self.module_name} | Transaction failed: {self.network.scanner}/tx/0x{tx_hash.hex()}"
-                    )
+        return tx_hash, future
+
+    def wait_for_receipt(self, tx_hash: str, timeout: int = TX_RECEIPT_TIMEOUT):
+        """Receipt of a transaction that may already be mined, None on timeout."""
+        return (
+            ReceiptTracker.for_network(
+                self.network, lambda: get_shared_w3(self.network, self.proxy)
+            )
+            .track(tx_hash, timeout=timeout, lookup=True)
+            .result()
+        )
+
+    def record_receipt_metrics(self, sent_at: float, receipt):
+        if receipt is None:
+            metrics.inc("receipts", status="timeout")
+            return
+
+        metrics.observe(
+            "time_to_receipt", time.time() - sent_at, rpc=endpoint_label(self.rpc)
+        )
+        metrics.inc("receipts", status="ok" if receipt["status"] == 1 else "reverted")
+
+    def send_tx(self, signed_tx: dict, nonce: int | None = None) -> str:
+        submitted = self.submit_tx(signed_tx, nonce)
+
+        if submitted is None:
+            return
+
+        tx_hash, future = submitted
 
-                return str(tx_hash.hex())
+        if future.result() is not None:
+            return tx_hash
 
         self.logger.warning(
-            f"{self.account_name} | {self.address} | {self.module_name} | Transaction didn't come through after {timeout} seconds."
+            f"{self.account_name} | {self.address} | {self.module_name} | Transaction didn't come through after {TX_RECEIPT_TIMEOUT} seconds."
         )
+        self.fill_nonce_gaps()
 
         return
 
+    def cancel_nonce(self, nonce: int):
+        """Occupies a nonce with a zero-value self-transfer."""
+        tx_data = {
+            "from": self.address,
+            "to": self.address,
+            "value": 0,
+            "nonce": nonce,
+            "gas": 21000,
+            "gasPrice": int(self.get_gas_price() * GAS_PRICE_MULTIPLIER),
+            "chainId": self.chain_id,
+        }
+
+        signed = self.sign_transaction(tx_data)
+        self.send_raw_transaction(signed.raw_transaction)
+
+    def fill_nonce_gaps(self) -> int:
+        try:
+            return self.nonce_manager.fill_gaps(self.cancel_nonce)
+        except Exception as e:
+            self.logger.warning(
+                f"{self.account_name} | {self.address} | {self.module_name} | Couldn't fill nonce gaps: {str(e)}"
+            )
+            return 0
+
+    @metrics.timed("sign_message")
+    def sign_message(self, message: str | bytes) -> str:
+        """EIP-191 signature of a text message, or of raw bytes such as a hash."""
+        if self.signer is not None:
+            return self.signer.sign_message(self.account_name, message)
+
+        signed = self.account.sign_message(
+            encode_defunct(primitive=message)
+            if isinstance(message, bytes)
+            else encode_defunct(text=message)
+        )
+        return self.w3.to_hex(signed.signature)
+
+    @metrics.timed("sign_transaction")
     def sign_transaction(self, tx_dict: dict):
+        if self.signer is not None:
+            return self.signer.sign_transaction(self.account_name, tx_dict)
 
         return self.w3.eth.account.sign_transaction(
             transaction_dict=tx_dict, private_key=self.private_key
@@ -186,8 +607,25 @@ class EvmClient:
             else self.w3.eth.get_balance(address)
         )
 
+    @property
+    def gas_oracle(self) -> GasOracle:
+        return GasOracle.for_network(
+            self.network, lambda: get_shared_w3(self.network, self.proxy)
+        )
+
+    def get_fees(self) -> GasSuggestion:
+        """The oracle's suggestion, or plain eth_gasPrice while the oracle is stale."""
+        oracle = self.gas_oracle
+
+        if not oracle.stale:
+            return oracle.current()
+
+        gas_price = self.w3.eth.gas_price
+        return GasSuggestion(0, 0, gas_price, gas_price)
+
     def get_gas_price(self):
-        return self.w3.eth.gas_price
+        with metrics.timer("gas_price", rpc=endpoint_label(self.rpc)):
+            return self.get_fees().gas_price
 
     @staticmethod
     def get_human_amount(amount_wei) -> float:
@@ -213,73 +651,64 @@ class EvmClient:
             f"{self.account_name} | {self.address} | {self.module_name} | Changing rpc"
         )
 
-        current_rpc_index = self.network.rpc_list.index(self.rpc)
+        next_rpc = self.rpc_pool.select(exclude=self.rpc)
 
-        if len(self.network.rpc_list) > 1:
-            if current_rpc_index == len(self.network.rpc_list) - 1:
-                next_rpc = self.network.rpc_list[0]
-            else:
-                next_rpc = self.network.rpc_list[current_rpc_index + 1]
-        else:
-            next_rpc = self.network.rpc_list[0]
-
-        self.w3 = Web3(
-            Web3.HTTPProvider(endpoint_uri=next_rpc, request_kwargs=self.request_kwargs)
-        )
+        self.w3 = self.make_w3(next_rpc)
         self.rpc = next_rpc
         self.logger.debug(
             f"{self.account_name} | {self.address} | {self.module_name} | RPC successfully changed! New RPC - {next_rpc}"
         )
         return self
 
-    def wait_for_funds_on_dest_chain(
-        self, destination_network: Network, original_balance: int
-    ) -> bool:
+    def leave_rpc(self):
+        """Moves off an endpoint whose circuit opened (or that fell behind) mid-run, if another one is up."""
+        next_rpc = self.rpc_pool.select(exclude=self.rpc)
 
-        destination_client = EvmClient(
-            account_name=self.account_name,
-            private_key=self.private_key,
-            network=destination_network,
-            user_agent=self.user_agent,
-            proxy=self.proxy,
-        )
+        if next_rpc == self.rpc or not self.rpc_pool.is_available(next_rpc):
+            return
 
-        exc_count = 0
-        runtime = 0
-        while True:
-            if runtime > MAX_DST_WAIT_TIME:
-                return False
-            start = time.time()
-            try:
+        self.logger.debug(
+            f"{self.account_name} | {self.address} | {self.module_name} | {self.rpc} unavailable, moving to {next_rpc}"
+        )
+        self._w3 = self.make_w3(next_rpc)
+        self.rpc = next_rpc
 
-                dst_bal = destination_client.get_eth_balance()
-                if dst_bal > original_balance:
-                    self.logger.success(
-                        f"{self.account_name} | {self.address} | {self.module_name} | ETH arrived on {destination_client.network.name}"
-                    )
+    def rotate_proxy(self):
+        if ProxyPool.active is None:
+            return self
 
-                    return True
+        self.proxy = ProxyPool.active.rebind(self.address)
+        self.request_kwargs = {
+            **self.request_kwargs,
+            "proxies": {"http": self.proxy, "https": self.proxy},
+        }
+        self.w3 = self.make_w3(self.rpc)
+        return self
 
-                time.sleep(random.randint(10, 15))
+    def wait_for_funds_on_dest_chain(
+        self, destination_network: Network, original_balance: int
+    ) -> bool:
+        """Blocks until the balance on the destination network exceeds original_balance."""
+        watcher = FundsWatcher.for_network(
+            destination_network,
+            lambda: get_shared_w3(destination_network, self.proxy),
+        )
 
-                end = time.time()
-                runtime += int(end - start)
+        balance = watcher.watch(
+            self.address, original_balance, MAX_DST_WAIT_TIME
+        ).result()
 
-            except Exception as e:
-                self.logger.warning(
-                    f"{self.account_name} | {self.address} | {self.module_name} | Something went wrong while waiting on balance - {e}"
-                )
-                self.logger.warning(
-                    f"{self.account_name} | {self.address} | {self.module_name} | Retrying..."
-                )
+        if balance is None:
+            self.logger.warning(
+                f"{self.account_name} | {self.address} | {self.module_name} | Funds didn't arrive on {destination_network.name} after {MAX_DST_WAIT_TIME} seconds"
+            )
+            return False
 
-                exc_count += 1
-                if exc_count >= MAX_RETRIES:
-                    self.change_rpc()
-                    exc_count = 0
+        self.logger.success(
+            f"{self.account_name} | {self.address} | {self.module_name} | ETH arrived on {destination_network.name}"
+        )
 
-                time.sleep(random.randint(10, 15))
-                end = time.time()
+        return True
 
     def wait_for_gas(self):
 
@@ -287,24 +716,9 @@ class EvmClient:
             f"Waiting for gas on mainnet to be less than {ACCEPTABLE_L1_GWEI}gwei..."
         )
 
-        manager = EvmClient(
-            account_name=self.account_name,
-            private_key=self.private_key,
-            network=Binance,
-            user_agent=self.user_agent,
-            proxy=self.proxy,
-        )
-
         desired_gas_wei = Web3.to_wei(ACCEPTABLE_L1_GWEI, "gwei")
 
-        while True:
-            try:
-                gas_price = manager.get_gas_price()
-                if gas_price <= desired_gas_wei:
-                    return True
-                time.sleep(random.randint(5, 10))
-            except Exception:
-                time.sleep(random.randint(5, 10))
+        return self.borrow(Binance).gas_oracle.wait_below(desired_gas_wei)
 
     def get_allowance(
         self,
@@ -364,5 +778,5 @@ class EvmClient:
         signed = self.sign_transaction(tx_dict=transaction)
 
         if signed:
-            return self.send_tx(signed)
+            return self.send_tx(signed, transaction["nonce"])
         return
@@ -0,0 +1,142 @@
+import time
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from loguru import logger
+from web3 import Web3
+from .multicall import Multicall
+from ..models.network import Network
+from ..common.constants import MAX_DST_WAIT_TIME, FUNDS_POLL_INTERVAL
+
+
+@dataclass
+class BalanceWaiter:
+    address: str
+    threshold: int
+    future: Future
+    deadline: float
+
+
+class FundsWatcher:
+    """
+    Waits for native balances on one destination network for every wallet at
+    once: a background thread reads all watched balances in one multicall per
+    new block and resolves each waiter's future with the balance as soon as it
+    is above the waiter's threshold, or with None once its deadline passes.
+    """
+
+    _watchers: dict[tuple, "FundsWatcher"] = {}
+    _watchers_lock = threading.Lock()
+
+    def __init__(self, network: Network, w3_factory):
+        self.network = network
+        self.w3_factory = w3_factory
+        self.w3: Web3 = w3_factory()
+        self.waiters: list[BalanceWaiter] = []
+        self.last_block = None
+        self.use_multicall = True
+        self._thread = None
+        self._lock = threading.Lock()
+        self.module_name = "FundsWatcher"
+
+    @classmethod
+    def for_network(cls, network: Network, w3_factory) -> "FundsWatcher":
+        key = (network.chain_id, tuple(network.rpc_list))
+
+        with cls._watchers_lock:
+            if key not in cls._watchers:
+                cls._watchers[key] = cls(network, w3_factory)
+            return cls._watchers[key]
+
+    def watch(
+        self, address: str, threshold: int, timeout: float = MAX_DST_WAIT_TIME
+    ) -> Future:
+        future = Future()
+
+        with self._lock:
+            self.waiters.append(
+                BalanceWaiter(
+                    Web3.to_checksum_address(address),
+                    threshold,
+                    future,
+                    time.time() + timeout,
+                )
+            )
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+        return future
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self.waiters:
+                    self._thread = None
+                    self.last_block = None
+                    return
+
+            try:
+                head = self.w3.eth.block_number
+                if head != self.last_block:
+                    self.poll()
+                    self.last_block = head
+            except Exception as e:
+                logger.warning(
+                    f"{self.module_name} | {self.network.name} | Failed to read balances: {str(e)}"
+                )
+                self.w3 = self.w3_factory()
+
+            self.expire()
+            time.sleep(FUNDS_POLL_INTERVAL)
+
+    def get_balances(self, addresses: list[str]) -> list[int]:
+        if self.use_multicall:
+            try:
+                multicall = Multicall(self.w3)
+                results = multicall.aggregate3(
+                    [multicall.balance_call(address) for address in addresses]
+                )
+                return [multicall.decode(["uint256"], result) for result in results]
+            except Exception as e:
+                # No Multicall3 on this network, stick to batched eth_getBalance
+                logger.debug(
+                    f"{self.module_name} | {self.network.name} | Multicall unavailable: {str(e)}"
+                )
+                self.use_multicall = False
+
+        with self.w3.batch_requests() as batch:
+            for address in addresses:
+                batch.add(self.w3.eth.get_balance(address))
+            return batch.execute()
+
+    def poll(self):
+        with self._lock:
+            addresses = list(dict.fromkeys(waiter.address for waiter in self.waiters))
+
+        if not addresses:
+            return
+
+        balances = dict(zip(addresses, self.get_balances(addresses)))
+
+        with self._lock:
+            funded = [
+                waiter
+                for waiter in self.waiters
+                if (balances.get(waiter.address) or 0) > waiter.threshold
+            ]
+            self.waiters = [waiter for waiter in self.waiters if waiter not in funded]
+
+        for waiter in funded:
+            waiter.future.set_result(balances[waiter.address])
+
+    def expire(self):
+        now = time.time()
+
+        with self._lock:
+            expired = [waiter for waiter in self.waiters if waiter.deadline < now]
+            self.waiters = [waiter for waiter in self.waiters if waiter.deadline >= now]
+
+        for waiter in expired:
+            waiter.future.set_result(None)
@@ -0,0 +1,73 @@
+import threading
+from collections import defaultdict, deque
+from loguru import logger
+from ..common.constants import (
+    GAS_MODEL_MIN_SAMPLES,
+    GAS_MODEL_MAX_SPREAD,
+    GAS_MODEL_MARGIN,
+)
+
+
+class GasModel:
+    """
+    Learns gas limits per (contract, function selector, proof length) from
+    real eth_estimateGas results. Once enough consistent samples exist it
+    predicts the limit with a safety margin, otherwise returns None so the
+    caller falls back to eth_estimateGas. Receipts only feed it failures:
+    an out-of-gas revert drops what was learned for that key.
+    """
+
+    def __init__(
+        self,
+        min_samples: int = GAS_MODEL_MIN_SAMPLES,
+        max_spread: float = GAS_MODEL_MAX_SPREAD,
+        margin: float = GAS_MODEL_MARGIN,
+    ):
+        self.min_samples = min_samples
+        self.max_spread = max_spread
+        self.margin = margin
+        self.samples: dict[tuple, deque] = defaultdict(lambda: deque(maxlen=50))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(contract_address: str, selector: str, proof_len: int) -> tuple:
+        return contract_address.lower(), selector.lower(), proof_len
+
+    def observe(self, key: tuple, gas: int):
+        with self._lock:
+            self.samples[key].append(int(gas))
+
+    def reset(self, key: tuple):
+        with self._lock:
+            self.samples.pop(key, None)
+
+        logger.warning(f"Gas model - dropped samples for {key}")
+
+    def predict(self, key: tuple) -> int | None:
+        with self._lock:
+            samples = list(self.samples.get(key, ()))
+
+            if len(samples) < self.min_samples:
+                self.misses += 1
+                return None
+
+            mean = sum(samples) / len(samples)
+            if (max(samples) - min(samples)) / mean > self.max_spread:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return int(max(samples) * self.margin)
+
+    def on_receipt(self, key: tuple, gas_limit: int, receipt):
+        """A mined revert that burnt the whole limit means the prediction was too low."""
+        if receipt is None or receipt["status"] == 1:
+            return
+
+        if receipt["gasUsed"] >= gas_limit:
+            self.reset(key)
+
+
+gas_model = GasModel()
@@ -0,0 +1,143 @@
+import time
+import threading
+import statistics
+from dataclasses import dataclass
+from loguru import logger
+from web3 import Web3
+from ..models.network import Network
+from ..common.constants import (
+    GAS_BASE_FEE_MULTIPLIER,
+    GAS_ORACLE_INTERVAL,
+    GAS_ORACLE_MAX_FAILURES,
+    GAS_FEE_HISTORY_BLOCKS,
+    GAS_REWARD_PERCENTILES,
+    GAS_PRIORITY_PERCENTILE,
+)
+
+
+@dataclass(frozen=True)
+class GasSuggestion:
+    block: int
+    base_fee: int
+    priority_fee: int
+    gas_price: int
+
+    @property
+    def max_fee(self) -> int:
+        return self.priority_fee + int(self.base_fee * GAS_BASE_FEE_MULTIPLIER)
+
+
+class GasOracle:
+    """
+    One fee estimator per network. A background thread refreshes the fee
+    suggestion from eth_feeHistory once per new block; every client reads the
+    cached value and wait_for_gas callers block on a condition instead of
+    polling eth_gasPrice themselves. After GAS_ORACLE_MAX_FAILURES failed
+    refreshes in a row the suggestion is dropped and the oracle is stale
+    until a refresh succeeds, callers then ask eth_gasPrice directly.
+    """
+
+    _oracles: dict[tuple, "GasOracle"] = {}
+    _oracles_lock = threading.Lock()
+
+    def __init__(self, network: Network, w3_factory):
+        self.network = network
+        self.w3_factory = w3_factory
+        self.w3: Web3 = w3_factory()
+        self.suggestion: GasSuggestion | None = None
+        self.failures = 0
+        self.module_name = "GasOracle"
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def for_network(cls, network: Network, w3_factory) -> "GasOracle":
+        key = (network.chain_id, tuple(network.rpc_list))
+
+        with cls._oracles_lock:
+            if key not in cls._oracles:
+                cls._oracles[key] = cls(network, w3_factory)
+            return cls._oracles[key]
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh()
+                self.failures = 0
+            except Exception as e:
+                logger.warning(
+                    f"{self.module_name} | {self.network.name} | Refresh failed: {str(e)}"
+                )
+                self.w3 = self.w3_factory()
+                self.failed()
+
+            time.sleep(GAS_ORACLE_INTERVAL)
+
+    def failed(self):
+        self.failures += 1
+
+        if self.failures != GAS_ORACLE_MAX_FAILURES:
+            return
+
+        logger.warning(
+            f"{self.module_name} | {self.network.name} | {self.failures} refreshes failed, dropping the last suggestion"
+        )
+        with self._condition:
+            self.suggestion = None
+
+    @property
+    def stale(self) -> bool:
+        return self.failures >= GAS_ORACLE_MAX_FAILURES
+
+    def refresh(self):
+        block = self.w3.eth.block_number
+
+        if self.suggestion is not None and block <= self.suggestion.block:
+            return
+
+        suggestion = self.from_fee_history(block)
+
+        with self._condition:
+            self.suggestion = suggestion
+            self._condition.notify_all()
+
+    def from_fee_history(self, block: int) -> GasSuggestion:
+        try:
+            history = self.w3.eth.fee_history(
+                GAS_FEE_HISTORY_BLOCKS, block, GAS_REWARD_PERCENTILES
+            )
+        except Exception:
+            # Node without eth_feeHistory: plain gas price, no tip split
+            gas_price = self.w3.eth.gas_price
+            return GasSuggestion(block, 0, gas_price, gas_price)
+
+        base_fee = history["baseFeePerGas"][-1]
+        column = GAS_REWARD_PERCENTILES.index(GAS_PRIORITY_PERCENTILE)
+        rewards = [reward[column] for reward in history.get("reward") or [] if reward]
+        priority_fee = int(statistics.median(rewards)) if rewards else 0
+
+        if base_fee == 0 and priority_fee == 0:
+            gas_price = self.w3.eth.gas_price
+            return GasSuggestion(block, 0, gas_price, gas_price)
+
+        return GasSuggestion(block, base_fee, priority_fee, base_fee + priority_fee)
+
+    def current(self, timeout: float | None = 30) -> GasSuggestion:
+        with self._condition:
+            if self.suggestion is None:
+                self._condition.wait_for(lambda: self.suggestion is not None, timeout)
+
+            if self.suggestion is None:
+                raise TimeoutError(f"{self.module_name} has no fee data yet")
+
+            return self.suggestion
+
+    def wait_below(self, gas_price: int, timeout: float | None = None) -> bool:
+        """Blocks until the suggested gas price is at or below gas_price."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self.suggestion is not None
+                and self.suggestion.gas_price <= gas_price,
+                timeout,
+            )
@@ -0,0 +1,54 @@
+from web3 import Web3
+from loguru import logger
+from ..utils.helpers import read_json
+from ..common.constants import MULTICALL_CHUNK_SIZE
+
+MULTICALL_DATA = read_json("contracts/Multicall3.json")
+
+
+class Multicall:
+
+    def __init__(self, w3: Web3, chunk_size: int = MULTICALL_CHUNK_SIZE):
+        self.w3 = w3
+        self.chunk_size = chunk_size
+        self.contract = self.w3.eth.contract(
+            address=Web3.to_checksum_address(MULTICALL_DATA["address"]),
+            abi=MULTICALL_DATA["abi"],
+        )
+        self.module_name = "Multicall3"
+
+    def balance_call(self, address: str) -> tuple[str, bytes]:
+        return (
+            self.contract.address,
+            self.contract.encode_abi("getEthBalance", args=[address]),
+        )
+
+    @staticmethod
+    def contract_call(contract, fn_name: str, *args) -> tuple[str, bytes]:
+        return contract.address, contract.encode_abi(fn_name, args=list(args))
+
+    def aggregate3(self, calls: list[tuple[str, bytes]]) -> list[tuple[bool, bytes]]:
+        """Runs (target, calldata) pairs through aggregate3 in chunks, failures allowed."""
+        results = []
+
+        for start in range(0, len(calls), self.chunk_size):
+            chunk = calls[start : start + self.chunk_size]
+            logger.debug(
+                f"{self.module_name} | Calling chunk {start // self.chunk_size + 1} with {len(chunk)} calls"
+            )
+            results.extend(
+                self.contract.functions.aggregate3(
+                    [(target, True, data) for target, data in chunk]
+                ).call()
+            )
+
+        return results
+
+    def decode(self, types: list[str], result: tuple[bool, bytes]):
+        success, data = result
+
+        if not success or not data:
+            return None
+
+        values = self.w3.codec.decode(types, data)
+        return values[0] if len(values) == 1 else values
@@ -0,0 +1,199 @@
+import threading
+from loguru import logger
+from web3 import Web3
+from ..models.network import Network
+from ..utils.retry import ErrorClass, classify
+from ..common.constants import WALLET_CACHE_SIZE
+
+
+class NonceManager:
+    """
+    Hands out nonces for one wallet on one network without asking the node
+    every time: the pending nonce is read once and then incremented locally,
+    so several transactions of the same wallet can be in flight together.
+    Nonce-too-low and replacement-underpriced errors trigger a resync, nonces
+    that were taken but never broadcast are remembered as gaps and filled by
+    fill_gaps (re-broadcast of the signed tx or a cancelling self-transfer).
+    """
+
+    _managers: dict[tuple, "NonceManager"] = {}
+    _managers_lock = threading.Lock()
+
+    RESYNC_ERRORS = (ErrorClass.NONCE_TOO_LOW, ErrorClass.UNDERPRICED)
+
+    def __init__(self, network: Network, address: str, w3_factory):
+        self.network = network
+        self.address = Web3.to_checksum_address(address)
+        self.w3_factory = w3_factory
+        self.next_nonce: int | None = None
+        self.in_flight: dict[int, bytes] = {}
+        self.gaps: set[int] = set()
+        self._lock = threading.Lock()
+        self.module_name = "NonceManager"
+
+    @classmethod
+    def for_wallet(cls, network: Network, address: str, w3_factory) -> "NonceManager":
+        key = (network.chain_id, tuple(network.rpc_list), address.lower())
+
+        with cls._managers_lock:
+            manager = cls._managers.pop(key, None)
+            if manager is None:
+                manager = cls(network, address, w3_factory)
+                cls._evict_idle()
+            # Most recently used last, so eviction starts with finished wallets
+            cls._managers[key] = manager
+            return manager
+
+    @classmethod
+    def _evict_idle(cls):
+        """
+        Drops the oldest managers with nothing in flight once there are more
+        than WALLET_CACHE_SIZE. A wallet that comes back later just syncs its
+        nonce from the node again.
+        """
+        excess = len(cls._managers) - WALLET_CACHE_SIZE + 1
+        if excess <= 0:
+            return
+
+        for key in [key for key, manager in cls._managers.items() if manager.idle][
+            :excess
+        ]:
+            del cls._managers[key]
+
+    @property
+    def idle(self) -> bool:
+        with self._lock:
+            return not self.in_flight and not self.gaps
+
+    def sync(self) -> int:
+        """Catches up with the node's pending nonce, never moves back below nonces already handed out."""
+        pending = self.w3_factory().eth.get_transaction_count(self.address, "pending")
+
+        with self._lock:
+            self.next_nonce = max(pending, self.next_nonce or 0)
+            self.gaps = {nonce for nonce in self.gaps if nonce >= pending}
+            self.in_flight = {
+                nonce: raw_tx
+                for nonce, raw_tx in self.in_flight.items()
+                if nonce >= pending
+            }
+            return self.next_nonce
+
+    def seed(self, pending: int):
+        """Uses a nonce the caller already fetched instead of a separate request."""
+        with self._lock:
+            if self.next_nonce is None:
+                self.next_nonce = pending
+
+    def reserve(self) -> int:
+        """The lowest gap first, so a failed broadcast doesn't block the nonces above it."""
+        if self.next_nonce is None:
+            self.sync()
+
+        with self._lock:
+            if self.gaps:
+                nonce = min(self.gaps)
+                self.gaps.discard(nonce)
+                return nonce
+
+            nonce = self.next_nonce
+            self.next_nonce += 1
+            return nonce
+
+    def release(self, nonce: int):
+        """Gives back a nonce that was never broadcast."""
+        with self._lock:
+            if self.next_nonce == nonce + 1:
+                self.next_nonce = nonce
+            else:
+                self.gaps.add(nonce)
+
+    def sent(self, nonce: int, raw_tx: bytes):
+        with self._lock:
+            self.in_flight[nonce] = raw_tx
+
+    def confirmed(self, nonce: int, receipt):
+        """Forgets an in-flight transaction once it is mined; a None receipt (timeout) keeps it."""
+        if receipt is None:
+            return
+
+        with self._lock:
+            self.in_flight.pop(nonce, None)
+
+    @staticmethod
+    def slot_taken(error_class: ErrorClass, exc: Exception) -> bool:
+        """Whether the error means some transaction already holds the nonce."""
+        if error_class in (ErrorClass.NONCE_TOO_LOW, ErrorClass.ALREADY_KNOWN):
+            return True
+        return error_class == ErrorClass.UNDERPRICED and "replacement" in str(exc)
+
+    def failed(self, nonce: int | None, exc: Exception):
+        """Called when broadcasting a transaction raised."""
+        error_class = classify(exc)
+
+        if nonce is not None and not self.slot_taken(error_class, exc):
+            self.release(nonce)
+
+        if error_class not in self.RESYNC_ERRORS:
+            return
+
+        logger.warning(
+            f"{self.module_name} | {self.address} | {error_class.value}, resyncing nonce"
+        )
+
+        try:
+            self.sync()
+        except Exception as e:
+            logger.warning(
+                f"{self.module_name} | {self.address} | Resync failed: {str(e)}"
+            )
+            with self._lock:
+                self.next_nonce = None
+
+    def fill_gaps(self, cancel) -> int:
+        """
+        Unblocks the nonces between the last mined one and the next to hand
+        out: in-flight transactions are re-broadcast, gaps with nothing signed
+        are cancelled with cancel(nonce). Returns how many were handled.
+        """
+        w3 = self.w3_factory()
+        mined = w3.eth.get_transaction_count(self.address, "latest")
+
+        with self._lock:
+            upper = self.next_nonce if self.next_nonce is not None else mined
+            stuck = {
+                nonce: self.in_flight.get(nonce)
+                for nonce in range(mined, upper)
+                if nonce in self.in_flight or nonce in self.gaps
+            }
+            # Taken out now so reserve() can't hand out a nonce being cancelled
+            self.gaps -= set(stuck)
+
+        for nonce, raw_tx in stuck.items():
+            try:
+                if raw_tx is not None:
+                    w3.eth.send_raw_transaction(raw_tx)
+                else:
+                    cancel(nonce)
+            except Exception as e:
+                # "already known" / "nonce too low" mean the slot is taken, which is the goal
+                logger.debug(
+                    f"{self.module_name} | {self.address} | Nonce {nonce}: {str(e)}"
+                )
+                if raw_tx is None and not self.slot_taken(classify(e), e):
+                    with self._lock:
+                        self.gaps.add(nonce)
+
+        with self._lock:
+            self.in_flight = {
+                nonce: raw_tx
+                for nonce, raw_tx in self.in_flight.items()
+                if nonce >= mined
+            }
+
+        if stuck:
+            logger.info(
+                f"{self.module_name} | {self.address} | Unblocked {len(stuck)} nonces from {mined}"
+            )
+
+        return len(stuck)
@@ -0,0 +1,166 @@
+import time
+import random
+import threading
+import requests
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from loguru import logger
+from ..common.constants import (
+    PROXY_CHECK_URL,
+    PROXY_CHECK_TIMEOUT,
+    PROXY_QUARANTINE_BASE,
+    PROXY_QUARANTINE_MAX,
+    PROXY_PENALTY_DECAY,
+)
+
+
+@dataclass
+class ProxyState:
+    proxy: str
+    latency: float | None = None
+    penalty: int = 0
+    penalized_at: float = 0.0
+    quarantined_until: float = 0.0
+    successes: int = 0
+    failures: int = 0
+
+    @property
+    def quarantined(self) -> bool:
+        return self.quarantined_until > time.time()
+
+    def decay(self):
+        """One penalty point off per PROXY_PENALTY_DECAY seconds since the last failure."""
+        if not self.penalty:
+            return
+
+        steps = int((time.time() - self.penalized_at) // PROXY_PENALTY_DECAY)
+        if steps > 0:
+            self.penalty = max(0, self.penalty - steps)
+            self.penalized_at += steps * PROXY_PENALTY_DECAY
+
+
+class ProxyPool:
+    """
+    Health-checked proxy pool: picks fast proxies more often, quarantines
+    failing ones for an exponentially growing (and decaying) time and keeps
+    each wallet on the same proxy for the whole login + claim flow. Penalties
+    decay on successes and over time, bindings are released once a wallet is
+    done.
+    """
+
+    active: "ProxyPool | None" = None
+
+    def __init__(self, proxies: list[str], check_url: str = PROXY_CHECK_URL):
+        self.check_url = check_url
+        self.states = {proxy: ProxyState(proxy) for proxy in dict.fromkeys(proxies)}
+        self.bindings: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.module_name = "ProxyPool"
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def check(self, proxy: str):
+        start = time.time()
+        try:
+            response = requests.get(
+                self.check_url,
+                proxies={"http": proxy, "https": proxy},
+                timeout=PROXY_CHECK_TIMEOUT,
+            )
+            # Auth failures and gateway errors come from the proxy, not the API
+            if response.status_code in (407, 502, 504):
+                raise Exception(f"proxy answered {response.status_code}")
+        except Exception as e:
+            logger.debug(f"{self.module_name} | {proxy} failed check: {str(e)}")
+            self.report(proxy, False)
+            return
+
+        self.report(proxy, True, time.time() - start)
+
+    def check_all(self, workers: int = 32):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(self.check, self.states))
+
+        healthy = [state for state in self.states.values() if not state.quarantined]
+        logger.debug(
+            f"{self.module_name} | {len(healthy)}/{len(self.states)} proxies reachable {self.check_url}"
+        )
+
+    def report(self, proxy: str, ok: bool, latency: float | None = None):
+        state = self.states.get(proxy)
+        if state is None:
+            return
+
+        with self._lock:
+            state.decay()
+
+            if ok:
+                state.successes += 1
+                state.penalty = max(0, state.penalty - 1)
+                if latency is not None:
+                    state.latency = (
+                        latency
+                        if state.latency is None
+                        else 0.8 * state.latency + 0.2 * latency
+                    )
+                return
+
+            state.failures += 1
+            state.penalty += 1
+            state.penalized_at = time.time()
+            state.quarantined_until = time.time() + min(
+                PROXY_QUARANTINE_MAX, PROXY_QUARANTINE_BASE * 2 ** (state.penalty - 1)
+            )
+
+    def select(self, exclude: str | None = None) -> str | None:
+        with self._lock:
+            return self._select(exclude)
+
+    def _select(self, exclude: str | None) -> str | None:
+        candidates = [
+            state
+            for state in self.states.values()
+            if not state.quarantined and state.proxy != exclude
+        ]
+
+        if not candidates:
+            # Everything is quarantined: use whatever comes back first
+            candidates = (
+                sorted(
+                    (s for s in self.states.values() if s.proxy != exclude),
+                    key=lambda s: s.quarantined_until,
+                )[:1]
+                or list(self.states.values())[:1]
+            )
+
+        if not candidates:
+            return None
+
+        weights = [1 / (state.latency or 1.0) for state in candidates]
+        return random.choices(candidates, weights=weights)[0].proxy
+
+    def bind(self, wallet: str) -> str | None:
+        """Sticky proxy for a wallet; rebinds only if the bound proxy is quarantined."""
+        with self._lock:
+            proxy = self.bindings.get(wallet)
+
+            if proxy is None or self.states[proxy].quarantined:
+                proxy = self._select(None)
+                self.bindings[wallet] = proxy
+
+        return proxy
+
+    def release(self, wallets):
+        """Forgets the bindings of wallets that are done."""
+        with self._lock:
+            for wallet in wallets:
+                self.bindings.pop(wallet, None)
+
+    def rebind(self, wallet: str) -> str | None:
+        with self._lock:
+            proxy = self._select(self.bindings.get(wallet))
+            self.bindings[wallet] = proxy
+
+        logger.debug(f"{self.module_name} | {wallet} moved to {proxy}")
+        return proxy
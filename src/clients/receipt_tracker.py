@@ -0,0 +1,233 @@
+import time
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from loguru import logger
+from web3 import Web3
+from web3.datastructures import AttributeDict
+from web3._utils.method_formatters import receipt_formatter
+from ..models.network import Network
+from ..common.constants import (
+    TX_RECEIPT_TIMEOUT,
+    RECEIPT_POLL_INTERVAL,
+    RECEIPT_MAX_CATCHUP_BLOCKS,
+)
+
+
+@dataclass
+class PendingTx:
+    tx_hash: str
+    future: Future
+    deadline: float
+
+
+class ReceiptTracker:
+    """
+    Follows new blocks of a network on one background thread and resolves the
+    futures of every tracked transaction once it is included, so receipt
+    polling costs one eth_getBlockByNumber per block instead of one loop per wallet.
+    Blocks skipped while catching up, and transactions still open at their
+    deadline, are looked up by hash with eth_getTransactionReceipt instead.
+    Futures resolve with the receipt, or None when the transaction times out.
+    A transaction stays tracked until its receipt is in hand, so a failed
+    request only delays it and every future resolves by its deadline.
+    """
+
+    _trackers: dict[tuple, "ReceiptTracker"] = {}
+    _trackers_lock = threading.Lock()
+
+    def __init__(self, network: Network, w3_factory):
+        self.network = network
+        self.w3_factory = w3_factory
+        self.w3: Web3 = w3_factory()
+        self.pending: dict[str, PendingTx] = {}
+        self.last_block = None
+        self.lookups: set[str] = set()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.module_name = "ReceiptTracker"
+
+    @classmethod
+    def for_network(cls, network: Network, w3_factory) -> "ReceiptTracker":
+        key = (network.chain_id, tuple(network.rpc_list))
+
+        with cls._trackers_lock:
+            if key not in cls._trackers:
+                cls._trackers[key] = cls(network, w3_factory)
+            return cls._trackers[key]
+
+    def track(
+        self,
+        tx_hash: str,
+        callback=None,
+        timeout: int = TX_RECEIPT_TIMEOUT,
+        lookup: bool = False,
+    ) -> Future:
+        """lookup: the transaction may already be mined, check it by hash on the next poll."""
+        if not isinstance(tx_hash, str):
+            tx_hash = Web3.to_hex(tx_hash)
+        elif not tx_hash.startswith("0x"):
+            tx_hash = f"0x{tx_hash}"
+
+        future = Future()
+
+        if callback is not None:
+            future.add_done_callback(lambda f: callback(tx_hash, f.result()))
+
+        with self._lock:
+            self.pending[tx_hash.lower()] = PendingTx(
+                tx_hash, future, time.time() + timeout
+            )
+            if lookup:
+                self.lookups.add(tx_hash.lower())
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+        return future
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self.pending:
+                    self._thread = None
+                    self.last_block = None
+                    return
+
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning(
+                    f"{self.module_name} | {self.network.name} | Failed to process new blocks: {str(e)}"
+                )
+                self.w3 = self.w3_factory()
+
+            try:
+                self.expire()
+            except Exception as e:
+                logger.warning(
+                    f"{self.module_name} | {self.network.name} | Failed to expire receipts: {str(e)}"
+                )
+
+            time.sleep(RECEIPT_POLL_INTERVAL)
+
+    def poll(self):
+        head = self.w3.eth.block_number
+
+        if self.last_block is None:
+            # Also cover a block mined between sending and the first poll
+            self.last_block = head - 2
+
+        start = max(self.last_block + 1, head - RECEIPT_MAX_CATCHUP_BLOCKS + 1)
+
+        if start > self.last_block + 1:
+            logger.warning(
+                f"{self.module_name} | {self.network.name} | Skipped blocks {self.last_block + 1}-{start - 1}, looking receipts up by hash"
+            )
+            with self._lock:
+                self.lookups.update(self.pending)
+
+        for block_number in range(start, head + 1):
+            block = self.w3.eth.get_block(block_number)
+            self.match(block["transactions"])
+            self.last_block = block_number
+
+        with self._lock:
+            keys, self.lookups = self.lookups, set()
+
+        try:
+            self.lookup(keys)
+        except Exception:
+            with self._lock:
+                self.lookups.update(keys)
+            raise
+
+    def lookup(self, keys):
+        """Resolves the tracked transactions among keys that are already mined."""
+        with self._lock:
+            pending = [self.pending[key] for key in keys if key in self.pending]
+
+        if pending:
+            self.resolve(pending, self.receipts(pending))
+
+    def match(self, transactions):
+        """Resolves the tracked transactions among a block's transaction hashes."""
+        with self._lock:
+            included = [
+                self.pending[key]
+                for key in (Web3.to_hex(tx).lower() for tx in transactions)
+                if key in self.pending
+            ]
+
+        if not included:
+            return
+
+        receipts = self.receipts(included)
+        self.resolve(included, receipts)
+
+        # Included but the node has no receipt yet, ask again on the next poll
+        with self._lock:
+            self.lookups.update(
+                tx.tx_hash.lower()
+                for tx, receipt in zip(included, receipts)
+                if receipt is None
+            )
+
+    def receipts(self, pending: list[PendingTx]) -> list[dict | None]:
+        """eth_getTransactionReceipt for every transaction in one batch, None if not mined."""
+        responses = self.w3.provider.make_batch_request(
+            [("eth_getTransactionReceipt", [tx.tx_hash]) for tx in pending]
+        )
+
+        if not isinstance(responses, list):
+            raise Exception(f"receipt batch refused: {responses}")
+
+        return [
+            (
+                AttributeDict.recursive(receipt_formatter(response["result"]))
+                if isinstance(response, dict) and response.get("result")
+                else None
+            )
+            for response in responses
+        ] + [None] * (len(pending) - len(responses))
+
+    def resolve(self, pending: list[PendingTx], receipts: list[dict | None]):
+        """Stops tracking the transactions that have a receipt and resolves their futures."""
+        resolved = []
+
+        with self._lock:
+            for tx, receipt in zip(pending, receipts):
+                key = tx.tx_hash.lower()
+                if receipt is not None and self.pending.get(key) is tx:
+                    resolved.append((self.pending.pop(key), receipt))
+
+        for tx, receipt in resolved:
+            tx.future.set_result(receipt)
+
+    def expire(self):
+        now = time.time()
+
+        with self._lock:
+            expired = [
+                key
+                for key, pending_tx in self.pending.items()
+                if pending_tx.deadline < now
+            ]
+
+        if not expired:
+            return
+
+        # Last chance for a receipt the block scan missed
+        try:
+            self.lookup(expired)
+        except Exception as e:
+            logger.warning(
+                f"{self.module_name} | {self.network.name} | Receipt lookup failed: {str(e)}"
+            )
+
+        with self._lock:
+            expired = [self.pending.pop(key) for key in expired if key in self.pending]
+
+        for pending_tx in expired:
+            pending_tx.future.set_result(None)
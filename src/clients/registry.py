@@ -0,0 +1,127 @@
+import threading
+import requests
+from collections import OrderedDict
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+from eth_account import Account
+from ..common.constants import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    WALLET_CACHE_SIZE,
+)
+
+
+class ClientRegistry:
+    """
+    Process-wide cache of keep-alive HTTP connection pools, Web3 instances and
+    derived accounts so wallets sharing an endpoint and proxy reuse the same
+    TCP/TLS connections instead of handshaking through the proxy every time.
+    Accounts and addresses are kept for the last WALLET_CACHE_SIZE wallets
+    only, wallets are streamed a chunk at a time.
+    """
+
+    pool_connections = HTTP_POOL_CONNECTIONS
+    pool_maxsize = HTTP_POOL_MAXSIZE
+
+    _adapters: dict[str | None, HTTPAdapter] = {}
+    _sessions: dict[tuple[str, str | None], requests.Session] = {}
+    _web3s: dict[tuple[str, str | None], Web3] = {}
+    _addresses: OrderedDict[str, str] = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, pool_connections: int, pool_maxsize: int):
+        cls.pool_connections = pool_connections
+        cls.pool_maxsize = pool_maxsize
+
+    @classmethod
+    def adapter(cls, proxy: str | None) -> HTTPAdapter:
+        with cls._lock:
+            if proxy not in cls._adapters:
+                cls._adapters[proxy] = HTTPAdapter(
+                    pool_connections=cls.pool_connections,
+                    pool_maxsize=cls.pool_maxsize,
+                )
+            return cls._adapters[proxy]
+
+    @classmethod
+    def mount(cls, session: requests.Session, proxy: str | None) -> requests.Session:
+        adapter = cls.adapter(proxy)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @classmethod
+    def api_session(cls, proxy: str | None) -> requests.Session:
+        """Fresh cookie jar per wallet, shared connection pool per proxy."""
+        return cls.mount(requests.Session(), proxy)
+
+    @classmethod
+    def rpc_session(cls, endpoint: str, proxy: str | None) -> requests.Session:
+        key = (endpoint, proxy)
+
+        with cls._lock:
+            session = cls._sessions.get(key)
+
+        if session is None:
+            session = cls.mount(requests.Session(), proxy)
+            with cls._lock:
+                session = cls._sessions.setdefault(key, session)
+
+        return session
+
+    @classmethod
+    def web3(cls, endpoint: str, proxy: str | None, provider_factory) -> Web3:
+        """Returns the Web3 bound to (endpoint, proxy), building it with provider_factory(session) once."""
+        key = (endpoint, proxy)
+
+        with cls._lock:
+            w3 = cls._web3s.get(key)
+
+        if w3 is None:
+            w3 = Web3(provider_factory(cls.rpc_session(endpoint, proxy)))
+            with cls._lock:
+                w3 = cls._web3s.setdefault(key, w3)
+
+        return w3
+
+    @staticmethod
+    @lru_cache(maxsize=WALLET_CACHE_SIZE)
+    def account(private_key: str):
+        return Account.from_key(private_key)
+
+    @classmethod
+    def register_addresses(cls, private_keys: list[str], addresses: list[str]):
+        """Addresses derived elsewhere, e.g. while sharding the key file."""
+        with cls._lock:
+            for private_key, address in zip(private_keys, addresses):
+                cls._remember(private_key, address)
+
+    @classmethod
+    def _remember(cls, private_key: str, address: str):
+        cls._addresses[private_key] = address
+        cls._addresses.move_to_end(private_key)
+
+        while len(cls._addresses) > WALLET_CACHE_SIZE:
+            cls._addresses.popitem(last=False)
+
+    @classmethod
+    def address(cls, private_key: str) -> str:
+        """
+        Address of a private key. With the SigningService the wallet is only
+        known by its address, which is then returned as is (checksummed).
+        """
+        if Web3.is_address(private_key):
+            return Web3.to_checksum_address(private_key)
+
+        with cls._lock:
+            address = cls._addresses.get(private_key)
+
+        if address is None:
+            address = cls.account(private_key).address
+
+        with cls._lock:
+            cls._remember(private_key, address)
+
+        return address
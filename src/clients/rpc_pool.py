@@ -0,0 +1,202 @@
+import time
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from loguru import logger
+from ..models.network import Network
+from .registry import ClientRegistry
+from .proxy_pool import ProxyPool
+from ..utils.rate_limiter import rate_limiter
+from ..common.constants import (
+    RPC_STATS_WINDOW,
+    RPC_CIRCUIT_FAILURES,
+    RPC_CIRCUIT_COOLDOWN,
+    RPC_MAX_BLOCK_LAG,
+    RPC_PROBE_INTERVAL,
+)
+
+
+@dataclass
+class EndpointStats:
+    url: str
+    latencies: deque = field(default_factory=lambda: deque(maxlen=RPC_STATS_WINDOW))
+    outcomes: deque = field(default_factory=lambda: deque(maxlen=RPC_STATS_WINDOW))
+    consecutive_failures: int = 0
+    circuit_open_until: float = 0.0
+    block_number: int = 0
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(0.5)
+
+    @property
+    def p95(self) -> float:
+        return self.percentile(0.95)
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+
+class RpcPool:
+    """
+    Process-wide view of how every RPC of a network behaves. Clients report
+    call latency and failures, the pool hands out endpoints weighted by health
+    and keeps failing ones out of rotation until a probe succeeds again.
+    """
+
+    _pools: dict[tuple, "RpcPool"] = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, network: Network):
+        self.network = network
+        self.stats = {url: EndpointStats(url) for url in network.rpc_list}
+        self.last_probe = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self.module_name = "RpcPool"
+
+    @classmethod
+    def for_network(cls, network: Network) -> "RpcPool":
+        key = (network.chain_id, tuple(network.rpc_list))
+
+        with cls._pools_lock:
+            if key not in cls._pools:
+                cls._pools[key] = cls(network)
+            return cls._pools[key]
+
+    def record(self, url: str, latency: float, ok: bool):
+        stats = self.stats.get(url)
+        if stats is None:
+            return
+
+        with self._lock:
+            stats.outcomes.append(ok)
+
+            if ok:
+                stats.latencies.append(latency)
+                stats.consecutive_failures = 0
+                stats.circuit_open_until = 0.0
+                return
+
+            stats.consecutive_failures += 1
+            if (
+                stats.consecutive_failures >= RPC_CIRCUIT_FAILURES
+                and stats.circuit_open_until < time.time()
+            ):
+                stats.circuit_open_until = time.time() + RPC_CIRCUIT_COOLDOWN
+                logger.warning(
+                    f"{self.module_name} | {self.network.name} | Circuit opened for {url} after {stats.consecutive_failures} failures"
+                )
+
+    def record_block(self, url: str, block_number: int):
+        stats = self.stats.get(url)
+        if stats is not None:
+            stats.block_number = max(stats.block_number, block_number)
+
+    def block_lag(self, url: str) -> int:
+        head = max(stats.block_number for stats in self.stats.values())
+        return head - self.stats[url].block_number
+
+    def is_available(self, url: str) -> bool:
+        stats = self.stats[url]
+        if stats.circuit_open_until > time.time():
+            return False
+        return self.block_lag(url) <= RPC_MAX_BLOCK_LAG or stats.block_number == 0
+
+    def score(self, url: str) -> float:
+        """Lower is better: median latency inflated by error rate and tail latency."""
+        stats = self.stats[url]
+        latency = stats.p50 + 0.25 * stats.p95 or 0.05
+        return latency * (1 + 10 * stats.error_rate)
+
+    def select(self, exclude: str | None = None) -> str:
+        self.maybe_probe()
+
+        candidates = [
+            url for url in self.stats if url != exclude and self.is_available(url)
+        ]
+
+        if not candidates:
+            candidates = [url for url in self.stats if url != exclude] or list(
+                self.stats
+            )
+            return min(candidates, key=lambda url: self.stats[url].circuit_open_until)
+
+        weights = [1 / self.score(url) for url in candidates]
+        return random.choices(candidates, weights=weights)[0]
+
+    def maybe_probe(self):
+        with self._lock:
+            if self._probing or time.time() - self.last_probe < RPC_PROBE_INTERVAL:
+                return
+            self._probing = True
+
+        threading.Thread(target=self.probe, daemon=True).start()
+
+    def probe(self):
+        """Queries eth_blockNumber on every endpoint, including ones with an open circuit."""
+        try:
+            threads = [
+                threading.Thread(target=self.probe_endpoint, args=(url,), daemon=True)
+                for url in self.stats
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            self.last_probe = time.time()
+            self._probing = False
+
+    def probe_endpoint(self, url: str):
+        """Goes through the shared session and rate limiter like any other call, and a proxy if any."""
+        proxy = ProxyPool.active.select() if ProxyPool.active else None
+        session = ClientRegistry.rpc_session(url, proxy)
+
+        rate_limiter.acquire(url, proxy)
+        start = time.time()
+        try:
+            response = session.post(
+                url,
+                json={
+                    "jsonrpc": "2.0",
+                    "method": "eth_blockNumber",
+                    "params": [],
+                    "id": 1,
+                },
+                proxies={"http": proxy, "https": proxy},
+                timeout=10,
+            )
+            rate_limiter.report(url, proxy, response.status_code == 429)
+            response.raise_for_status()
+            block_number = int(response.json()["result"], 16)
+        except Exception as e:
+            logger.debug(f"{self.module_name} | Probe of {url} failed: {str(e)}")
+            self.record(url, time.time() - start, False)
+            return
+
+        self.record(url, time.time() - start, True)
+        self.record_block(url, block_number)
+
+    def summary(self) -> list[dict]:
+        return [
+            {
+                "url": url,
+                "p50": round(stats.p50, 3),
+                "p95": round(stats.p95, 3),
+                "error_rate": round(stats.error_rate, 3),
+                "block_lag": self.block_lag(url),
+                "circuit_open": stats.circuit_open_until > time.time(),
+            }
+            for url, stats in self.stats.items()
+        ]
@@ -0,0 +1,252 @@
+import os
+import asyncio
+import threading
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import Future, ProcessPoolExecutor
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from loguru import logger
+from ..utils.wallet_source import iter_lines, shard_of
+from ..common.constants import SIGNER_BATCH_SIZE, SIGNER_BATCH_WINDOW
+
+# Worker process state: each worker reads the key file itself, the main
+# process only ever sends account names (1-based key file lines) and payloads
+_WORKER_KEYS: list[str] = []
+_WORKER_SHARD: tuple[int, int] | None = None
+
+
+def _init_worker(path: str, shard: tuple[int, int] | None):
+    global _WORKER_KEYS, _WORKER_SHARD
+    _WORKER_KEYS = list(iter_lines(path))
+    _WORKER_SHARD = shard
+
+
+def _key_count() -> int:
+    return len(_WORKER_KEYS)
+
+
+def _in_shard(address: str) -> bool:
+    if _WORKER_SHARD is None:
+        return True
+    return shard_of(address, _WORKER_SHARD[1]) == _WORKER_SHARD[0]
+
+
+def _derive_addresses(start: int, end: int) -> list[tuple[int, str]]:
+    """(account name, address) of the keys in [start, end) that are in the shard."""
+    wallets = []
+    for index, key in enumerate(_WORKER_KEYS[start:end], start=start):
+        address = Account.from_key(key).address
+        if _in_shard(address):
+            wallets.append((index + 1, address))
+    return wallets
+
+
+def _match_addresses(start: int, end: int, addresses: frozenset) -> list[int]:
+    """Account names in [start, end) whose address is in addresses."""
+    return [
+        account_name
+        for account_name, address in _derive_addresses(start, end)
+        if address.lower() in addresses
+    ]
+
+
+def _write_keys(path: str, account_names: list[int]):
+    with open(path, "w") as f:
+        for account_name in account_names:
+            f.write(_WORKER_KEYS[account_name - 1] + "\n")
+
+
+def _key(account_name: int) -> str:
+    return _WORKER_KEYS[account_name - 1]
+
+
+def _encode_message(message: str | bytes):
+    """Text is signed as is, bytes (e.g. a 32-byte hash) as raw EIP-191 data."""
+    if isinstance(message, bytes):
+        return encode_defunct(primitive=message)
+    return encode_defunct(text=message)
+
+
+def _sign_messages(items: list[tuple[int, str | bytes]]) -> list[str]:
+    return [
+        "0x"
+        + Account.sign_message(
+            _encode_message(message), _key(account_name)
+        ).signature.hex()
+        for account_name, message in items
+    ]
+
+
+def _sign_transactions(items: list[tuple[int, dict]]) -> list[tuple[bytes, bytes]]:
+    signed = [
+        Account.sign_transaction(tx, _key(account_name)) for account_name, tx in items
+    ]
+    return [(bytes(tx.raw_transaction), bytes(tx.hash)) for tx in signed]
+
+
+@dataclass
+class SignedTx:
+    raw_transaction: bytes
+    hash: bytes
+
+
+class _SignBatcher:
+    def __init__(self, service: "SigningService", func):
+        self.service = service
+        self.func = func
+        self._pending = []
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def submit(self, account_name: int, payload) -> Future:
+        future = Future()
+        flush_now = False
+
+        with self._lock:
+            self._pending.append((account_name, payload, future))
+
+            if len(self._pending) >= self.service.batch_size:
+                flush_now = True
+            elif self._timer is None:
+                self._timer = threading.Timer(SIGNER_BATCH_WINDOW, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if flush_now:
+            self.flush()
+
+        return future
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._timer = None
+
+        if not pending:
+            return
+
+        batch = self.service.pool.submit(
+            self.func, [(account_name, payload) for account_name, payload, _ in pending]
+        )
+
+        def resolve(done: Future):
+            try:
+                results = done.result()
+            except Exception as e:
+                for *_, future in pending:
+                    future.set_exception(e)
+                return
+
+            for (*_, future), result in zip(pending, results):
+                future.set_result(result)
+
+        batch.add_done_callback(resolve)
+
+
+class SigningService:
+    """
+    Process pool that derives addresses and signs messages/transactions in
+    batches, keeping secp256k1 work off the main interpreter. Work submitted
+    by many runners is grouped into batches of batch_size.
+
+    Every worker reads the key file itself, private keys never reach the main
+    process: wallets are addressed by account name, their 1-based line in the
+    key file, as yielded by iter_wallets().
+    """
+
+    def __init__(
+        self,
+        path: str,
+        shard: tuple[int, int] | None = None,
+        workers: int | None = None,
+        batch_size: int = SIGNER_BATCH_SIZE,
+    ):
+        self.path = path
+        self.shard = shard
+        self.batch_size = batch_size
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(path, shard),
+        )
+        self.keys_amt = self.pool.submit(_key_count).result()
+        self._messages = _SignBatcher(self, _sign_messages)
+        self._transactions = _SignBatcher(self, _sign_transactions)
+
+    def _map_ranges(self, func, *args):
+        """Yields func(start, end, *args) over the key file in order, a few batches ahead."""
+        ranges = iter(range(0, self.keys_amt, self.batch_size))
+        window = deque()
+
+        for start in ranges:
+            window.append(self.pool.submit(func, start, start + self.batch_size, *args))
+            if len(window) >= self.workers * 2:
+                yield window.popleft().result()
+
+        while window:
+            yield window.popleft().result()
+
+    def iter_wallets(self):
+        """(account_name, address) of every key in the shard, derived in the workers."""
+        derived = 0
+
+        for chunk in self._map_ranges(_derive_addresses):
+            derived += len(chunk)
+            yield from chunk
+
+        logger.debug(f"Signer - derived {derived} addresses on {self.workers} workers")
+
+    def export_keys(self, path: str):
+        """
+        Rewrites a file of failed addresses into their private keys, in the
+        workers, so the failed wallets file can be fed back as a key file.
+        """
+        addresses = frozenset(address.lower() for address in iter_lines(path))
+        if not addresses:
+            return
+
+        account_names = [
+            account_name
+            for chunk in self._map_ranges(_match_addresses, addresses)
+            for account_name in chunk
+        ]
+        self.pool.submit(_write_keys, path, account_names).result()
+
+        if len(account_names) != len(addresses):
+            logger.warning(
+                f"Signer - {len(addresses) - len(account_names)} failed addresses not found in {self.path}"
+            )
+
+    def submit_message(self, account_name: int, message: str | bytes) -> Future:
+        return self._messages.submit(account_name, message)
+
+    def submit_transaction(self, account_name: int, tx: dict) -> Future:
+        future = Future()
+
+        def wrap(done: Future):
+            try:
+                raw_transaction, tx_hash = done.result()
+            except Exception as e:
+                future.set_exception(e)
+                return
+            future.set_result(SignedTx(raw_transaction, tx_hash))
+
+        self._transactions.submit(account_name, dict(tx)).add_done_callback(wrap)
+        return future
+
+    def sign_message(self, account_name: int, message: str | bytes) -> str:
+        return self.submit_message(account_name, message).result()
+
+    def sign_transaction(self, account_name: int, tx: dict) -> SignedTx:
+        return self.submit_transaction(account_name, tx).result()
+
+    async def async_sign_message(self, account_name: int, message: str | bytes) -> str:
+        return await asyncio.wrap_future(self.submit_message(account_name, message))
+
+    async def async_sign_transaction(self, account_name: int, tx: dict) -> SignedTx:
+        return await asyncio.wrap_future(self.submit_transaction(account_name, tx))
+
+    def shutdown(self):
+        self.pool.shutdown(wait=True)
@@ -4,3 +4,111 @@ GAS_PRICE_MULTIPLIER = 1.02
 GAS_AMT_MULTIPLIER = 1.02
 MAX_DST_WAIT_TIME = 300
 ACCEPTABLE_L1_GWEI = 1
+PROXY_MAX_IN_FLIGHT = 2
+RPC_MAX_IN_FLIGHT = 16
+MIN_CLAIM_BALANCE = 0.00012
+MULTICALL_CHUNK_SIZE = 600
+RPC_BATCH_WINDOW = 0.005
+DEFAULT_RPC_BATCH_SIZE = 10
+# Per-endpoint overrides for nodes that reject or throttle larger batches
+RPC_BATCH_LIMITS = {}
+RPC_STATS_WINDOW = 200
+RPC_CIRCUIT_FAILURES = 5
+RPC_CIRCUIT_COOLDOWN = 30
+RPC_MAX_BLOCK_LAG = 5
+RPC_PROBE_INTERVAL = 15
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+TX_RECEIPT_TIMEOUT = 180
+RECEIPT_POLL_INTERVAL = 1
+RECEIPT_MAX_CATCHUP_BLOCKS = 50
+FUNDS_POLL_INTERVAL = 1
+CLAIM_GAS_LIMIT = 150000
+BUNDLE_MAX_GAS_PRICE_GWEI = 3
+BUNDLE_PATH = "data/claim_bundle.jsonl"
+BUNDLE_POLL_INTERVAL = 0.25
+# Longest wait for the claim window to open, None: until the contract deadline
+BUNDLE_WINDOW_TIMEOUT = None
+BUNDLE_BROADCAST_WORKERS = 64
+BROADCAST_RACE = False
+# Extra endpoints (private relays, builders) raced alongside Network.rpc_list
+PRIVATE_RELAYS = []
+XTERIO_API_URL = "https://api.xter.io"
+AIRDROP_ID = "1b13f586-53bf-4827-8c17-5deed560653d"
+CLAIM_CACHE_PATH = "data/claim_cache.sqlite"
+SIGNER_BATCH_SIZE = 64
+SIGNER_BATCH_WINDOW = 0.01
+RETRY_BASE_DELAY = 1
+RETRY_MAX_DELAY = 30
+RETRY_BUDGET_RATIO = 0.2
+RETRY_BUDGET_MIN = 20
+# Requests per second per destination host / outgoing proxy, tuned at runtime
+DEFAULT_HOST_RATE = 20
+HOST_RATE_LIMITS = {"api.xter.io": 5}
+PROXY_RATE_LIMIT = 4
+RATE_LIMIT_BURST = 2
+RATE_LIMIT_INCREASE = 0.05
+RATE_LIMIT_DECREASE = 0.5
+RATE_LIMIT_MAX_FACTOR = 4
+PROXY_CHECK_URL = "https://api.xter.io"
+PROXY_CHECK_TIMEOUT = 10
+PROXY_QUARANTINE_BASE = 30
+PROXY_QUARANTINE_MAX = 600
+# A proxy's penalty drops by one for every this many seconds without a failure
+PROXY_PENALTY_DECAY = 300
+GAS_ORACLE_INTERVAL = 1
+# maxFeePerGas = this * base fee + tip: room for six full blocks of +12.5% base fee
+GAS_BASE_FEE_MULTIPLIER = 2
+# Failed refreshes in a row before the last suggestion is dropped as stale
+GAS_ORACLE_MAX_FAILURES = 5
+GAS_FEE_HISTORY_BLOCKS = 10
+GAS_REWARD_PERCENTILES = [25, 50, 75]
+GAS_PRIORITY_PERCENTILE = 50
+GAS_MODEL_MIN_SAMPLES = 3
+GAS_MODEL_MAX_SPREAD = 0.1
+GAS_MODEL_MARGIN = 1.2
+CLAIM_INDEX_PATH = "data/claim_index.sqlite"
+# None: look the contract's deploy block up with eth_getCode
+CLAIM_INDEX_START_BLOCK = None
+CLAIM_INDEX_CONFIRMATIONS = 3
+LOGS_CHUNK_SIZE = 2000
+LOGS_MIN_CHUNK = 50
+LOGS_MAX_CHUNK = 50000
+RUN_JOURNAL_PATH = "data/run_journal.sqlite"
+WALLET_CHUNK_SIZE = 1000
+# Per-wallet caches (accounts, addresses, idle nonce managers) keep this many wallets
+WALLET_CACHE_SIZE = 4 * WALLET_CHUNK_SIZE
+METRICS_PREFIX = "xterio_claimer"
+METRICS_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    120,
+    300,
+)
+# Revert reasons (lowercase substrings) that may clear up, e.g. window not open yet.
+# Other reverts are skipped, RPC errors are always retried
+SIMULATION_RETRY_REASONS = ("not start", "not open", "too early", "paused")
+SIMULATION_MAX_ROUNDS = 3
+SIMULATION_RETRY_DELAY = 10
+MERKLE_VERIFY_ROUNDS = 3
+MERKLE_RETRY_DELAY = 1
+RELAYER_KEY_PATH = "data/relayer_key.txt"
+RELAYER_MAX_IN_FLIGHT = 64
+# How long a beneficiary's delegateClaim signature stays valid, in seconds
+RELAYER_SIG_TTL = 3600
+# What beneficiaries sign for delegateClaim, copy it from the verified contract:
+# keccak256 of these fields, abi.encodePacked ("packed") or abi.encode ("abi"),
+# signed as an EIP-191 message. Fields: chainid, contract, beneficiary, amount, deadline
+DELEGATE_CLAIM_FIELDS = ("chainid", "contract", "beneficiary", "amount", "deadline")
+DELEGATE_CLAIM_ENCODING = "packed"
@@ -0,0 +1,131 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from web3 import Web3
+from loguru import logger
+from ..models.network import Network
+from ..clients.evm_client import EvmClient, get_shared_w3
+from ..clients.receipt_tracker import ReceiptTracker
+from ..clients.broadcaster import RaceBroadcaster, raw_tx_hash
+from ..utils.retry import ErrorClass, classify
+from ..common.constants import (
+    GAS_PRICE_MULTIPLIER,
+    BUNDLE_MAX_GAS_PRICE_GWEI,
+    BUNDLE_POLL_INTERVAL,
+    BUNDLE_WINDOW_TIMEOUT,
+    BUNDLE_BROADCAST_WORKERS,
+    TX_RECEIPT_TIMEOUT,
+    PRIVATE_RELAYS,
+)
+
+
+def bundle_gas_price(w3: Web3) -> int:
+    """Current gas price with the usual markup, capped at BUNDLE_MAX_GAS_PRICE_GWEI."""
+    return min(
+        int(w3.eth.gas_price * GAS_PRICE_MULTIPLIER),
+        Web3.to_wei(BUNDLE_MAX_GAS_PRICE_GWEI, "gwei"),
+    )
+
+
+def save_bundle(path: str, entries: list[dict]):
+    with open(path, "w") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+    logger.success(f"Saved {len(entries)} signed claims to {path}")
+
+
+def load_bundle(path: str) -> list[dict]:
+    with open(path, "r") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def wait_for_window(
+    contract,
+    poll_interval: float = BUNDLE_POLL_INTERVAL,
+    timeout: float | None = BUNDLE_WINDOW_TIMEOUT,
+) -> bool:
+    """
+    Blocks until isTimeValid() is true. Gives up (returns False) once the
+    latest block is past the contract's deadline(), when the window can't
+    open anymore, or after timeout seconds.
+    """
+    logger.info("Waiting for the claim window to open...")
+
+    give_up_at = time.time() + timeout if timeout is not None else None
+    deadline = None
+
+    while give_up_at is None or time.time() < give_up_at:
+        try:
+            if contract.functions.isTimeValid().call():
+                logger.success("Claim window is open!")
+                return True
+
+            if deadline is None:
+                deadline = contract.functions.deadline().call()
+
+            if contract.w3.eth.get_block("latest")["timestamp"] > deadline:
+                logger.error(f"Claim window closed at {deadline}, not broadcasting")
+                return False
+        except Exception as e:
+            logger.warning(f"Claim window check failed: {str(e)}")
+
+        time.sleep(poll_interval)
+
+    logger.error(f"Claim window didn't open within {timeout}s")
+    return False
+
+
+def broadcast_bundle(
+    entries: list[dict], network: Network, workers: int = BUNDLE_BROADCAST_WORKERS
+) -> dict[str, dict | None]:
+    """
+    Pushes every pre-signed transaction with eth_sendRawTransaction at once and
+    waits for the receipts. With --broadcast-race each one goes to every RPC
+    and private relay. Returns address -> receipt (None if it never landed).
+    """
+
+    def send_raw(entry):
+        if EvmClient.broadcast_race:
+            return RaceBroadcaster(
+                [*network.rpc_list, *PRIVATE_RELAYS],
+                lambda endpoint: get_shared_w3(network, entry["proxy"], endpoint),
+            ).broadcast(entry["raw_tx"])
+
+        try:
+            return get_shared_w3(network, entry["proxy"]).eth.send_raw_transaction(
+                entry["raw_tx"]
+            )
+        except Exception as e:
+            # Already in the node's pool, e.g. from an earlier broadcast
+            if classify(e) != ErrorClass.ALREADY_KNOWN:
+                raise
+            return raw_tx_hash(entry["raw_tx"])
+
+    def send(entry):
+        try:
+            tx_hash = send_raw(entry)
+        except Exception as e:
+            logger.warning(
+                f"{entry['account_name']} | {entry['address']} | Broadcast failed: {str(e)}"
+            )
+            return entry, None
+
+        return entry, ReceiptTracker.for_network(
+            network, lambda: get_shared_w3(network, entry["proxy"])
+        ).track(tx_hash, timeout=TX_RECEIPT_TIMEOUT)
+
+    start = time.time()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        submitted = list(executor.map(send, entries))
+
+    logger.info(
+        f"Broadcast {sum(future is not None for _, future in submitted)}/{len(entries)} transactions in {time.time() - start:.2f}s"
+    )
+
+    results = {}
+    for entry, future in submitted:
+        results[entry["address"]] = future.result() if future is not None else None
+
+    return results
@@ -0,0 +1,137 @@
+import time
+from loguru import logger
+from web3 import Web3
+from ..storage.claim_index import ClaimIndex
+from ..common.constants import (
+    MAX_RETRIES,
+    LOGS_CHUNK_SIZE,
+    LOGS_MIN_CHUNK,
+    LOGS_MAX_CHUNK,
+    CLAIM_INDEX_START_BLOCK,
+    CLAIM_INDEX_CONFIRMATIONS,
+)
+
+XCLAIM_TOPIC = Web3.to_hex(Web3.keccak(text="XClaim(address,uint256)"))
+XDELEGATE_CLAIM_TOPIC = Web3.to_hex(
+    Web3.keccak(text="XDelegateClaim(address,address,uint256)")
+)
+
+
+def topic_address(topic) -> str:
+    return Web3.to_checksum_address(Web3.to_bytes(topic)[-20:])
+
+
+def decode_claim_log(log) -> dict:
+    topics = [Web3.to_hex(topic) for topic in log["topics"]]
+
+    if topics[0] == XCLAIM_TOPIC:
+        address, delegator = topic_address(log["topics"][1]), None
+    else:
+        delegator = topic_address(log["topics"][1])
+        address = topic_address(log["topics"][2])
+
+    return {
+        "address": address,
+        "amount": int.from_bytes(Web3.to_bytes(log["data"])[:32], "big"),
+        "tx_hash": Web3.to_hex(log["transactionHash"]),
+        "block": log["blockNumber"],
+        "delegator": delegator,
+    }
+
+
+def find_deploy_block(w3: Web3, address: str, head: int) -> int:
+    """Binary search on eth_getCode; needs an archive node, falls back to 0."""
+    low, high = 0, head
+
+    try:
+        while low < high:
+            middle = (low + high) // 2
+            if w3.eth.get_code(address, middle):
+                high = middle
+            else:
+                low = middle + 1
+    except Exception as e:
+        logger.warning(
+            f"Claim indexer - couldn't find the deploy block, scanning from 0: {str(e)}"
+        )
+        return 0
+
+    return low
+
+
+class ClaimIndexer:
+    """
+    Scans eth_getLogs for XClaim/XDelegateClaim in block ranges that grow while
+    the node answers and halve when it refuses (range or result limits,
+    timeouts). Every finished range is committed to the ClaimIndex together
+    with its last block, so an interrupted scan resumes from there.
+    """
+
+    def __init__(self, w3_factory, contract_address: str, index: ClaimIndex):
+        self.w3_factory = w3_factory
+        self.w3: Web3 = w3_factory()
+        self.contract_address = Web3.to_checksum_address(contract_address)
+        self.index = index
+        self.chunk = LOGS_CHUNK_SIZE
+
+    def get_logs(self, from_block: int, to_block: int):
+        return self.w3.eth.get_logs(
+            {
+                "address": self.contract_address,
+                "fromBlock": from_block,
+                "toBlock": to_block,
+                "topics": [[XCLAIM_TOPIC, XDELEGATE_CLAIM_TOPIC]],
+            }
+        )
+
+    def start_block(self, head: int) -> int:
+        if self.index.last_block is not None:
+            return self.index.last_block + 1
+
+        if CLAIM_INDEX_START_BLOCK is not None:
+            return CLAIM_INDEX_START_BLOCK
+
+        return find_deploy_block(self.w3, self.contract_address, head)
+
+    def sync(self) -> int:
+        """Indexes every confirmed block not scanned yet, returns the number of new claims."""
+        head = self.w3.eth.block_number - CLAIM_INDEX_CONFIRMATIONS
+        block = self.start_block(head)
+        found = 0
+        failures = 0
+
+        logger.info(f"Claim indexer - scanning blocks {block}..{head}")
+
+        while block <= head:
+            to_block = min(block + self.chunk - 1, head)
+
+            try:
+                logs = self.get_logs(block, to_block)
+            except Exception as e:
+                failures += 1
+
+                if self.chunk <= LOGS_MIN_CHUNK and failures >= MAX_RETRIES:
+                    raise
+
+                self.chunk = max(self.chunk // 2, LOGS_MIN_CHUNK)
+                logger.debug(
+                    f"Claim indexer - eth_getLogs {block}..{to_block} failed, chunk down to {self.chunk}: {str(e)}"
+                )
+
+                if failures >= MAX_RETRIES:
+                    self.w3 = self.w3_factory()
+                time.sleep(min(failures, 5))
+                continue
+
+            failures = 0
+            events = [decode_claim_log(log) for log in logs]
+            self.index.add(events, to_block)
+            found += len(events)
+            block = to_block + 1
+            self.chunk = min(self.chunk * 2, LOGS_MAX_CHUNK)
+
+        logger.info(
+            f"Claim indexer - {found} new claims, {len(self.index)} indexed up to block {head}"
+        )
+
+        return found
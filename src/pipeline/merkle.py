@@ -0,0 +1,144 @@
+import time
+import threading
+from eth_abi import encode
+from eth_abi.packed import encode_packed
+from eth_utils import keccak, to_bytes
+from loguru import logger
+from web3 import Web3
+from ..clients.multicall import Multicall
+from ..common.constants import MERKLE_VERIFY_ROUNDS, MERKLE_RETRY_DELAY
+
+
+def leaf_packed(address: str, amount: int) -> bytes:
+    return keccak(encode_packed(["address", "uint256"], [address, amount]))
+
+
+def leaf_abi(address: str, amount: int) -> bytes:
+    return keccak(encode(["address", "uint256"], [address, amount]))
+
+
+def leaf_double_abi(address: str, amount: int) -> bytes:
+    return keccak(keccak(encode(["address", "uint256"], [address, amount])))
+
+
+# Leaf layouts used by common whitelist contracts, tried in this order
+LEAF_SCHEMES = {
+    "packed": leaf_packed,
+    "abi": leaf_abi,
+    "double_abi": leaf_double_abi,
+}
+
+
+def process_proof(leaf: bytes, proof: list[str]) -> bytes:
+    """OpenZeppelin MerkleProof.processProof: sorted pair hashing."""
+    computed = leaf
+    for node in proof:
+        node = to_bytes(hexstr=node)
+        pair = computed + node if computed < node else node + computed
+        computed = keccak(pair)
+    return computed
+
+
+class MerkleVerifier:
+    """
+    Checks (address, amount, proof) against the on-chain merkleRoot without
+    any RPC call. The leaf layout is detected from the first proof that
+    matches; until then, undecided entries are checked with isWhitelisted().
+    """
+
+    def __init__(self, contract, merkle_root: bytes | str):
+        self.contract = contract
+        self.merkle_root = (
+            to_bytes(hexstr=merkle_root)
+            if isinstance(merkle_root, str)
+            else merkle_root
+        )
+        self.scheme = None
+        self._lock = threading.Lock()
+
+    def verify_local(self, address: str, amount: int, proof: list[str]) -> bool | None:
+        """True/False once the leaf layout is known, None if it can't be decided locally."""
+        address = Web3.to_checksum_address(address)
+
+        if self.scheme is not None:
+            leaf = LEAF_SCHEMES[self.scheme](address, amount)
+            return process_proof(leaf, proof) == self.merkle_root
+
+        for name, leaf_fn in LEAF_SCHEMES.items():
+            if process_proof(leaf_fn(address, amount), proof) == self.merkle_root:
+                with self._lock:
+                    if self.scheme is None:
+                        self.scheme = name
+                        logger.debug(f"Merkle verifier - detected '{name}' leaf layout")
+                return True
+
+        return None
+
+    def verify(self, address: str, amount: int, proof: list[str]) -> bool:
+        result = self.verify_local(address, amount, proof)
+
+        if result is None:
+            result = self.contract.functions.isWhitelisted(
+                Web3.to_checksum_address(address), amount, proof
+            ).call()
+
+        return result
+
+    def whitelisted_many(
+        self, entries: list[tuple[str, int, list[str]]]
+    ) -> list[bool | None]:
+        """isWhitelisted for every entry in one multicall, None where the call failed."""
+        multicall = Multicall(self.contract.w3)
+        calls = [
+            multicall.contract_call(
+                self.contract,
+                "isWhitelisted",
+                Web3.to_checksum_address(address),
+                amount,
+                proof,
+            )
+            for address, amount, proof in entries
+        ]
+
+        results = []
+        for result in multicall.aggregate3(calls):
+            try:
+                results.append(multicall.decode(["bool"], result))
+            except Exception:
+                results.append(None)
+
+        return results
+
+    def verify_many(
+        self,
+        entries: list[tuple[str, int, list[str]]],
+        rounds: int = MERKLE_VERIFY_ROUNDS,
+    ) -> list[bool | None]:
+        """
+        Local checks for everything, a multicall of isWhitelisted for the
+        undecided rest. A call that failed or didn't decode says nothing about
+        the proof: it is retried up to rounds times and stays None if it never
+        gets an answer.
+        """
+        results = [self.verify_local(*entry) for entry in entries]
+
+        for round_ in range(rounds):
+            undecided = [i for i, result in enumerate(results) if result is None]
+            if not undecided:
+                break
+
+            if round_ > 0:
+                time.sleep(MERKLE_RETRY_DELAY)
+
+            try:
+                answers = self.whitelisted_many([entries[i] for i in undecided])
+            except Exception as e:
+                logger.warning(
+                    f"Merkle verifier - isWhitelisted multicall failed: {str(e)}"
+                )
+                continue
+
+            for i, answer in zip(undecided, answers):
+                results[i] = answer
+
+        return results
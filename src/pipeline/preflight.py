@@ -0,0 +1,66 @@
+from web3 import Web3
+from loguru import logger
+from ..clients.multicall import Multicall
+from ..clients.registry import ClientRegistry
+from ..common.constants import MIN_CLAIM_BALANCE
+
+
+def run_preflight(
+    w3: Web3, contract, wallets: list[tuple[int, str]], need_balance: bool = True
+):
+    """
+    Checks claimed(), invalidated() and the native balance of every wallet in bulk
+    so nothing gets logged in to api.xter.io only to be skipped later. Without
+    need_balance (wallets that don't pay their own gas) the balance isn't read.
+
+    Returns three lists of (account_name, private_key):
+    wallets to claim, wallets without enough balance, wallets with nothing to claim.
+    """
+    multicall = Multicall(w3)
+    min_balance = Web3.to_wei(MIN_CLAIM_BALANCE, "ether")
+
+    addresses = [ClientRegistry.address(private_key) for _, private_key in wallets]
+
+    step = 3 if need_balance else 2
+
+    calls = []
+    for address in addresses:
+        calls.append(multicall.contract_call(contract, "claimed", address))
+        calls.append(multicall.contract_call(contract, "invalidated", address))
+        if need_balance:
+            calls.append(multicall.balance_call(address))
+
+    results = multicall.aggregate3(calls)
+
+    to_claim, unfunded, skipped = [], [], []
+
+    for i, wallet in enumerate(wallets):
+        account_name = wallet[0]
+        claimed, invalidated, balance = (
+            multicall.decode(["bool"], results[step * i]),
+            multicall.decode(["bool"], results[step * i + 1]),
+            (
+                multicall.decode(["uint256"], results[step * i + 2])
+                if need_balance
+                else None
+            ),
+        )
+
+        if claimed or invalidated:
+            logger.info(
+                f"{account_name} | {addresses[i]} | Preflight - {'already claimed' if claimed else 'invalidated'}, skipping..."
+            )
+            skipped.append(wallet)
+        elif balance is not None and balance < min_balance:
+            logger.info(
+                f"{account_name} | {addresses[i]} | Preflight - not enough balance to claim, skipping..."
+            )
+            unfunded.append(wallet)
+        else:
+            to_claim.append(wallet)
+
+    logger.debug(
+        f"Preflight complete! To claim: {len(to_claim)}, unfunded: {len(unfunded)}, nothing to claim: {len(skipped)}"
+    )
+
+    return to_claim, unfunded, skipped
@@ -0,0 +1,229 @@
+import time
+import threading
+from concurrent.futures import Future
+from eth_abi import encode
+from eth_abi.packed import encode_packed
+from eth_utils import keccak
+from loguru import logger
+from web3 import Web3
+from ..clients.evm_client import EvmClient, get_shared_w3
+from ..clients.receipt_tracker import ReceiptTracker
+from ..clients.gas_model import gas_model
+from ..storage.run_journal import Stage
+from ..utils.metrics import metrics, endpoint_label
+from ..common.constants import (
+    GAS_PRICE_MULTIPLIER,
+    RELAYER_MAX_IN_FLIGHT,
+    RELAYER_SIG_TTL,
+    TX_RECEIPT_TIMEOUT,
+    DELEGATE_CLAIM_FIELDS,
+    DELEGATE_CLAIM_ENCODING,
+)
+
+DIGEST_TYPES = {
+    "chainid": "uint256",
+    "contract": "address",
+    "beneficiary": "address",
+    "amount": "uint256",
+    "deadline": "uint256",
+}
+
+
+def delegate_claim_hash(
+    contract_address: str,
+    chain_id: int,
+    beneficiary: str,
+    amount: int,
+    deadline: int,
+    fields: tuple[str, ...] = DELEGATE_CLAIM_FIELDS,
+    encoding: str = DELEGATE_CLAIM_ENCODING,
+) -> bytes:
+    """
+    What a beneficiary signs (EIP-191) to let anyone call delegateClaim for it:
+    keccak256 of fields in the configured order and encoding. The ABI doesn't
+    say how the contract builds it, so DELEGATE_CLAIM_FIELDS/ENCODING have to
+    match the verified source; relayer mode also simulates every signed
+    delegateClaim first, so a mismatch reverts there instead of on-chain.
+    """
+    values = {
+        "chainid": chain_id,
+        "contract": Web3.to_checksum_address(contract_address),
+        "beneficiary": Web3.to_checksum_address(beneficiary),
+        "amount": amount,
+        "deadline": deadline,
+    }
+    types = [DIGEST_TYPES[field] for field in fields]
+    args = [values[field] for field in fields]
+
+    if encoding == "packed":
+        return keccak(encode_packed(types, args))
+    if encoding == "abi":
+        return keccak(encode(types, args))
+
+    raise ValueError(f"Unknown delegateClaim digest encoding: {encoding}")
+
+
+class Relayer:
+    """
+    Claims for many wallets from one funded hot wallet through delegateClaim.
+    Beneficiaries only sign the authorization off-chain, so they need no BNB.
+    The relayer's nonces come from its NonceManager and up to max_in_flight
+    transactions are pending at once; a slot frees up when a receipt (or the
+    receipt timeout) comes back.
+    """
+
+    def __init__(
+        self,
+        client: EvmClient,
+        contract,
+        max_in_flight: int = RELAYER_MAX_IN_FLIGHT,
+        sig_ttl: int = RELAYER_SIG_TTL,
+    ):
+        self.client = client
+        self.contract = contract
+        self.sig_ttl = sig_ttl
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self.module_name = "Relayer"
+
+    @property
+    def address(self) -> str:
+        return self.client.address
+
+    def check_balance(self) -> int:
+        """Reads the relayer's balance and seeds its NonceManager in the same batch."""
+        balance, nonce, _ = self.client.get_account_state()
+
+        logger.info(
+            f"{self.module_name} | {self.address} | Balance: {self.client.get_human_amount(balance)} {self.client.network.native_token}, nonce: {nonce}"
+        )
+
+        if balance == 0:
+            raise Exception(f"Relayer {self.address} has no balance")
+
+        return balance
+
+    def authorize(self, runner, amount: int, merkle_proofs: list[str]) -> dict:
+        """The beneficiary's off-chain part, goes through the SigningService when enabled."""
+        deadline = int(time.time()) + self.sig_ttl
+        message_hash = delegate_claim_hash(
+            self.contract.address,
+            self.client.network.chain_id,
+            runner.address,
+            amount,
+            deadline,
+        )
+
+        return {
+            "beneficiary": runner.address,
+            "amount": amount,
+            "proofs": merkle_proofs,
+            "deadline": deadline,
+            "sig": runner.sign_message(message_hash),
+        }
+
+    def delegate_claim(self, authorization: dict):
+        return self.contract.functions.delegateClaim(
+            authorization["beneficiary"],
+            authorization["amount"],
+            authorization["proofs"],
+            authorization["deadline"],
+            authorization["sig"],
+        )
+
+    def delegate_call(self, authorization: dict) -> tuple[str, str]:
+        """(from, calldata) of the relayer's delegateClaim, for simulation."""
+        return self.address, self.contract.encode_abi(
+            "delegateClaim",
+            args=[
+                authorization["beneficiary"],
+                authorization["amount"],
+                authorization["proofs"],
+                authorization["deadline"],
+                authorization["sig"],
+            ],
+        )
+
+    @metrics.timed("relay", lambda self, *_: {"rpc": endpoint_label(self.client.rpc)})
+    def relay(self, runner, authorization: dict) -> tuple[str, Future]:
+        """
+        Submits delegateClaim for an authorization signed by the runner's wallet
+        without waiting for the receipt. Returns (tx_hash, receipt future),
+        raises if nothing was sent.
+        """
+        claim_fn = self.delegate_claim(authorization)
+        gas_key = gas_model.key(
+            self.contract.address, claim_fn.selector, len(authorization["proofs"])
+        )
+        gas = gas_model.predict(gas_key)
+
+        if gas is None:
+            with metrics.timer("estimate_gas", rpc=endpoint_label(self.client.rpc)):
+                estimate = claim_fn.estimate_gas({"from": self.address})
+            gas_model.observe(gas_key, estimate)
+            gas = int(estimate * 1.02)
+
+        self._slots.acquire()
+        nonce = None
+
+        try:
+            nonce = self.client.get_nonce(self.address)
+            tx_data = claim_fn.build_transaction(
+                {
+                    "from": self.address,
+                    "nonce": nonce,
+                    "gasPrice": int(self.client.get_gas_price() * GAS_PRICE_MULTIPLIER),
+                    "gas": gas,
+                    "chainId": self.client.network.chain_id,
+                }
+            )
+            signed = self.client.sign_transaction(tx_data)
+        except Exception:
+            if nonce is not None:
+                self.client.nonce_manager.release(nonce)
+            self._slots.release()
+            raise
+
+        runner.record_signed(signed, nonce)
+
+        try:
+            submitted = self.client.submit_tx(signed, nonce)
+        except Exception:
+            self._slots.release()
+            self.fill_nonce_gaps()
+            raise
+
+        if not submitted:
+            self._slots.release()
+            self.fill_nonce_gaps()
+            raise Exception("No tx hash")
+
+        runner.record(Stage.BROADCAST)
+
+        _, future = submitted
+        future.add_done_callback(lambda _: self._slots.release())
+        future.add_done_callback(
+            lambda f: gas_model.on_receipt(gas_key, gas, f.result())
+        )
+        future.add_done_callback(lambda f: runner.record_receipt(f.result()))
+
+        return submitted
+
+    def fill_nonce_gaps(self) -> int:
+        """Unblocks the relayer's nonce stream right away instead of after a receipt timeout."""
+        return self.client.fill_nonce_gaps()
+
+    def recheck(self, tx_hashes: list[str]) -> dict[str, dict | None]:
+        """
+        Receipts of transactions that timed out, looked up again by hash: once
+        the nonces below them are unblocked they usually mine right away.
+        """
+        tracker = ReceiptTracker.for_network(
+            self.client.network,
+            lambda: get_shared_w3(self.client.network, self.client.proxy),
+        )
+        futures = {
+            tx_hash: tracker.track(tx_hash, timeout=TX_RECEIPT_TIMEOUT, lookup=True)
+            for tx_hash in tx_hashes
+        }
+
+        return {tx_hash: future.result() for tx_hash, future in futures.items()}
@@ -0,0 +1,93 @@
+import glob
+import json
+import threading
+from loguru import logger
+
+
+class FailedWallets:
+    """
+    Failed private keys, appended to the file as they happen instead of being
+    kept until the run ends. The file is only created on the first failure.
+    With the SigningService these are addresses, rewritten into keys by the
+    signer when the run ends.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def append(self, private_key: str):
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "w")
+
+            self._file.write(private_key + "\n")
+            self._file.flush()
+            self.count += 1
+
+    def extend(self, private_keys):
+        for private_key in private_keys:
+            self.append(private_key)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def save_shard_report(
+    path: str, shard: tuple[int, int], wallets: int, failed: FailedWallets
+):
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "shard": list(shard),
+                "wallets": wallets,
+                "failed": len(failed),
+                "failed_path": failed.path if len(failed) else None,
+            },
+            f,
+        )
+
+
+def merge_shard_reports(pattern: str, failed_path: str) -> tuple[int, int]:
+    """
+    Sums every per-shard report matching the pattern and concatenates their
+    failed keys into failed_path. Returns (wallets, failed).
+    """
+    reports = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path) as f:
+            reports.append(json.load(f))
+
+    if not reports:
+        logger.warning(f"No shard reports found for {pattern}")
+        return 0, 0
+
+    counts = {report["shard"][1] for report in reports}
+    done = {report["shard"][0] for report in reports}
+    if len(counts) > 1:
+        logger.warning(f"Shard reports come from different splits: {sorted(counts)}")
+    else:
+        missing = sorted(set(range(counts.pop())) - done)
+        if missing:
+            logger.warning(f"Missing reports for shards {missing}")
+
+    wallets = sum(report["wallets"] for report in reports)
+    failed = sum(report["failed"] for report in reports)
+
+    with open(failed_path, "w") as out:
+        for report in reports:
+            if report["failed_path"] is None:
+                continue
+            with open(report["failed_path"]) as f:
+                for line in f:
+                    out.write(line)
+
+    return wallets, failed
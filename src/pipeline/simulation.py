@@ -0,0 +1,141 @@
+from eth_abi import decode
+from loguru import logger
+from web3 import Web3
+from ..utils.metrics import metrics
+from ..common.constants import SIMULATION_RETRY_REASONS
+
+ERROR_SELECTOR = bytes.fromhex("08c379a0")  # Error(string)
+PANIC_SELECTOR = bytes.fromhex("4e487b71")  # Panic(uint256)
+
+
+class Verdict:
+    SEND = "send"
+    SKIP = "skip"
+    RETRY = "retry"
+
+
+def revert_data(error: dict) -> bytes | None:
+    """Revert payload of a JSON-RPC error, wherever the node put it."""
+    data = error.get("data")
+
+    if isinstance(data, dict):
+        data = data.get("data") or data.get("result")
+
+    if not isinstance(data, str) or not data.startswith("0x"):
+        return None
+
+    return Web3.to_bytes(hexstr=data)
+
+
+def decode_revert(data: bytes | None) -> str | None:
+    if not data:
+        return None
+
+    try:
+        if data[:4] == ERROR_SELECTOR:
+            return decode(["string"], data[4:])[0]
+        if data[:4] == PANIC_SELECTOR:
+            return f"panic {hex(decode(['uint256'], data[4:])[0])}"
+    except Exception:
+        pass
+
+    return f"custom error {Web3.to_hex(data[:4])}"
+
+
+def classify(response: dict | None) -> tuple[str, str | None]:
+    """
+    (verdict, reason) for one eth_call response. Reverts are skipped unless the
+    reason says the claim may go through later; anything that isn't a revert
+    (RPC error, missing response) is retried.
+    """
+    if response is None:
+        return Verdict.RETRY, "no response"
+
+    error = response.get("error")
+    if not error:
+        return Verdict.SEND, None
+
+    message = str(error.get("message", ""))
+
+    if error.get("code") != 3 and "revert" not in message.lower():
+        return Verdict.RETRY, message
+
+    reason = decode_revert(revert_data(error))
+    if reason is None:
+        reason = message.split("execution reverted", 1)[-1].strip(": ") or "reverted"
+
+    if any(keyword in reason.lower() for keyword in SIMULATION_RETRY_REASONS):
+        return Verdict.RETRY, reason
+
+    return Verdict.SKIP, reason
+
+
+def simulate_calls(
+    w3: Web3, to: str, calls: list[tuple[str, str]]
+) -> list[tuple[str, str | None]]:
+    """
+    Runs every (from, calldata) pair as eth_call against `to` in one JSON-RPC
+    batch, split by the endpoint's batch limit. Nothing is signed and no nonce
+    is read. Returns (verdict, reason) per call, in order.
+    """
+    requests = [
+        ("eth_call", [{"from": sender, "to": to, "data": data}, "latest"])
+        for sender, data in calls
+    ]
+
+    with metrics.timer("simulate"):
+        responses = w3.provider.make_batch_request(requests)
+
+    results = [classify(response) for response in responses]
+    results.extend([(Verdict.RETRY, "no response")] * (len(calls) - len(results)))
+
+    for verdict, _ in results:
+        metrics.inc("simulations", verdict=verdict)
+
+    return results
+
+
+def run_simulation(
+    w3: Web3, contract, claims: list[tuple], calls: list[tuple[str, str]] | None = None
+):
+    """
+    Simulates every (runner, contract, amount, proofs) claim before anything is
+    signed, so a claim that would revert doesn't burn retries in estimate_gas
+    or get mined as a failed transaction. By default each wallet's own
+    claim(amount, proof) is simulated. Pass calls to simulate a different
+    (from, calldata) pair per claim instead, e.g. a relayer's delegateClaim.
+
+    Returns three lists: claims to send, (claim, reason) pairs to skip and
+    (claim, reason) pairs to simulate again later.
+    """
+    if calls is None:
+        calls = [
+            (runner.address, contract.encode_abi("claim", args=[amount, proofs]))
+            for runner, _, amount, proofs in claims
+        ]
+
+    results = simulate_calls(w3, contract.address, calls)
+
+    to_send, skipped, retry_later = [], [], []
+
+    for claim, (verdict, reason) in zip(claims, results):
+        runner = claim[0]
+
+        if verdict == Verdict.SEND:
+            to_send.append(claim)
+        elif verdict == Verdict.SKIP:
+            logger.info(
+                f"{runner.account_name} | {runner.address} | Simulation - claim reverts: {reason}, skipping..."
+            )
+            skipped.append((claim, reason))
+        else:
+            logger.info(
+                f"{runner.account_name} | {runner.address} | Simulation - {reason}, retrying later"
+            )
+            retry_later.append((claim, reason))
+
+    logger.debug(
+        f"Simulation complete! To send: {len(to_send)}, skipped: {len(skipped)}, retry later: {len(retry_later)}"
+    )
+
+    return to_send, skipped, retry_later
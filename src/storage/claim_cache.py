@@ -0,0 +1,78 @@
+import json
+import sqlite3
+import threading
+from loguru import logger
+
+
+class ClaimCache:
+    """
+    On-disk cache of (amount, merkle proofs) per (airdrop id, address), so
+    reruns skip the Xterio login. Entries recorded under a different
+    merkleRoot than the current on-chain one are dropped on open.
+    """
+
+    def __init__(self, path: str, airdrop_id: str, merkle_root: str):
+        self.airdrop_id = airdrop_id
+        self.merkle_root = merkle_root.lower()
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS claims (
+                airdrop_id TEXT NOT NULL,
+                address TEXT NOT NULL,
+                amount TEXT NOT NULL,
+                proofs TEXT NOT NULL,
+                merkle_root TEXT NOT NULL,
+                PRIMARY KEY (airdrop_id, address)
+            )
+            """)
+
+        with self.conn:
+            stale = self.conn.execute(
+                "DELETE FROM claims WHERE airdrop_id = ? AND merkle_root != ?",
+                (self.airdrop_id, self.merkle_root),
+            ).rowcount
+
+        if stale:
+            logger.info(
+                f"Claim cache - dropped {stale} entries from an old merkle root"
+            )
+
+    def get(self, address: str) -> tuple[int, list[str]] | None:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT amount, proofs FROM claims WHERE airdrop_id = ? AND address = ?",
+                (self.airdrop_id, address.lower()),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return int(row[0]), json.loads(row[1])
+
+    def put(self, address: str, amount: int, proofs: list[str]):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO claims VALUES (?, ?, ?, ?, ?)",
+                (
+                    self.airdrop_id,
+                    address.lower(),
+                    str(amount),
+                    json.dumps(proofs),
+                    self.merkle_root,
+                ),
+            )
+
+    def evict(self, address: str):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM claims WHERE airdrop_id = ? AND address = ?",
+                (self.airdrop_id, address.lower()),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM claims WHERE airdrop_id = ?", (self.airdrop_id,)
+            ).fetchone()[0]
@@ -0,0 +1,108 @@
+import sqlite3
+import threading
+
+
+class ClaimIndex:
+    """
+    Local copy of the contract's XClaim/XDelegateClaim logs: address ->
+    (amount, tx hash, block), plus the last block that was fully scanned so
+    the indexer resumes where it stopped.
+    """
+
+    def __init__(self, path: str, contract_address: str):
+        self.contract_address = contract_address.lower()
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS claim_events (
+                contract TEXT NOT NULL,
+                address TEXT NOT NULL,
+                amount TEXT NOT NULL,
+                tx_hash TEXT NOT NULL,
+                block INTEGER NOT NULL,
+                delegator TEXT,
+                PRIMARY KEY (contract, address)
+            )
+            """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS index_state (
+                contract TEXT PRIMARY KEY,
+                last_block INTEGER NOT NULL
+            )
+            """)
+
+    @property
+    def last_block(self) -> int | None:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT last_block FROM index_state WHERE contract = ?",
+                (self.contract_address,),
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def add(self, events: list[dict], last_block: int):
+        """Stores a scanned range and moves the resume point in one transaction."""
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO claim_events VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        self.contract_address,
+                        event["address"].lower(),
+                        str(event["amount"]),
+                        event["tx_hash"],
+                        event["block"],
+                        event["delegator"] and event["delegator"].lower(),
+                    )
+                    for event in events
+                ],
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO index_state VALUES (?, ?)",
+                (self.contract_address, last_block),
+            )
+
+    def get(self, address: str) -> tuple[int, str, int] | None:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT amount, tx_hash, block FROM claim_events WHERE contract = ? AND address = ?",
+                (self.contract_address, address.lower()),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return int(row[0]), row[1], row[2]
+
+    def claimed(self, addresses: list[str]) -> dict[str, tuple[int, str, int]]:
+        """Claim records for every address in the list that has one."""
+        lowered = [address.lower() for address in addresses]
+        rows = []
+
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(lowered), 500):
+            chunk = lowered[start : start + 500]
+            with self._lock:
+                rows.extend(
+                    self.conn.execute(
+                        f"SELECT address, amount, tx_hash, block FROM claim_events WHERE contract = ? AND address IN ({', '.join('?' * len(chunk))})",
+                        (self.contract_address, *chunk),
+                    ).fetchall()
+                )
+
+        records = {row[0]: (int(row[1]), row[2], row[3]) for row in rows}
+
+        return {
+            address: records[address.lower()]
+            for address in addresses
+            if address.lower() in records
+        }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM claim_events WHERE contract = ?",
+                (self.contract_address,),
+            ).fetchone()[0]
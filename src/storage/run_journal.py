@@ -0,0 +1,144 @@
+import json
+import time
+import sqlite3
+import threading
+from loguru import logger
+
+
+class Stage:
+    PENDING = "pending"
+    FETCHED = "claim_data_fetched"
+    SIGNED = "signed"
+    BROADCAST = "broadcast"
+    CONFIRMED = "confirmed"
+    FAILED = "failed"
+
+
+class RunJournal:
+    """
+    Per-wallet progress of a run, committed as every stage completes so a
+    crashed or killed run can be resumed from where each wallet stopped.
+    Opening it without resume starts a new run and forgets the previous one.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS wallets (
+                address TEXT PRIMARY KEY,
+                account_name TEXT,
+                stage TEXT NOT NULL,
+                amount TEXT,
+                proofs TEXT,
+                tx_hash TEXT,
+                nonce INTEGER,
+                raw_tx TEXT,
+                error TEXT,
+                updated_at REAL NOT NULL
+            )
+            """)
+
+        if not resume:
+            with self.conn:
+                self.conn.execute("DELETE FROM wallets")
+            return
+
+        logger.info(f"Run journal - resuming: {self.counts()}")
+
+    def start(self, wallets: list[tuple[str, str]]):
+        """Adds (account_name, address) pairs not journaled yet as pending."""
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO wallets (address, account_name, stage, updated_at) VALUES (?, ?, ?, ?)",
+                [
+                    (address.lower(), str(account_name), Stage.PENDING, time.time())
+                    for account_name, address in wallets
+                ],
+            )
+
+    def record(
+        self,
+        address: str,
+        stage: str,
+        tx_hash: str | None = None,
+        error: str | None = None,
+    ):
+        with self._lock, self.conn:
+            self.conn.execute(
+                """
+                UPDATE wallets
+                SET stage = ?, tx_hash = COALESCE(?, tx_hash), error = ?, updated_at = ?
+                WHERE address = ?
+                """,
+                (stage, tx_hash, error, time.time(), address.lower()),
+            )
+
+    def record_signed(self, address: str, tx_hash: str, nonce: int, raw_tx: str):
+        """Keeps the signed claim so a resumed run can re-broadcast it instead of signing another."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                """
+                UPDATE wallets
+                SET stage = ?, tx_hash = ?, nonce = ?, raw_tx = ?, error = NULL, updated_at = ?
+                WHERE address = ?
+                """,
+                (Stage.SIGNED, tx_hash, nonce, raw_tx, time.time(), address.lower()),
+            )
+
+    def record_claim_data(self, address: str, amount: int, proofs: list[str]):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE wallets SET stage = ?, amount = ?, proofs = ?, updated_at = ? WHERE address = ?",
+                (
+                    Stage.FETCHED,
+                    str(amount),
+                    json.dumps(proofs),
+                    time.time(),
+                    address.lower(),
+                ),
+            )
+
+    def claim_data(self, address: str) -> tuple[int, list[str]] | None:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT amount, proofs FROM wallets WHERE address = ? AND amount IS NOT NULL",
+                (address.lower(),),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return int(row[0]), json.loads(row[1])
+
+    def states(
+        self, addresses: list[str], batch_size: int = 500
+    ) -> dict[str, tuple[str, str | None, str | None]]:
+        """address -> (stage, tx hash, raw tx) of the given addresses only."""
+        addresses = [address.lower() for address in addresses]
+        rows = []
+
+        with self._lock:
+            for start in range(0, len(addresses), batch_size):
+                batch = addresses[start : start + batch_size]
+                rows.extend(
+                    self.conn.execute(
+                        f"SELECT address, stage, tx_hash, raw_tx FROM wallets WHERE address IN ({','.join('?' * len(batch))})",
+                        batch,
+                    ).fetchall()
+                )
+
+        return {
+            address: (stage, tx_hash, raw_tx)
+            for address, stage, tx_hash, raw_tx in rows
+        }
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT stage, COUNT(*) FROM wallets GROUP BY stage"
+            ).fetchall()
+
+        return dict(rows)
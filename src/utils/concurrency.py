@@ -0,0 +1,13 @@
+import asyncio
+from collections import defaultdict
+
+
+class KeyedSemaphore:
+    """Lazily creates one asyncio.Semaphore per key (proxy, rpc url, ...)."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphores = defaultdict(lambda: asyncio.Semaphore(self.limit))
+
+    def __call__(self, key) -> asyncio.Semaphore:
+        return self._semaphores[key]
@@ -0,0 +1,222 @@
+import time
+import bisect
+import functools
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+from loguru import logger
+from ..common.constants import METRICS_BUCKETS, METRICS_PREFIX
+
+
+def endpoint_label(url: str | None) -> str:
+    """host[:port] of a proxy or RPC URL, credentials and paths stripped."""
+    if not url:
+        return "direct"
+
+    parsed = urlparse(url if "://" in url else f"http://{url}")
+    return f"{parsed.hostname}:{parsed.port}" if parsed.port else parsed.hostname
+
+
+class Histogram:
+    """Cumulative-bucket histogram, same layout as a Prometheus histogram."""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def merge(self, other: "Histogram"):
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.sum += other.sum
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """Linear interpolation inside the bucket, like histogram_quantile()."""
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+
+        for i, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+
+        return self.buckets[-1]
+
+
+class Metrics:
+    """
+    Process-wide latency histograms and counters keyed by name and labels
+    (proxy, rpc...). One lock and a bisect per observation, cheap enough to
+    stay on in production. Exported in the Prometheus text format.
+    """
+
+    def __init__(self, prefix: str = METRICS_PREFIX, buckets=METRICS_BUCKETS):
+        self.prefix = prefix
+        self.buckets = tuple(buckets)
+        self.histograms: dict[tuple, Histogram] = {}
+        self.counters: dict[tuple, float] = {}
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(name: str, labels: dict) -> tuple:
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def observe(self, name: str, seconds: float, **labels):
+        key = self.key(name, labels)
+
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = self.key(name, labels)
+
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timed(self, name: str, labels=None):
+        """Decorator; labels(*args, **kwargs) returns the labels of a call."""
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(name, **(labels(*args, **kwargs) if labels else {})):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    def format_labels(labels: tuple, extra: str = "") -> str:
+        parts = [f'{k}="{v}"' for k, v in labels]
+        if extra:
+            parts.append(extra)
+        return "{" + ",".join(parts) + "}" if parts else ""
+
+    def to_prometheus(self) -> str:
+        with self._lock:
+            histograms = {
+                key: (list(h.counts), h.sum, h.count)
+                for key, h in self.histograms.items()
+            }
+            counters = dict(self.counters)
+
+        lines = []
+        declared = set()
+
+        for (name, labels), (counts, total, count) in sorted(histograms.items()):
+            metric = f"{self.prefix}_{name}_seconds"
+            if metric not in declared:
+                lines.append(f"# TYPE {metric} histogram")
+                declared.add(metric)
+
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += bucket_count
+                le = f'le="{bound}"'
+                lines.append(
+                    f"{metric}_bucket{self.format_labels(labels, le)} {cumulative}"
+                )
+            lines.append(f"{metric}_sum{self.format_labels(labels)} {total}")
+            lines.append(f"{metric}_count{self.format_labels(labels)} {count}")
+
+        for (name, labels), value in sorted(counters.items()):
+            metric = f"{self.prefix}_{name}_total"
+            if metric not in declared:
+                lines.append(f"# TYPE {metric} counter")
+                declared.add(metric)
+            lines.append(f"{metric}{self.format_labels(labels)} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        with open(path, "w") as f:
+            f.write(self.to_prometheus())
+
+    def serve(self, port: int) -> ThreadingHTTPServer:
+        """/metrics endpoint on a daemon thread."""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                data = registry.to_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        logger.debug(f"Metrics served on :{port}/metrics")
+
+        return server
+
+    def summary(self) -> list[dict]:
+        """One row per stage, all labels merged."""
+        with self._lock:
+            merged: dict[str, Histogram] = {}
+            for (name, _), histogram in self.histograms.items():
+                merged.setdefault(name, Histogram(self.buckets)).merge(histogram)
+
+        return [
+            {
+                "stage": name,
+                "count": histogram.count,
+                "avg": histogram.sum / histogram.count,
+                "p50": histogram.quantile(0.5),
+                "p95": histogram.quantile(0.95),
+                "total": histogram.sum,
+            }
+            for name, histogram in sorted(merged.items())
+        ]
+
+    def log_summary(self):
+        elapsed = time.time() - self.started
+
+        logger.info(
+            f"{'stage':<24}{'count':>8}{'avg s':>10}{'p50 s':>10}{'p95 s':>10}{'total s':>12}"
+        )
+        for row in self.summary():
+            logger.info(
+                f"{row['stage']:<24}{row['count']:>8}{row['avg']:>10.3f}{row['p50']:>10.3f}{row['p95']:>10.3f}{row['total']:>12.1f}"
+            )
+
+        with self._lock:
+            counters: dict[str, float] = {}
+            for (name, _), value in self.counters.items():
+                counters[name] = counters.get(name, 0) + value
+
+        for name, value in sorted(counters.items()):
+            logger.info(f"{name:<24}{value:>8g} ({value / elapsed * 60:.1f}/min)")
+
+
+metrics = Metrics()
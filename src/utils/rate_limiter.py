@@ -0,0 +1,118 @@
+import time
+import asyncio
+import threading
+from urllib.parse import urlparse
+from loguru import logger
+from ..common.constants import (
+    DEFAULT_HOST_RATE,
+    HOST_RATE_LIMITS,
+    PROXY_RATE_LIMIT,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_INCREASE,
+    RATE_LIMIT_DECREASE,
+    RATE_LIMIT_MAX_FACTOR,
+)
+
+
+class TokenBucket:
+    """
+    Token bucket whose rate tunes itself: every successful call nudges the rate
+    up additively, every throttled call cuts it multiplicatively (AIMD).
+    """
+
+    def __init__(self, name: str, rate: float, burst: float = RATE_LIMIT_BURST):
+        self.name = name
+        self.rate = rate
+        self.min_rate = rate / 10
+        self.max_rate = rate * RATE_LIMIT_MAX_FACTOR
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """Takes a token and returns how long the caller has to wait for it."""
+        with self._lock:
+            self._refill()
+            self.tokens -= 1
+
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_success(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + RATE_LIMIT_INCREASE)
+
+    def on_throttled(self):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * RATE_LIMIT_DECREASE)
+            rate = self.rate
+
+        logger.debug(
+            f"Rate limiter | {self.name} throttled, rate lowered to {rate:.2f}/s"
+        )
+
+
+class RateLimiter:
+    """Shared token buckets per destination host and per outgoing proxy."""
+
+    def __init__(self):
+        self.buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, kind: str, key: str, rate: float) -> TokenBucket:
+        with self._lock:
+            if (kind, key) not in self.buckets:
+                self.buckets[(kind, key)] = TokenBucket(f"{kind}:{key}", rate)
+            return self.buckets[(kind, key)]
+
+    def buckets_for(self, url: str, proxy: str | None) -> list[TokenBucket]:
+        host = urlparse(url).hostname or url
+        buckets = [
+            self.bucket("host", host, HOST_RATE_LIMITS.get(host, DEFAULT_HOST_RATE))
+        ]
+
+        if proxy:
+            buckets.append(self.bucket("proxy", proxy, PROXY_RATE_LIMIT))
+
+        return buckets
+
+    def acquire(self, url: str, proxy: str | None = None):
+        for bucket in self.buckets_for(url, proxy):
+            bucket.acquire()
+
+    async def async_acquire(self, url: str, proxy: str | None = None):
+        for bucket in self.buckets_for(url, proxy):
+            await bucket.async_acquire()
+
+    def report(self, url: str, proxy: str | None, throttled: bool):
+        for bucket in self.buckets_for(url, proxy):
+            if throttled:
+                bucket.on_throttled()
+            else:
+                bucket.on_success()
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                bucket.name: round(bucket.rate, 2) for bucket in self.buckets.values()
+            }
+
+
+rate_limiter = RateLimiter()
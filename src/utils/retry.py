@@ -1,25 +1,266 @@
 import time
 import random
+import asyncio
+import inspect
 import functools
+import threading
+from enum import Enum
+from dataclasses import dataclass
+from collections import Counter
+import requests
 from loguru import logger
-from ..common.constants import MAX_RETRIES
-
-
-def retry(func):
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        for _ in range(MAX_RETRIES):
-            try:
-                res = func(*args, **kwargs)
-                return res
-            except Exception as e:
-                logger.warning(f"{func.__name__} - exception: {str(e)}")
-                if "insufficient funds" in str(e):
-                    return
-                if "already claimed" in str(e):
-                    return
-                time.sleep(random.randint(5, 10))
-        else:
-            return
-
-    return wrapper
+from ..common.constants import (
+    MAX_RETRIES,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_BUDGET_RATIO,
+    RETRY_BUDGET_MIN,
+)
+
+
+class ErrorClass(Enum):
+    RATE_LIMITED = "rate_limited"
+    SERVER = "server"
+    PROXY = "proxy"
+    TIMEOUT = "timeout"
+    NONCE_TOO_LOW = "nonce_too_low"
+    ALREADY_KNOWN = "already_known"
+    UNDERPRICED = "underpriced"
+    INSUFFICIENT_FUNDS = "insufficient_funds"
+    ALREADY_CLAIMED = "already_claimed"
+    REVERTED = "reverted"
+    CLIENT = "client"
+    UNKNOWN = "unknown"
+
+
+@dataclass(frozen=True)
+class Strategy:
+    retry: bool = True
+    base_delay: float = RETRY_BASE_DELAY
+    max_delay: float = RETRY_MAX_DELAY
+    rotate: str | None = None
+
+
+# What to do with each class of error: permanent ones fail fast, throttling
+# backs off hard, broken transport rotates the RPC or proxy first
+POLICY = {
+    ErrorClass.RATE_LIMITED: Strategy(base_delay=2, max_delay=60, rotate="rpc"),
+    ErrorClass.SERVER: Strategy(base_delay=1, max_delay=20, rotate="rpc"),
+    ErrorClass.PROXY: Strategy(base_delay=0.5, max_delay=10, rotate="proxy"),
+    ErrorClass.TIMEOUT: Strategy(base_delay=0.5, max_delay=10, rotate="rpc"),
+    ErrorClass.NONCE_TOO_LOW: Strategy(base_delay=0.2, max_delay=2),
+    ErrorClass.ALREADY_KNOWN: Strategy(retry=False),
+    ErrorClass.UNDERPRICED: Strategy(base_delay=0.5, max_delay=5),
+    ErrorClass.INSUFFICIENT_FUNDS: Strategy(retry=False),
+    ErrorClass.ALREADY_CLAIMED: Strategy(retry=False),
+    ErrorClass.REVERTED: Strategy(retry=False),
+    ErrorClass.CLIENT: Strategy(retry=False),
+    ErrorClass.UNKNOWN: Strategy(),
+}
+
+MESSAGE_CLASSES = [
+    ("already claimed", ErrorClass.ALREADY_CLAIMED),
+    ("insufficient funds", ErrorClass.INSUFFICIENT_FUNDS),
+    ("nonce too low", ErrorClass.NONCE_TOO_LOW),
+    ("already known", ErrorClass.ALREADY_KNOWN),
+    ("known transaction", ErrorClass.ALREADY_KNOWN),
+    ("underpriced", ErrorClass.UNDERPRICED),
+    ("execution reverted", ErrorClass.REVERTED),
+    ("too many requests", ErrorClass.RATE_LIMITED),
+    ("rate limit", ErrorClass.RATE_LIMITED),
+    ("limit exceeded", ErrorClass.RATE_LIMITED),
+]
+
+
+def http_status(exc: Exception) -> int | None:
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def classify(exc: Exception) -> ErrorClass:
+    if isinstance(exc, (requests.exceptions.ProxyError, ConnectionRefusedError)):
+        return ErrorClass.PROXY
+
+    if isinstance(exc, requests.exceptions.Timeout):
+        return ErrorClass.TIMEOUT
+
+    status = http_status(exc)
+    if status == 429:
+        return ErrorClass.RATE_LIMITED
+    if status is not None and status >= 500:
+        return ErrorClass.SERVER
+    if status is not None and status in (400, 401, 403, 404):
+        return ErrorClass.CLIENT
+
+    message = str(exc).lower()
+    for needle, error_class in MESSAGE_CLASSES:
+        if needle in message:
+            return error_class
+
+    if isinstance(exc, requests.exceptions.ConnectionError):
+        return ErrorClass.PROXY
+
+    if type(exc).__name__ == "ContractLogicError":
+        return ErrorClass.REVERTED
+
+    return ErrorClass.UNKNOWN
+
+
+def retry_after(exc: Exception) -> float | None:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After")
+
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def backoff(strategy: Strategy, attempt: int, exc: Exception) -> float:
+    """Full-jitter exponential backoff, never shorter than the server's Retry-After."""
+    delay = random.uniform(0, min(strategy.max_delay, strategy.base_delay * 2**attempt))
+    return max(delay, retry_after(exc) or 0)
+
+
+class RetryBudget:
+    """
+    Counters for every retried call plus a budget: each call earns
+    RETRY_BUDGET_RATIO retries, so a failing dependency can't multiply the load
+    on itself by MAX_RETRIES.
+    """
+
+    def __init__(
+        self, ratio: float = RETRY_BUDGET_RATIO, minimum: int = RETRY_BUDGET_MIN
+    ):
+        self.ratio = ratio
+        self.minimum = minimum
+        self.calls = 0
+        self.retries = 0
+        self.exhausted = 0
+        self.errors = Counter()
+        self._lock = threading.Lock()
+
+    def record_call(self):
+        with self._lock:
+            self.calls += 1
+
+    def record_error(self, error_class: ErrorClass):
+        with self._lock:
+            self.errors[error_class.value] += 1
+
+    def acquire(self) -> bool:
+        with self._lock:
+            if self.retries < self.minimum + self.calls * self.ratio:
+                self.retries += 1
+                return True
+            self.exhausted += 1
+            return False
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "retries": self.retries,
+                "budget_exhausted": self.exhausted,
+                "errors": dict(self.errors),
+            }
+
+
+retry_budget = RetryBudget()
+
+
+def rotate(target, strategy: Strategy, func_name: str):
+    if strategy.rotate is None or target is None:
+        return
+
+    rotate_fn = getattr(target, f"change_{strategy.rotate}", None) or getattr(
+        target, f"rotate_{strategy.rotate}", None
+    )
+
+    if rotate_fn is None:
+        return
+
+    try:
+        rotate_fn()
+    except Exception as e:
+        logger.warning(f"{func_name} - couldn't rotate {strategy.rotate}: {str(e)}")
+
+
+def next_step(func_name: str, exc: Exception, attempt: int, max_retries: int):
+    """Returns the delay before the next attempt, or None when the call should give up."""
+    error_class = classify(exc)
+    strategy = POLICY[error_class]
+    retry_budget.record_error(error_class)
+
+    logger.warning(f"{func_name} - {error_class.value} exception: {str(exc)}")
+
+    if not strategy.retry or attempt + 1 >= max_retries:
+        return None, strategy
+
+    if not retry_budget.acquire():
+        logger.warning(f"{func_name} - retry budget exhausted, giving up")
+        return None, strategy
+
+    return backoff(strategy, attempt, exc), strategy
+
+
+def retry(
+    func=None,
+    *,
+    max_retries: int = MAX_RETRIES,
+    raise_on_failure: bool = False,
+):
+    """
+    Retries the call according to the class of the error it raised. By default
+    returns None once it gives up; with raise_on_failure the last error is raised.
+    Works on both sync and async functions.
+    """
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                retry_budget.record_call()
+
+                for attempt in range(max_retries):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        delay, strategy = next_step(
+                            func.__name__, e, attempt, max_retries
+                        )
+                        if delay is None:
+                            if raise_on_failure:
+                                raise
+                            return
+
+                        rotate(args[0] if args else None, strategy, func.__name__)
+                        await asyncio.sleep(delay)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            retry_budget.record_call()
+
+            for attempt in range(max_retries):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    delay, strategy = next_step(func.__name__, e, attempt, max_retries)
+                    if delay is None:
+                        if raise_on_failure:
+                            raise
+                        return
+
+                    rotate(args[0] if args else None, strategy, func.__name__)
+                    time.sleep(delay)
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+
+    return decorator
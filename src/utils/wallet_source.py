@@ -0,0 +1,101 @@
+import hashlib
+import argparse
+from itertools import islice
+from eth_account import Account
+from loguru import logger
+from ..clients.registry import ClientRegistry
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """argparse type for --shard i/N, shards are numbered from 0."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/N, got {value}")
+
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"shard index must be in 0..{count - 1}")
+
+    return index, count
+
+
+def shard_of(address: str, count: int) -> int:
+    """Stable across processes and hosts, unlike hash()."""
+    digest = hashlib.sha256(address.lower().encode()).digest()
+    return int.from_bytes(digest[:8], "big") % count
+
+
+def iter_lines(path: str):
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+class WalletSource:
+    """
+    Lazily reads (account_name, private_key) pairs from a key file, one line at
+    a time. Account names are the line numbers in the whole file, so they stay
+    the same whatever the sharding. With a shard only the keys whose address
+    hashes to it are yielded.
+    """
+
+    def __init__(self, path: str, shard: tuple[int, int] | None = None):
+        self.path = path
+        self.shard = shard
+        self.yielded = 0
+
+    @property
+    def suffix(self) -> str:
+        """File name suffix for per-shard outputs."""
+        if self.shard is None:
+            return ""
+        return f".shard-{self.shard[0]}-of-{self.shard[1]}"
+
+    def in_shard(self, private_key: str) -> bool:
+        if self.shard is None:
+            return True
+
+        # Not via ClientRegistry: other shards' keys shouldn't stay cached here
+        address = Account.from_key(private_key).address
+        if shard_of(address, self.shard[1]) != self.shard[0]:
+            return False
+
+        ClientRegistry.register_addresses([private_key], [address])
+        return True
+
+    def __iter__(self):
+        self.yielded = 0
+
+        try:
+            for account_name, private_key in enumerate(iter_lines(self.path), start=1):
+                if self.in_shard(private_key):
+                    self.yielded += 1
+                    yield account_name, private_key
+        except FileNotFoundError as e:
+            logger.warning(f"Couldnt load content from {self.path}: {str(e)}")
+
+    def chunks(self, size: int):
+        wallets = iter(self)
+        while chunk := list(islice(wallets, size)):
+            yield chunk
+
+
+class SignerWalletSource(WalletSource):
+    """
+    Same wallets streamed from a SigningService: (account_name, address) pairs,
+    the private keys stay in the signer's processes. Runners built from it
+    pass the address where a private key would go and sign through the signer.
+    """
+
+    def __init__(self, signer, path: str, shard: tuple[int, int] | None = None):
+        super().__init__(path, shard)
+        self.signer = signer
+
+    def __iter__(self):
+        self.yielded = 0
+
+        for account_name, address in self.signer.iter_wallets():
+            self.yielded += 1
+            yield account_name, address